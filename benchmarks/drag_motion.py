@@ -0,0 +1,60 @@
+"""Time the per-event geometry update of a `DragRect` drag, excluding the canvas redraw."""
+
+import timeit
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+import numpy as np  # noqa: E402
+from matplotlib.backend_bases import MouseButton, MouseEvent  # noqa: E402
+
+from matplotlib_window.base import DragRect  # noqa: E402
+
+N_EVENTS = 2_000
+
+
+class _NoRedrawRect(DragRect):
+    __slots__ = ()
+
+    def _redraw(self) -> None:
+        pass
+
+
+def _motion_time(xscale: str) -> float:
+    """Return the mean time, in µs, taken by `DragRect.on_motion` per motion event."""
+    fig, ax = plt.subplots()
+    x_data = np.logspace(0, 3, 1_000)
+    ax.plot(x_data, np.random.default_rng().normal(size=x_data.size))
+    ax.set_xscale(xscale)
+    fig.canvas.draw()
+
+    dr = _NoRedrawRect(ax=ax, position=10, width=10)
+    x0, y0 = ax.transData.transform((15, 0))
+    press = MouseEvent("button_press_event", fig.canvas, x0, y0, button=MouseButton.LEFT)
+    fig.canvas.callbacks.process("button_press_event", press)
+
+    events = [
+        MouseEvent("motion_notify_event", fig.canvas, x0 + dx, y0)
+        for dx in np.linspace(-50, 50, N_EVENTS)
+    ]
+
+    def drag() -> None:
+        for event in events:
+            dr.on_motion(event)
+
+    elapsed = min(timeit.repeat(drag, number=1, repeat=5))
+    plt.close(fig)
+
+    return elapsed / N_EVENTS * 1e6
+
+
+def main() -> None:  # noqa: D103
+    print(f"{'xscale':>8}{'on_motion (µs)':>16}")
+    for xscale in ("linear", "log"):
+        print(f"{xscale:>8}{_motion_time(xscale):>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
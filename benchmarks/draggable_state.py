@@ -0,0 +1,92 @@
+"""
+Benchmark the per-instance memory & motion hot path attribute access cost of the draggables.
+
+Slotted instances are compared against a `__dict__`-backed mirror holding the same state, which
+approximates the pre-`__slots__` layout.
+"""
+
+import sys
+import timeit
+import tracemalloc
+import typing as t
+
+from matplotlib.figure import Figure
+
+from matplotlib_window.base import DragLine, DragRect, build_drag_anchor
+
+N_INSTANCES = 2_000
+N_ACCESS = 1_000_000
+
+
+class _DictState:
+    """Plain instance mirroring the state of a slotted draggable in its `__dict__`."""
+
+    def __init__(self, obj: t.Any) -> None:
+        for cls in type(obj).__mro__:
+            for name in getattr(cls, "__slots__", ()):
+                if name != "__weakref__" and hasattr(obj, name):
+                    setattr(self, name, getattr(obj, name))
+
+
+def _state_size(obj: t.Any) -> int:
+    size = sys.getsizeof(obj)
+    if hasattr(obj, "__dict__"):
+        size += sys.getsizeof(obj.__dict__)
+
+    return size
+
+
+def _alloc_size(factory: t.Callable[[], t.Any]) -> float:
+    """Return the mean number of bytes allocated per instance by the provided factory."""
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    instances = [factory() for _ in range(N_INSTANCES)]
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del instances
+    return (end - start) / N_INSTANCES
+
+
+def _hot_path_access(obj: t.Any) -> float:
+    """Return the mean time, in ns, to access the state read by `DragRect.on_motion`."""
+
+    def access() -> None:
+        _ = (
+            obj.clicked,
+            obj.parent_axes,
+            obj.drag_anchor,
+            obj.snap_targets,
+            obj.snap_to,
+            obj.myobj,
+            obj.highlight,
+            obj.parent_canvas,
+            obj.redraw_callback,
+        )
+
+    return min(timeit.repeat(access, number=N_ACCESS, repeat=5)) / N_ACCESS * 1e9
+
+
+def main() -> None:  # noqa: D103
+    ax = Figure().subplots()  # Base canvas, so redraws are a no-op
+    line = DragLine(ax=ax, position=0)
+    rect = DragRect(ax=ax, position=0, width=1)
+    rect.drag_anchor = build_drag_anchor(ax, 0, 0)  # Normally set on click
+
+    print(f"{'':<10}{'slotted (B)':>14}{'dict (B)':>12}")
+    for name, obj in (("DragLine", line), ("DragRect", rect)):
+        print(f"{name:<10}{_state_size(obj):>14}{_state_size(_DictState(obj)):>12}")
+
+    print(f"\nAllocated per state instance ({N_INSTANCES} instances)")
+    slotted = _alloc_size(lambda: object.__new__(DragRect))
+    mirrored = _alloc_size(lambda: _DictState(rect))
+    print(f"{'DragRect':<10}{slotted:>14.0f}{mirrored:>12.0f}")
+
+    print(f"\nMotion hot path attribute access (ns/iteration, {N_ACCESS} iterations)")
+    print(
+        f"{'DragRect':<10}{_hot_path_access(rect):>14.1f}{_hot_path_access(_DictState(rect)):>12.1f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Compare the full-figure redraw cost of many individual `DragLine`s against a `DragLineGroup`."""
+
+import timeit
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+import numpy as np  # noqa: E402
+
+from matplotlib_window.base import DragLine, DragLineGroup  # noqa: E402
+
+N_DRAWS = 20
+
+
+def _draw_time(n_lines: int, grouped: bool) -> float:
+    """Return the mean full-figure draw time, in ms, for the provided number of lines."""
+    fig, ax = plt.subplots()
+    ax.plot(np.arange(1_000), np.random.default_rng().normal(size=1_000))
+    positions = np.linspace(0, 1_000, n_lines)
+
+    if grouped:
+        _ = DragLineGroup(ax=ax, positions=positions)
+    else:
+        _ = [DragLine(ax=ax, position=p) for p in positions]
+
+    draw_time = min(timeit.repeat(fig.canvas.draw, number=N_DRAWS, repeat=3)) / N_DRAWS * 1e3
+    plt.close(fig)
+
+    return draw_time
+
+
+def main() -> None:  # noqa: D103
+    print(f"{'n_lines':>8}{'DragLine (ms)':>16}{'DragLineGroup (ms)':>21}")
+    for n_lines in (1, 10, 100, 500):
+        individual = _draw_time(n_lines, grouped=False)
+        grouped = _draw_time(n_lines, grouped=True)
+        print(f"{n_lines:>8}{individual:>16.1f}{grouped:>21.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Compare serial pyplot snapshot export against `export_windows` for increasing worker counts."""
+
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+import numpy as np  # noqa: E402
+
+from matplotlib_window.base import DragRect  # noqa: E402
+from matplotlib_window.export import ExportRecord, export_windows  # noqa: E402
+
+N_RECORDS = 64
+N_SAMPLES = 10_000
+
+
+def _serial_pyplot(records: list[ExportRecord], out_dir: Path) -> None:
+    """Naive export, creating a new pyplot figure for each record."""
+    for record in records:
+        x_data, y_data = record.source  # type: ignore[misc]
+        fig, ax = plt.subplots()
+        ax.plot(x_data, y_data)
+        left, right = record.bounds
+        DragRect(ax=ax, position=left, width=(right - left))
+        fig.savefig(out_dir / f"{record.name}.png")
+        plt.close(fig)
+
+
+def main() -> None:  # noqa: D103
+    x_data = np.linspace(0, 100, N_SAMPLES)
+    y_data = np.random.default_rng().normal(size=N_SAMPLES)
+    records = [ExportRecord(f"sel_{i}", (x_data, y_data), (i, i + 10)) for i in range(N_RECORDS)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        out_dir = Path(tmp)
+
+        tic = time.perf_counter()
+        _serial_pyplot(records, out_dir)
+        elapsed = time.perf_counter() - tic
+        print(f"{'serial pyplot':>16}: {N_RECORDS / elapsed:6.1f} snapshots/s")
+
+        n_cores = os.cpu_count() or 1
+        for n_workers in sorted({1, 2, n_cores}):
+            tic = time.perf_counter()
+            export_windows(records, out_dir, max_workers=n_workers)
+            elapsed = time.perf_counter() - tic
+            print(f"{f'{n_workers} worker(s)':>16}: {N_RECORDS / elapsed:6.1f} snapshots/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,25 @@
+"""Time window proposals for each strategy on a 1e8-sample data series."""
+
+import timeit
+from functools import partial
+
+import numpy as np
+
+from matplotlib_window.proposals import ProposalStrategy, propose_windows
+
+N_SAMPLES = 100_000_000
+
+
+def main() -> None:  # noqa: D103
+    x_data = np.linspace(0, 1_000, N_SAMPLES)
+    y_data = np.random.default_rng().normal(size=N_SAMPLES)
+
+    print(f"{'strategy':>12}{'time (s)':>10}")
+    for strategy in ProposalStrategy:
+        run = partial(propose_windows, x_data, y_data, window_width=5, strategy=strategy)
+        elapsed = min(timeit.repeat(run, number=1, repeat=3))
+        print(f"{strategy:>12}{elapsed:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Compare the frames & bytes sent to a WebAgg client during a drag, with & without throttling."""
+
+import time
+import typing as t
+
+import numpy as np
+from matplotlib.backend_bases import MouseButton, MouseEvent
+from matplotlib.backends.backend_webagg_core import FigureCanvasWebAggCore, FigureManagerWebAgg
+from matplotlib.figure import Figure
+
+from matplotlib_window.base import DragRect
+from matplotlib_window.remote import LowBandwidthRedraw
+
+N_EVENTS = 250
+EVENT_INTERVAL = 1 / 120  # Seconds between motion events, roughly a typical pointer polling rate
+
+
+class _CountingClient:
+    """Stand-in browser client that acknowledges each frame & services draw requests."""
+
+    def __init__(self, canvas: FigureCanvasWebAggCore) -> None:
+        self.canvas = canvas
+        self.n_frames = 0
+        self.n_bytes = 0
+
+    def send_json(self, content: dict[str, t.Any]) -> None:  # noqa: D102
+        if content["type"] == "draw":
+            self.canvas.handle_event({"type": "draw"})  # type: ignore[no-untyped-call]
+
+    def send_binary(self, blob: bytes) -> None:  # noqa: D102
+        self.n_frames += 1
+        self.n_bytes += len(blob)
+        self.canvas.handle_event({"type": "ack"})  # type: ignore[no-untyped-call]
+
+
+def _drag(low_bandwidth: bool) -> tuple[int, int, float]:
+    """Return the frames & bytes sent, and the seconds spent handling events, for a paced drag."""
+    fig = Figure()
+    canvas = FigureCanvasWebAggCore(fig)  # type: ignore[no-untyped-call]
+    manager = FigureManagerWebAgg(canvas, 1)  # type: ignore[no-untyped-call]
+    ax = fig.add_subplot()
+    x_data = np.linspace(0, 100, 10_000)
+    ax.plot(x_data, np.random.default_rng().normal(size=x_data.size))
+    dr = DragRect(ax=ax, position=10, width=10)
+
+    client = _CountingClient(canvas)
+    manager.add_web_socket(client)  # type: ignore[no-untyped-call]
+    lb = LowBandwidthRedraw(canvas) if low_bandwidth else None
+    client.n_frames = client.n_bytes = 0
+
+    x0, y0 = ax.transData.transform((15, 0))
+    press = MouseEvent("button_press_event", canvas, x0, y0, button=MouseButton.LEFT)
+    canvas.callbacks.process("button_press_event", press)
+
+    busy = 0.0
+    for dx in np.linspace(0, 300, N_EVENTS):
+        start = time.perf_counter()
+        motion = MouseEvent("motion_notify_event", canvas, x0 + dx, y0)
+        canvas.callbacks.process("motion_notify_event", motion)
+        elapsed = time.perf_counter() - start
+
+        busy += elapsed
+        time.sleep(max(0, EVENT_INTERVAL - elapsed))
+
+    if lb is not None:
+        lb.flush()  # No event loop is running to fire the trailing flush
+
+    assert dr.bounds[0] > 10
+
+    return client.n_frames, client.n_bytes, busy
+
+
+def main() -> None:  # noqa: D103
+    print(f"{'mode':>14}{'frames':>8}{'kB sent':>10}{'busy (s)':>10}")
+    for low_bandwidth in (False, True):
+        n_frames, n_bytes, busy = _drag(low_bandwidth)
+        mode = "low bandwidth" if low_bandwidth else "default"
+        print(f"{mode:>14}{n_frames:>8}{n_bytes / 1e3:>10.1f}{busy:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
 import typing as t
+import weakref
 from collections import abc
 from enum import StrEnum
 from functools import partial
@@ -6,13 +7,15 @@ from functools import partial
 import numpy as np
 from matplotlib.axes import Axes
 from matplotlib.backend_bases import Event, FigureCanvasBase, MouseEvent
+from matplotlib.collections import LineCollection
 from matplotlib.lines import Line2D
 from matplotlib.patches import Rectangle
+from matplotlib.transforms import IdentityTransform, Transform
 from numpy import typing as npt
 
 COORD_T: t.TypeAlias = tuple[float, float]
 CALLBACK_T: t.TypeAlias = abc.Callable[[Event], t.Any]
-PLOT_OBJ_T: t.TypeAlias = Line2D | Rectangle
+PLOT_OBJ_T: t.TypeAlias = Line2D | Rectangle | LineCollection
 NUMERIC_T: t.TypeAlias = float | int
 
 COMMON_OBJ_ID = "dragobj"  # Label created object(s) URL for downstream event filtering
@@ -23,6 +26,244 @@ class Orientation(StrEnum):  # noqa: D101
     HORIZONTAL = "horizontal"
 
 
+class ExtentMode(StrEnum):  # noqa: D101
+    UNION = "union"
+    INTERSECTION = "intersection"
+
+
+def _numeric_extent(values: npt.ArrayLike) -> tuple[float, float]:
+    """Return the `(min, max)` of the provided values, ignoring NaNs."""
+    arr = np.asarray(values)
+    min_val, max_val = np.nanmin(arr), np.nanmax(arr)
+
+    # Per #8, numpy's timedeltas don't support gt/lt against floats, see `limit_drag`
+    if isinstance(min_val, np.timedelta64):
+        min_val = min_val.astype(float)
+        max_val = max_val.astype(float)
+
+    return float(min_val), float(max_val)
+
+
+class _MemberCache(t.NamedTuple):
+    x_ref: t.Any
+    y_ref: t.Any
+
+
+def _is_1d_data(obj: t.Any) -> bool:
+    """Check whether the provided object is a 1D array-like of samples, rather than data series."""
+    if isinstance(obj, Line2D):
+        return False
+
+    try:
+        return bool(np.ndim(obj) == 1)
+    except ValueError:
+        # Ragged sequences, e.g. of differently sized (x_data, y_data) pairs
+        return False
+
+
+def _is_array_pair(obj: t.Any) -> bool:
+    """Check whether the provided object is a bare `(x_data, y_data)` pair of 1D arrays."""
+    return (
+        isinstance(obj, abc.Sequence)
+        and not isinstance(obj, str)
+        and len(obj) == 2
+        and all(_is_1d_data(v) for v in obj)
+    )
+
+
+class SnapExtent:
+    """
+    Combined extent of one or more data series, used to limit the motion of draggable objects.
+
+    Each member may be either a `Line2D` or an `(x_data, y_data)` pair of arrays. If `mode` is
+    `"union"`, the extent spans all of the members, otherwise if `mode` is `"intersection"` it spans
+    only the range covered by every member.
+
+    The extent of each member is calculated lazily & cached, so the underlying data is never copied
+    or concatenated. A `Line2D` member's cached extent is refreshed only once its data has been
+    replaced (e.g. using `set_data`); array members, and in-place modifications of a line's data
+    arrays, are assumed to be static. Each axis is combined independently & only once it is
+    accessed, so an intersection is only required to be non-empty along the axis being used.
+
+    The members' x samples may also be searched using `nearest_sample`, which lazily builds a sorted
+    index of each member's finite x data on first use.
+    """
+
+    __slots__ = ("members", "mode", "_cache", "_member_extents", "_extents", "_sorted_x")
+
+    def __init__(
+        self,
+        *members: Line2D | tuple[npt.ArrayLike, npt.ArrayLike],
+        mode: ExtentMode = ExtentMode.UNION,
+    ) -> None:
+        if not members:
+            raise ValueError("At least one data series must be provided")
+        for member in members:
+            if not (isinstance(member, Line2D) or _is_array_pair(member)):
+                raise ValueError(
+                    "Each data series must be a Line2D or an (x_data, y_data) pair of arrays. "
+                    f"Received: {type(member).__name__}"
+                )
+
+        self.members = members
+        self.mode = ExtentMode(mode)
+        self._cache: list[_MemberCache | None] = [None] * len(members)
+        # Extents of each member & their combined extent, indexed by axis (0 for x, 1 for y)
+        self._member_extents: tuple[list[tuple[float, float] | None], ...] = (
+            [None] * len(members),
+            [None] * len(members),
+        )
+        self._extents: list[np.ndarray | None] = [None, None]
+        self._sorted_x: list[np.ndarray | None] = [None] * len(members)
+
+    @staticmethod
+    def _member_data(member: Line2D | tuple[npt.ArrayLike, npt.ArrayLike]) -> tuple[t.Any, t.Any]:
+        if isinstance(member, Line2D):
+            return member.get_xdata(orig=True), member.get_ydata(orig=True)
+
+        return member
+
+    def _refresh(self) -> None:
+        """Invalidate the cached extents of any members whose data has changed since last access."""
+        for i, member in enumerate(self.members):
+            x_data, y_data = self._member_data(member)
+            cached = self._cache[i]
+            if cached is not None and cached.x_ref is x_data and cached.y_ref is y_data:
+                continue
+
+            if len(x_data) == 0 or len(y_data) == 0:
+                raise ValueError("Cannot provide an empty lineseries to snapto")
+
+            self._cache[i] = _MemberCache(x_data, y_data)
+            for member_extents in self._member_extents:
+                member_extents[i] = None
+            self._sorted_x[i] = None
+            self._extents = [None, None]
+
+    def _axis_extent(self, axis: int) -> np.ndarray:
+        """Return the combined extent of the members' data along the axis, 0 for x & 1 for y."""
+        self._refresh()
+
+        combined = self._extents[axis]
+        if combined is None:
+            member_extents = self._member_extents[axis]
+            for i, member in enumerate(self.members):
+                if member_extents[i] is None:
+                    member_extents[i] = _numeric_extent(self._member_data(member)[axis])
+
+            combined = self._combine([e for e in member_extents if e is not None], axis)
+            self._extents[axis] = combined
+
+        return combined
+
+    def _combine(self, extents: list[tuple[float, float]], axis: int) -> np.ndarray:
+        mins, maxs = zip(*extents, strict=True)
+        if self.mode == ExtentMode.UNION:
+            return np.array((min(mins), max(maxs)))
+
+        min_val, max_val = max(mins), min(maxs)
+        if min_val > max_val:
+            raise ValueError(
+                f"Intersection of the provided data series' {'xy'[axis]} extents is empty"
+            )
+
+        return np.array((min_val, max_val))
+
+    def check_members(self) -> None:
+        """Check that every member contains data, raising a `ValueError` if any are empty."""
+        self._refresh()
+
+    @property
+    def x_extent(self) -> np.ndarray:
+        """Return the combined `(min, max)` extent of the members' x data."""
+        return self._axis_extent(0)
+
+    @property
+    def y_extent(self) -> np.ndarray:
+        """Return the combined `(min, max)` extent of the members' y data."""
+        return self._axis_extent(1)
+
+    def nearest_sample(self, query: NUMERIC_T) -> float:
+        """Return the x sample, across all members, nearest to the query location."""
+        self._refresh()
+
+        nearest = np.nan
+        for i, member in enumerate(self.members):
+            if self._sorted_x[i] is None:
+                x_data, _ = self._member_data(member)
+                x = np.asarray(x_data, dtype=float)
+                self._sorted_x[i] = np.sort(x[np.isfinite(x)])
+
+            sorted_x = self._sorted_x[i]
+            if sorted_x is None or sorted_x.size == 0:
+                continue
+
+            idx = int(np.searchsorted(sorted_x, query))
+            for candidate in sorted_x[max(idx - 1, 0) : idx + 1]:
+                if np.isnan(nearest) or abs(candidate - query) < abs(nearest - query):
+                    nearest = float(candidate)
+
+        return nearest
+
+
+SNAP_MEMBER_T: t.TypeAlias = Line2D | tuple[npt.ArrayLike, npt.ArrayLike]
+SNAP_TO_T: t.TypeAlias = Line2D | SnapExtent | SNAP_MEMBER_T | abc.Sequence[SNAP_MEMBER_T]
+
+
+def as_snap_extent(snap_to: SNAP_TO_T | None) -> SnapExtent | None:
+    """
+    Normalize the provided `snap_to` specification to a `SnapExtent`.
+
+    `snap_to` may be a `SnapExtent`, which is returned unchanged, a single `Line2D` or
+    `(x_data, y_data)` pair of 1D arrays, or a sequence of `Line2D` and/or `(x_data, y_data)`
+    members, which are combined using their union extent.
+
+    NOTE: A 2-element sequence whose elements are both 1D arrays is always interpreted as a single
+    `(x_data, y_data)` pair; to combine two such series, provide each as an `(x_data, y_data)` pair.
+    """
+    if snap_to is None or isinstance(snap_to, SnapExtent):
+        return snap_to
+    elif isinstance(snap_to, Line2D) or _is_array_pair(snap_to):
+        return SnapExtent(snap_to)  # type: ignore[arg-type]
+    else:
+        return SnapExtent(*snap_to)
+
+
+class RedrawStrategy(t.Protocol):
+    """Deferred redraw handling for a canvas, see `set_redraw_strategy`."""
+
+    def request(self) -> None:  # noqa: D102
+        ...
+
+
+_redraw_strategies: "weakref.WeakKeyDictionary[FigureCanvasBase, RedrawStrategy]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def set_redraw_strategy(canvas: FigureCanvasBase, strategy: RedrawStrategy | None) -> None:
+    """
+    Register the redraw strategy used by draggable objects on the provided canvas.
+
+    Once registered, redraws requested by draggable objects on the canvas are passed to the
+    strategy's `request` method rather than immediately redrawing the full canvas. If `strategy` is
+    `None`, any registered strategy is removed & full redraws are restored.
+    """
+    if strategy is None:
+        _redraw_strategies.pop(canvas, None)
+    else:
+        _redraw_strategies[canvas] = strategy
+
+
+def request_redraw(canvas: FigureCanvasBase) -> None:
+    """Redraw the provided canvas, deferring to its registered redraw strategy, if any."""
+    strategy = _redraw_strategies.get(canvas)
+    if strategy is None:
+        canvas.draw()
+    else:
+        strategy.request()
+
+
 class _DraggableObject:
     """
     Common draggable plot object base class.
@@ -38,15 +279,36 @@ class _DraggableObject:
     Common callbacks registered by this base class are:
         * `on_click`
         * `on_release`
+
+    Draggable objects may be created in large numbers, so instance state is kept in `__slots__`
+    rather than a per-instance `__dict__`; child classes must declare slots for any additional
+    state. The canvas retains only weak references to its callbacks, so `__weakref__` is required.
     """
 
+    __slots__ = (
+        "__weakref__",
+        "clicked",
+        "click_x",
+        "click_y",
+        "snap_to",
+        "snap_targets",
+        "redraw_callback",
+        "myobj",
+        "parent_axes",
+        "parent_canvas",
+        "click_press",
+        "mouse_motion",
+        "click_release",
+    )
+
     clicked: bool
     click_x: float
     click_y: float
 
     # Defined by child classes prior to registration
     on_motion: CALLBACK_T
-    snap_to: Line2D | None
+    snap_to: SnapExtent | None
+    snap_targets: "SnapTargets | None"
     redraw_callback: abc.Callable[[], None] | None
 
     # Defined on registration
@@ -168,25 +430,22 @@ class _DraggableObject:
 
         self._redraw()
 
-    def validate_snap_to(self, snap_to: Line2D | None) -> Line2D | None:
+    def validate_snap_to(self, snap_to: SNAP_TO_T | None) -> SnapExtent | None:
         """
-        Validate that the `snap_to` object, if provided, actually contains x data.
+        Validate that the `snap_to` object, if provided, actually contains data.
 
-        If `snap_to` is `None`, or is a plot object that contains x data, it is returned unchanged.
-        Otherwise an exception is raised.
+        If `snap_to` is `None`, it is returned unchanged. Otherwise it is normalized to a
+        `SnapExtent`, see `as_snap_extent`, and an exception is raised if any of its members are
+        empty.
         """
-        if snap_to is None:
+        extent = as_snap_extent(snap_to)
+        if extent is None:
             return None
 
-        try:
-            xydata = snap_to.get_xydata()
-        except AttributeError as e:
-            raise ValueError("Cannot provide an empty lineseries to snapto") from e
-
-        if len(xydata) == 0:  # type: ignore[arg-type]
-            raise ValueError("Cannot provide an empty lineseries to snapto")
+        # Only check the members here, subclasses combine the extent of the axis they're limited on
+        extent.check_members()
 
-        return snap_to
+        return extent
 
     def _disable_click(self) -> None:
         """Disconnect the button press event for the current instance."""
@@ -197,7 +456,7 @@ class _DraggableObject:
         if self.redraw_callback is not None:
             self.redraw_callback()
 
-        self.parent_canvas.draw()
+        request_redraw(self.parent_canvas)
 
 
 def limit_drag(plotted_data: npt.ArrayLike, query: float) -> float:
@@ -225,12 +484,145 @@ def limit_drag(plotted_data: npt.ArrayLike, query: float) -> float:
         return query
 
 
+class SnapResult(t.NamedTuple):  # noqa: D101
+    position: float
+    distance: float
+
+
+class SnapTargets:
+    """
+    Sorted index of candidate positions for draggable edges to snap to.
+
+    Candidate positions are sorted & deduplicated once on instantiation so the nearest candidate to
+    a query location can be found using a binary search rather than a scan of every candidate.
+    Non-finite positions are discarded.
+
+    `tolerance` specifies the maximum distance, in pixels, between the query location and the
+    nearest candidate for the snap to take effect.
+
+    Helper constructors are provided for common features of interest, see `from_peaks` and
+    `from_crossings`.
+    """
+
+    def __init__(self, positions: npt.ArrayLike, tolerance: NUMERIC_T = 10) -> None:
+        if tolerance < 0:
+            raise ValueError(f"Snap tolerance must be non-negative. Received: {tolerance}")
+
+        candidates = np.asarray(positions, dtype=float).ravel()
+        candidates = np.unique(candidates[np.isfinite(candidates)])  # np.unique also sorts
+        if candidates.size == 0:
+            raise ValueError("Cannot snap to an empty set of positions")
+
+        self.positions = candidates
+        self.tolerance = tolerance
+
+    @classmethod
+    def from_peaks(
+        cls, x_data: npt.ArrayLike, y_data: npt.ArrayLike, tolerance: NUMERIC_T = 10
+    ) -> t.Self:
+        """
+        Build snap targets from the x-locations of the local maxima of the provided data series.
+
+        A sample is considered a peak if it is greater than its left neighbor & greater than or
+        equal to its right neighbor, so flat-topped peaks resolve to their leftmost sample.
+        """
+        x = np.asarray(x_data)
+        y = np.asarray(y_data, dtype=float)
+
+        is_peak = (y[1:-1] > y[:-2]) & (y[1:-1] >= y[2:])
+        return cls(x[1:-1][is_peak], tolerance=tolerance)
+
+    @classmethod
+    def from_crossings(
+        cls,
+        x_data: npt.ArrayLike,
+        y_data: npt.ArrayLike,
+        threshold: NUMERIC_T = 0,
+        tolerance: NUMERIC_T = 10,
+    ) -> t.Self:
+        """
+        Build snap targets from the x-locations where the data series crosses `threshold`.
+
+        Crossing locations are linearly interpolated between the samples on either side of the
+        threshold. The default `threshold` of `0` provides the data series' zero crossings.
+        """
+        x = np.asarray(x_data, dtype=float)
+        y = np.asarray(y_data, dtype=float)
+
+        above = y >= threshold
+        idx = np.flatnonzero(above[1:] != above[:-1])
+        x0, x1 = x[idx], x[idx + 1]
+        y0, y1 = y[idx], y[idx + 1]
+
+        return cls(x0 + (threshold - y0) * (x1 - x0) / (y1 - y0), tolerance=tolerance)
+
+    def nearest(self, query: NUMERIC_T) -> float:
+        """Return the candidate position closest to the query location."""
+        idx = int(np.searchsorted(self.positions, query))
+        if idx == 0:
+            return float(self.positions[0])
+        elif idx == self.positions.size:
+            return float(self.positions[-1])
+
+        left, right = self.positions[idx - 1], self.positions[idx]
+        if (query - left) <= (right - query):
+            return float(left)
+        else:
+            return float(right)
+
+    def find_snap(
+        self, ax: Axes, query: NUMERIC_T, orientation: Orientation = Orientation.VERTICAL
+    ) -> SnapResult | None:
+        """
+        Locate the candidate nearest to the query location, if it is within tolerance.
+
+        `orientation` specifies the orientation of the snapping edge, where a vertical edge moves
+        along the x-axis & a horizontal edge moves along the y-axis. The pixel distance between the
+        query location and the candidate is calculated along the relevant axis so the tolerance
+        remains consistent regardless of the current axis limits or scale.
+
+        If no candidate is within tolerance, `None` is returned.
+        """
+        target = self.nearest(query)
+
+        # The axis transforms blend data & axes coordinates, so only the relevant axis is needed
+        if orientation == Orientation.VERTICAL:
+            px = ax.get_xaxis_transform().transform([(query, 0), (target, 0)])[:, 0]
+        else:
+            px = ax.get_yaxis_transform().transform([(0, query), (0, target)])[:, 1]
+
+        distance = abs(float(px[1] - px[0]))
+        if distance > self.tolerance:
+            return None
+
+        return SnapResult(position=target, distance=distance)
+
+    def snap(
+        self, ax: Axes, query: NUMERIC_T, orientation: Orientation = Orientation.VERTICAL
+    ) -> NUMERIC_T:
+        """
+        Snap the query location to its nearest candidate, if it is within tolerance.
+
+        If no candidate is within tolerance, the query location is returned unchanged.
+        """
+        snapped = self.find_snap(ax, query, orientation)
+        if snapped is None:
+            return query
+
+        return snapped.position
+
+
 class DragLine(_DraggableObject):
     """
     Draggable `Line2D` instance.
 
-    `snap_to` may be optionally specified as an instance of another `Line2D` object to prevent
-    dragging of the line beyond the extent of the plotted data.
+    `snap_to` may be optionally specified as an instance of another `Line2D` object, an
+    `(x_data, y_data)` pair of arrays, a sequence of these data series, or a `SnapExtent`, to
+    prevent dragging of the line beyond the extent of the plotted data. See `as_snap_extent` for
+    more information.
+
+    `snap_targets` may be optionally specified as a `SnapTargets` instance to snap the line to the
+    nearest candidate position when dragged within tolerance of it.
 
     `redraw_callback` may be optionally specified as a callable which gets called whenever the
     location of the line has been changed. This callable is expected to take no arguments and has no
@@ -240,17 +632,21 @@ class DragLine(_DraggableObject):
     allowing the user to specify custom line formatting in a form expected by `Line2D`.
     """
 
+    __slots__ = ("orientation", "axes_limit_change")
+
     def __init__(
         self,
         ax: Axes,
         position: NUMERIC_T,
         orientation: Orientation = Orientation.VERTICAL,
-        snap_to: Line2D | None = None,
+        snap_to: SNAP_TO_T | None = None,
+        snap_targets: SnapTargets | None = None,
         redraw_callback: abc.Callable[[], None] | None = None,
         color: str = "limegreen",
         **kwargs: t.Any,
     ) -> None:
         self.orientation = orientation
+        self.snap_targets = snap_targets
         self.redraw_callback = redraw_callback
 
         line_pos = (position, position)  # matplotlib expectes a coordinate pair
@@ -274,8 +670,9 @@ class DragLine(_DraggableObject):
         On motion callback.
 
         Update the position of the line to follow the position of the mouse at the time the event is
-        fired. If `self.snap_to` is not `None`, motion of the line will be limited to the extent of
-        the data plotted by the specified `Line2D`.
+        fired. If `self.snap_targets` is not `None`, the line will snap to the nearest candidate
+        position within tolerance. If `self.snap_to` is not `None`, motion of the line will be
+        limited to the extent of the data specified by `self.snap_to`.
         """
         self.myobj: Line2D
         if not isinstance(event, MouseEvent):
@@ -289,22 +686,27 @@ class DragLine(_DraggableObject):
             return
 
         if self.orientation == Orientation.HORIZONTAL:
+            new_pos = self._snap(event.ydata)
             if self.snap_to:
-                new_pos = limit_drag(self.snap_to.get_ydata(), event.ydata)
-            else:
-                new_pos = event.ydata
+                new_pos = limit_drag(self.snap_to.y_extent, new_pos)
 
             self.myobj.set_ydata((new_pos, new_pos))
         elif self.orientation == Orientation.VERTICAL:
+            new_pos = self._snap(event.xdata)
             if self.snap_to:
-                new_pos = limit_drag(self.snap_to.get_xdata(), event.xdata)
-            else:
-                new_pos = event.xdata
+                new_pos = limit_drag(self.snap_to.x_extent, new_pos)
 
             self.myobj.set_xdata((new_pos, new_pos))
 
         self._redraw()
 
+    def _snap(self, query: float) -> float:
+        """Snap the query location to the nearest snap target, if one is within tolerance."""
+        if self.snap_targets is None:
+            return query
+
+        return self.snap_targets.snap(self.parent_axes, query, self.orientation)
+
     def limit_change(self, ax: Axes) -> None:
         """
         Axes limit change callback.
@@ -318,29 +720,44 @@ class DragLine(_DraggableObject):
 
         self._redraw()
 
-    def validate_snap_to(self, snap_to: Line2D | None) -> Line2D | None:
+    def set_location(self, position: NUMERIC_T) -> None:
+        """Move the line to the provided location along its relevant axis."""
+        self._move_line(position)
+        self._redraw()
+
+    def _move_line(self, position: NUMERIC_T) -> None:
+        """Move the line to the provided location without redrawing the canvas."""
+        if self.orientation == Orientation.HORIZONTAL:
+            self.myobj.set_ydata((position, position))
+        else:
+            self.myobj.set_xdata((position, position))
+
+    def validate_snap_to(self, snap_to: SNAP_TO_T | None) -> SnapExtent | None:
         """
-        Validate that the `snap_to` object, if provided, actually contains x data.
+        Validate that the `snap_to` object, if provided, actually contains data.
 
-        If `snap_to` is `None`, or is a plot object that contains x data, it is returned unchanged.
-        Otherwise an exception is raised.
+        If `snap_to` is `None`, it is returned unchanged. Otherwise it is normalized to a
+        `SnapExtent`, and an exception is raised if it is empty or does not contain the draggable
+        object.
 
         NOTE: This should be called after the draggable object is registered so the object is
         instantiated & references are set.
         """
-        if snap_to is None:
+        # Superclass implementation handles normalization & checking that the members contain data
+        extent = super().validate_snap_to(snap_to)
+        if extent is None:
             return None
 
-        # Superclass implementation handles checking that the lineseries contains data
-        super().validate_snap_to(snap_to)
-
         # Check that the draggable line is within the bounds of the snap_to lineseries
-        plotted_data = snap_to.get_xdata()
-        min_val, max_val = plotted_data.min(), plotted_data.max()  # type: ignore[union-attr]
+        if self.orientation == Orientation.HORIZONTAL:
+            min_val, max_val = extent.y_extent
+        else:
+            min_val, max_val = extent.x_extent
+
         if not (min_val <= self.location <= max_val):
             raise ValueError("DragLine must be within the bounds of the provided snapto line")
 
-        return snap_to
+        return extent
 
     @property
     def location(self) -> NUMERIC_T:
@@ -354,6 +771,180 @@ class DragLine(_DraggableObject):
         return pos[0]  # Should be a (location, location) tuple
 
 
+class DragLineGroup(_DraggableObject):
+    """
+    Group of draggable lines, rendered as a single `LineCollection` instance.
+
+    Line locations are stored in a single array, rather than as individual `DragLine` instances, so
+    the cost of drawing the group and of dispatching mouse events to it does not grow with the
+    number of lines. Clicks are resolved to the nearest line, in pixel space, using a vectorized
+    search & dragging a line updates only that line's vertices.
+
+    `snap_to` may be optionally specified as an instance of another `Line2D` object, an
+    `(x_data, y_data)` pair of arrays, a sequence of these data series, or a `SnapExtent`, to
+    prevent dragging of the lines beyond the extent of the plotted data. See `as_snap_extent` for
+    more information.
+
+    `snap_targets` may be optionally specified as a `SnapTargets` instance to snap the dragged line
+    to the nearest candidate position when dragged within tolerance of it.
+
+    `redraw_callback` may be optionally specified as a callable which gets called whenever the
+    location of a line has been changed. This callable is expected to take no arguments and has no
+    return.
+
+    All kwargs not explicitly named by `__init__` are passed through to the `LineCollection`
+    constructor, allowing the user to specify custom line formatting in a form expected by
+    `LineCollection`.
+    """
+
+    __slots__ = ("orientation", "positions", "active", "axes_limit_change")
+
+    myobj: LineCollection
+
+    def __init__(
+        self,
+        ax: Axes,
+        positions: npt.ArrayLike,
+        orientation: Orientation = Orientation.VERTICAL,
+        snap_to: SNAP_TO_T | None = None,
+        snap_targets: SnapTargets | None = None,
+        redraw_callback: abc.Callable[[], None] | None = None,
+        color: str = "limegreen",
+        **kwargs: t.Any,
+    ) -> None:
+        if orientation not in (Orientation.HORIZONTAL, Orientation.VERTICAL):
+            raise ValueError(f"Unsupported orientation provided: '{orientation}'")
+
+        self.positions = np.array(positions, dtype=float).ravel()
+        if self.positions.size == 0:
+            raise ValueError("Cannot create an empty group of lines")
+
+        self.orientation = orientation
+        self.snap_targets = snap_targets
+        self.redraw_callback = redraw_callback
+        self.active = -1
+
+        obj = LineCollection(list(self._build_segments(ax)), colors=color, **kwargs)
+        self.register_plot_object(obj, ax)
+        if orientation == Orientation.HORIZONTAL:
+            self.axes_limit_change = ax.callbacks.connect("xlim_changed", self.limit_change)
+        else:
+            self.axes_limit_change = ax.callbacks.connect("ylim_changed", self.limit_change)
+
+        self.snap_to = self.validate_snap_to(snap_to)
+
+    def _build_segments(self, ax: Axes) -> np.ndarray:
+        """Build the `(n_lines, 2, 2)` segment array spanning the relevant axis of each line."""
+        segments = np.empty((self.positions.size, 2, 2))
+        if self.orientation == Orientation.HORIZONTAL:
+            segments[:, :, 0] = ax.get_xlim()
+            segments[:, :, 1] = self.positions[:, np.newaxis]
+        else:
+            segments[:, :, 0] = self.positions[:, np.newaxis]
+            segments[:, :, 1] = ax.get_ylim()
+
+        return segments
+
+    def on_click(self, event: Event) -> t.Any:
+        """
+        Mouse click callback.
+
+        In addition to the common click handling, determine which line is closest to the click
+        location, in pixel space.
+        """
+        super().on_click(event)
+        if not self.clicked or not isinstance(event, MouseEvent):
+            return
+
+        if self.orientation == Orientation.HORIZONTAL:
+            coords = np.column_stack((np.zeros_like(self.positions), self.positions))
+            px = self.parent_axes.get_yaxis_transform().transform(coords)[:, 1]
+            self.active = int(np.argmin(np.abs(px - event.y)))
+        else:
+            coords = np.column_stack((self.positions, np.zeros_like(self.positions)))
+            px = self.parent_axes.get_xaxis_transform().transform(coords)[:, 0]
+            self.active = int(np.argmin(np.abs(px - event.x)))
+
+    def on_motion(self, event: Event) -> t.Any:
+        """
+        On motion callback.
+
+        Update the position of the active line to follow the position of the mouse at the time the
+        event is fired. If `self.snap_targets` is not `None`, the line will snap to the nearest
+        candidate position within tolerance. If `self.snap_to` is not `None`, motion of the line
+        will be limited to the extent of the data specified by `self.snap_to`.
+        """
+        if not isinstance(event, MouseEvent):
+            # Type narrowing, matplotlib dispatches a MouseEvent here so shouldn't ever trip this
+            return
+        if not self.clicked:
+            return
+        if event.inaxes != self.parent_axes:
+            return
+        if (event.xdata is None) or (event.ydata is None):
+            return
+
+        if self.orientation == Orientation.HORIZONTAL:
+            query, axis = event.ydata, 1
+        else:
+            query, axis = event.xdata, 0
+
+        if self.snap_targets is not None:
+            query = self.snap_targets.snap(self.parent_axes, query, self.orientation)
+        if self.snap_to:
+            extent = self.snap_to.y_extent if axis else self.snap_to.x_extent
+            query = limit_drag(extent, query)
+
+        # Update the grabbed line's vertices in place rather than rebuilding every segment
+        self.positions[self.active] = query
+        vertices = np.asarray(self.myobj.get_paths()[self.active].vertices)
+        vertices[:, axis] = query
+        self.myobj.stale = True
+
+        self._redraw()
+
+    def limit_change(self, ax: Axes) -> None:
+        """
+        Axes limit change callback.
+
+        Resize the lines to span the entirety of their relevant axis if the limit is changed.
+        """
+        self.myobj.set_segments(list(self._build_segments(ax)))
+        self._redraw()
+
+    def validate_snap_to(self, snap_to: SNAP_TO_T | None) -> SnapExtent | None:
+        """
+        Validate that the `snap_to` object, if provided, actually contains data.
+
+        If `snap_to` is `None`, it is returned unchanged. Otherwise it is normalized to a
+        `SnapExtent`, and an exception is raised if it is empty or does not contain the draggable
+        object.
+
+        NOTE: This should be called after the draggable object is registered so the object is
+        instantiated & references are set.
+        """
+        # Superclass implementation handles normalization & checking that the members contain data
+        extent = super().validate_snap_to(snap_to)
+        if extent is None:
+            return None
+
+        # Check that all of the lines are within the bounds of the snap_to lineseries
+        if self.orientation == Orientation.HORIZONTAL:
+            min_val, max_val = extent.y_extent
+        else:
+            min_val, max_val = extent.x_extent
+
+        if np.any((self.positions < min_val) | (self.positions > max_val)):
+            raise ValueError("DragLineGroup must be within the bounds of the provided snapto line")
+
+        return extent
+
+    @property
+    def locations(self) -> npt.NDArray[np.float64]:
+        """Return a copy of the locations of the lines along their relevant axis."""
+        return self.positions.copy()
+
+
 class RectParams(t.NamedTuple):  # noqa: D101
     xy: COORD_T
     height: float
@@ -374,14 +965,137 @@ def transform_rect_params(ax: Axes, position: NUMERIC_T) -> RectParams:
     return RectParams(xy=xy, height=height)
 
 
+class DragAnchor(t.NamedTuple):
+    """
+    Pixel-space reference for an in-progress drag along the x-axis.
+
+    The dragged point, initially located at the data x-coordinate `origin`, is located at
+    `origin_scaled + px_scale * (px - click_px)` in the axis' scaled coordinates, which are then
+    mapped to data coordinates by `inverse`, the inverse of the axis' scale transform. `inverse` is
+    `None` for linear axes, where scaled & data coordinates are identical.
+    """
+
+    click_px: float
+    origin: float
+    origin_scaled: float
+    px_scale: float
+    inverse: Transform | None
+
+
+def build_drag_anchor(ax: Axes, click_px: float, origin: NUMERIC_T) -> DragAnchor:
+    """
+    Snapshot the x-axis transform of the provided axes, anchoring a drag at the click location.
+
+    `origin` specifies the data x-coordinate of the point being dragged, e.g. the left edge of a
+    rectangle, which can then be moved by the cursor's pixel delta from `click_px`.
+
+    NOTE: The returned anchor is only valid until the axes limits or the figure size change.
+    """
+    # Scaled -> pixel coordinates is affine for all axes scales, so only the x scaling is needed
+    scaled_to_px = (ax.transLimits + ax.transAxes).get_affine().get_matrix()
+    px_scale = 1 / scaled_to_px[0, 0]
+
+    x_transform = ax.xaxis.get_transform()
+    if isinstance(x_transform, IdentityTransform):
+        return DragAnchor(click_px, float(origin), float(origin), px_scale, None)
+
+    origin_scaled = float(x_transform.transform([origin])[0])
+    return DragAnchor(click_px, float(origin), origin_scaled, px_scale, x_transform.inverted())
+
+
+def anchored_position(anchor: DragAnchor, event_px: float) -> float:
+    """Calculate the data x-coordinate of the anchored point after a drag to `event_px`."""
+    scaled = anchor.origin_scaled + anchor.px_scale * (event_px - anchor.click_px)
+    if anchor.inverse is None:
+        return scaled
+
+    return float(anchor.inverse.transform([scaled])[0])
+
+
+class WindowHighlight:
+    """
+    Highlight the segment of a plotted data series that lies within a window's bounds.
+
+    A second `Line2D` artist is added to the axes to draw only the in-window segment of `source`.
+    The source data is sorted along the x-axis once on instantiation, if necessary, so the in-window
+    segment can be located using a binary search & drawn from a slice of the data rather than
+    re-masking the full data series every time the window is moved. Only the highlight artist's data
+    is updated, so it may participate in blitting without re-rendering the base trace.
+
+    All kwargs not explicitly named by `__init__` are passed through to the `Line2D` constructor,
+    allowing the user to specify custom line formatting in a form expected by `Line2D`.
+    """
+
+    def __init__(
+        self,
+        ax: Axes,
+        source: Line2D,
+        color: str = "darkorange",
+        **kwargs: t.Any,
+    ) -> None:
+        # Use the unit-converted data so bounds are directly comparable to the window's location
+        xydata = np.asarray(source.get_xydata())
+        if len(xydata) == 0:
+            raise ValueError("Cannot highlight an empty lineseries")
+
+        x_data, y_data = xydata[:, 0], xydata[:, 1]
+        if np.any(x_data[1:] < x_data[:-1]):
+            order = np.argsort(x_data, kind="stable")
+            x_data, y_data = x_data[order], y_data[order]
+
+        self._x_data = x_data
+        self._y_data = y_data
+        self._span = (0, 0)
+
+        kwargs.setdefault("linewidth", 1.5 * source.get_linewidth())
+        kwargs.setdefault("zorder", source.get_zorder() + 0.1)
+        self.artist = Line2D(xdata=[], ydata=[], color=color, **kwargs)
+        ax.add_artist(self.artist)
+
+    def update(self, bounds: tuple[NUMERIC_T, NUMERIC_T]) -> bool:
+        """
+        Update the highlighted segment to span the provided window bounds.
+
+        Returns `True` if the highlighted segment has changed, otherwise the highlight artist is
+        left untouched & `False` is returned.
+        """
+        left, right = bounds
+        span = (
+            int(np.searchsorted(self._x_data, left, side="left")),
+            int(np.searchsorted(self._x_data, right, side="right")),
+        )
+        if span == self._span:
+            return False
+
+        self._span = span
+        start, stop = span
+        self.artist.set_data(self._x_data[start:stop], self._y_data[start:stop])
+
+        return True
+
+    @property
+    def span(self) -> tuple[int, int]:
+        """Return the `(start, stop)` slice indices of the highlighted segment of the data."""
+        return self._span
+
+
 class DragRect(_DraggableObject):
     """
     Draggable `Rectangle` instance.
 
     `position` specifies the x-coordinate of the left edge of the rectangle.
 
-    `snap_to` may be optionally specified as an instance of a `Line2D` object to prevent dragging of
-    the rectangle beyond the extent of the plotted data.
+    `snap_to` may be optionally specified as an instance of a `Line2D` object, an
+    `(x_data, y_data)` pair of arrays, a sequence of these data series, or a `SnapExtent`, to
+    prevent dragging of the rectangle beyond the extent of the plotted data. See `as_snap_extent`
+    for more information.
+
+    `snap_targets` may be optionally specified as a `SnapTargets` instance to snap the closest edge
+    of the rectangle to the nearest candidate position when dragged within tolerance of it.
+
+    `highlight` may be optionally specified as an instance of a `Line2D` object whose in-window
+    segment is drawn in a highlight style, as specified by `highlight_kwargs`. See `WindowHighlight`
+    for more information.
 
     `redraw_callback` may be optionally specified as a callable which gets called whenever the
     location of the line has been changed. This callable is expected to take no arguments and has no
@@ -390,15 +1104,30 @@ class DragRect(_DraggableObject):
     All kwargs not explicitly named by `__init__` are passed through to the `Rectangle` constructor,
     allowing the user to specify custom line formatting in a form expected by `Rectangle`.
 
+    Drags are tracked in pixel space: the axes' x-axis transform is cached when the rectangle is
+    clicked, so each motion event only needs the pixel delta of the cursor from the initial click.
+    The cached transform is invalidated if the axes limits or figure size change.
+
     NOTE: Motion is constrained to the x-axis only.
     """
 
+    __slots__ = (
+        "highlight",
+        "drag_anchor",
+        "axes_limit_change",
+        "axes_xlim_change",
+        "canvas_resize",
+    )
+
     def __init__(
         self,
         ax: Axes,
         position: NUMERIC_T,
         width: NUMERIC_T,
-        snap_to: Line2D | None = None,
+        snap_to: SNAP_TO_T | None = None,
+        snap_targets: SnapTargets | None = None,
+        highlight: Line2D | None = None,
+        highlight_kwargs: dict[str, t.Any] | None = None,
         redraw_callback: abc.Callable[[], None] | None = None,
         edgecolor: str | None = "limegreen",
         facecolor: str = "limegreen",
@@ -408,6 +1137,7 @@ class DragRect(_DraggableObject):
         if width <= 0:
             raise ValueError(f"Width value must be greater than 0. Received: {width}")
 
+        self.snap_targets = snap_targets
         self.redraw_callback = None
 
         # Rectangle patches are located from their bottom left corner; because we want to span the
@@ -424,19 +1154,39 @@ class DragRect(_DraggableObject):
             **kwargs,
         )
 
-        self.oldxy = rect_params.xy  # Used for drag deltas so the object doesn't jump to cursor
+        # Drags are anchored on click so the object doesn't jump to the cursor
+        self.drag_anchor: DragAnchor | None = None
         self.register_plot_object(obj, ax)
         self.axes_limit_change = ax.callbacks.connect("ylim_changed", self.limit_change)
+        self.axes_xlim_change = ax.callbacks.connect("xlim_changed", self.reset_drag_anchor)
+        self.canvas_resize = self.parent_canvas.mpl_connect("resize_event", self.reset_drag_anchor)
 
         self.snap_to = self.validate_snap_to(snap_to)
 
+        self.highlight: WindowHighlight | None = None
+        if highlight is not None:
+            self.highlight = WindowHighlight(ax, highlight, **(highlight_kwargs or {}))
+            self.highlight.update(self.bounds)
+
+    def on_click(self, event: Event) -> t.Any:
+        """
+        Mouse click callback.
+
+        In addition to the common click handling, anchor the drag at the clicked pixel location.
+        """
+        super().on_click(event)
+        if self.clicked and isinstance(event, MouseEvent):
+            self.drag_anchor = build_drag_anchor(self.parent_axes, event.x, self.myobj.get_x())
+
     def on_motion(self, event: Event) -> t.Any:
         """
         On motion callback.
 
         Update the position of the rectangle to follow the position of the mouse at the time the
-        event is fired. If `self.snap_to` is not `None`, motion of the rectangle will be limited to
-        the extent of the data plotted by the specified `Line2D`.
+        event is fired. If `self.snap_targets` is not `None`, the closest edge of the rectangle will
+        snap to the nearest candidate position within tolerance. If `self.snap_to` is not `None`,
+        motion of the rectangle will be limited to the extent of the data specified by
+        `self.snap_to`.
         """
         self.myobj: Rectangle
         if not isinstance(event, MouseEvent):
@@ -446,81 +1196,120 @@ class DragRect(_DraggableObject):
             return
         if event.inaxes != self.parent_axes:
             return
-        if (event.xdata is None) or (event.ydata is None):
-            return
 
-        # Calculate the new xy position based on the movement of the cursor relative to the location
-        # of the bottom left corner when the object was clicked on. Because we can click anywhere on
-        # the patch to begin motion, the patch will jump to the mouse if just using the location of
-        # the MouseEvent.
-        old_x, _ = self.oldxy
-        dx = event.xdata - self.click_x
+        if self.drag_anchor is None:
+            # The cached transform was invalidated mid-drag, so re-anchor at the current location
+            self.drag_anchor = build_drag_anchor(self.parent_axes, event.x, self.myobj.get_x())
+
+        # Move the left edge by the cursor's pixel delta from the initial click, rather than to the
+        # location of the MouseEvent, since we can click anywhere on the patch to begin motion
+        dragged_x = anchored_position(self.drag_anchor, event.x)
+        new_x = self._snap(dragged_x)
         if self.snap_to:
-            if dx < 0:
+            width = self.myobj.get_width()
+            # Use the direction in data space, pixel & data deltas are opposed on an inverted axis
+            if dragged_x < self.drag_anchor.origin:
                 # Moving left, check left edge
-                query = old_x + dx
-                new_x = limit_drag(self.snap_to.get_xdata(), query)
+                new_x = limit_drag(self.snap_to.x_extent, new_x)
             else:
                 # Moving right, check right edge
-                width = self.myobj.get_width()
-                query = old_x + width + dx
-                new_x = limit_drag(self.snap_to.get_xdata(), query) - width
-        else:
-            new_x = old_x + dx
+                new_x = limit_drag(self.snap_to.x_extent, new_x + width) - width
 
-        rect_params = transform_rect_params(self.parent_axes, new_x)
-        self.myobj.xy = rect_params.xy
+        # The vertical span is maintained by `self.limit_change`, so only x needs to be updated
+        self.myobj.set_x(new_x)
+        if self.highlight is not None:
+            self.highlight.update(self.bounds)
 
         self._redraw()
 
+    def _snap(self, left: float) -> float:
+        """
+        Snap the rectangle's closest edge to its nearest snap target, if one is within tolerance.
+
+        The left edge location of the (potentially) snapped rectangle is returned.
+        """
+        if self.snap_targets is None:
+            return left
+
+        width = self.myobj.get_width()
+        l_snap = self.snap_targets.find_snap(self.parent_axes, left)
+        r_snap = self.snap_targets.find_snap(self.parent_axes, left + width)
+
+        if r_snap is not None and (l_snap is None or r_snap.distance < l_snap.distance):
+            return r_snap.position - width
+        elif l_snap is not None:
+            return l_snap.position
+        else:
+            return left
+
     def on_release(self, event: Event) -> t.Any:
         """
         Mouse button release callback.
 
-        When the mouse button is released, cache the new corner location & disconnect the callbacks
+        When the mouse button is released, discard the drag anchor & disconnect the callbacks
         connected by `self.on_click`.
         """
         if not isinstance(event, MouseEvent):
             # Type narrowing, matplotlib dispatches a MouseEvent here so shouldn't ever trip this
             return
 
-        self.oldxy = self.myobj.get_xy()
+        self.drag_anchor = None
         self.disconnect()
 
+    def reset_drag_anchor(self, *args: t.Any) -> None:
+        """
+        Axes limit & canvas resize callback.
+
+        Invalidate the cached drag transform; an in-progress drag is re-anchored on the next motion
+        event.
+        """
+        self.drag_anchor = None
+
+    def set_position(self, position: NUMERIC_T) -> None:
+        """Move the left edge of the rectangle to the provided x-coordinate."""
+        rect_params = transform_rect_params(self.parent_axes, position)
+        self.myobj.xy = rect_params.xy
+        if self.highlight is not None:
+            self.highlight.update(self.bounds)
+
+        self._redraw()
+
     def limit_change(self, ax: Axes) -> None:
         """
         Axes limit change callback.
 
         Resize the rectangle to span the entirety of the y-axis if the axis limit is changed.
         """
-        rect_params = transform_rect_params(ax, 0)  # Doesn't matter what the x is, only need height
+        rect_params = transform_rect_params(ax, 0)  # Doesn't matter what the x is, only need y
+        _, y = rect_params.xy
+        self.myobj.set_y(y)
         self.myobj.set_height(rect_params.height)
+        self.reset_drag_anchor()
         self._redraw()
 
-    def validate_snap_to(self, snap_to: Line2D | None) -> Line2D | None:
+    def validate_snap_to(self, snap_to: SNAP_TO_T | None) -> SnapExtent | None:
         """
-        Validate that the `snap_to` object, if provided, actually contains x data.
+        Validate that the `snap_to` object, if provided, actually contains data.
 
-        If `snap_to` is `None`, or is a plot object that contains x data, it is returned unchanged.
-        Otherwise an exception is raised.
+        If `snap_to` is `None`, it is returned unchanged. Otherwise it is normalized to a
+        `SnapExtent`, and an exception is raised if it is empty or does not contain the draggable
+        object.
 
         NOTE: This should be called after the draggable object is registered so the object is
         instantiated & references are set.
         """
-        if snap_to is None:
+        # Superclass implementation handles normalization & checking that the members contain data
+        extent = super().validate_snap_to(snap_to)
+        if extent is None:
             return None
 
-        # Superclass implementation handles checking that the lineseries contains data
-        super().validate_snap_to(snap_to)
-
         # Check that the draggable rectangle is within the bounds of the snap_to lineseries
         l_pos, r_pos = self.bounds
-        plotted_data = snap_to.get_xdata()
-        min_val, max_val = plotted_data.min(), plotted_data.max()  # type: ignore[union-attr]
+        min_val, max_val = extent.x_extent
         if not (min_val <= l_pos <= max_val) or not (min_val <= r_pos <= max_val):
             raise ValueError("DragRect must be within the bounds of the provided snapto line")
 
-        return snap_to
+        return extent
 
     @property
     def bounds(self) -> tuple[NUMERIC_T, NUMERIC_T]:
@@ -535,8 +1324,17 @@ class FlexibleRect:
 
     `position` specifies the x-coordinate of the left edge of the rectangle.
 
-    `snap_to` may be optionally specified as an instance of a `Line2D` object to prevent dragging of
-    the rectangle beyond the extent of the plotted data.
+    `snap_to` may be optionally specified as an instance of a `Line2D` object, an
+    `(x_data, y_data)` pair of arrays, a sequence of these data series, or a `SnapExtent`, to
+    prevent dragging of the rectangle beyond the extent of the plotted data. See `as_snap_extent`
+    for more information.
+
+    `snap_targets` may be optionally specified as a `SnapTargets` instance to snap each edge of the
+    rectangle to the nearest candidate position when dragged within tolerance of it.
+
+    `highlight` may be optionally specified as an instance of a `Line2D` object whose in-window
+    segment is drawn in a highlight style, as specified by `highlight_kwargs`. See `WindowHighlight`
+    for more information.
 
     `redraw_callback` may be optionally specified as a callable which gets called whenever the
     location of the line has been changed. This callable is expected to take no arguments and has no
@@ -545,12 +1343,25 @@ class FlexibleRect:
     NOTE: Motion is constrained to the x-axis only.
     """
 
+    __slots__ = (
+        "__weakref__",
+        "parent_axes",
+        "parent_canvas",
+        "redraw_callback",
+        "highlight",
+        "face",
+        "edges",
+    )
+
     def __init__(
         self,
         ax: Axes,
         position: NUMERIC_T,
         width: NUMERIC_T,
-        snap_to: Line2D | None = None,
+        snap_to: SNAP_TO_T | None = None,
+        snap_targets: SnapTargets | None = None,
+        highlight: Line2D | None = None,
+        highlight_kwargs: dict[str, t.Any] | None = None,
         redraw_callback: abc.Callable[[], None] | None = None,
         allow_face_drag: bool = False,
         edgecolor: str = "limegreen",
@@ -567,6 +1378,7 @@ class FlexibleRect:
             raise ValueError("I don't know how we got here, but there's no figure.")
 
         self.redraw_callback = redraw_callback
+        self.highlight: WindowHighlight | None = None
 
         # snap_to validation handled by DragRect & DragLine
         # Create edges after face so they're topmost & take click priority
@@ -578,7 +1390,8 @@ class FlexibleRect:
             DragLine,
             ax=ax,
             color=edgecolor,
-            snap_to=snap_to,
+            snap_to=as_snap_extent(snap_to),  # Normalize once so the edges share a cached extent
+            snap_targets=snap_targets,
             redraw_callback=self._respan_face,
         )
         self.edges = [line_p(position=position), line_p(position=(position + width))]
@@ -588,18 +1401,31 @@ class FlexibleRect:
         else:
             raise NotImplementedError
 
+        if highlight is not None:
+            self.highlight = WindowHighlight(ax, highlight, **(highlight_kwargs or {}))
+            self.highlight.update(self.bounds)
+
     def _respan_face(self) -> None:
         """Update face dimensions to span the entirety of the y-axes between the two edges."""
         left = min(edge.location for edge in self.edges)
         right = max(edge.location for edge in self.edges)
 
-        rect_params = transform_rect_params(self.parent_axes, left)
-        width = right - left
-
-        self.face.myobj.set_xy(rect_params.xy)
-        self.face.myobj.set_width(width)
-
-        self.parent_canvas.draw()  # Call directly to avoid infinitely spamming the callback
+        # The face's vertical span is maintained by its own axes limit callback
+        self.face.myobj.set_x(left)
+        self.face.myobj.set_width(right - left)
+        if self.highlight is not None:
+            self.highlight.update((left, right))
+
+        # Call directly to avoid infinitely spamming the callback
+        request_redraw(self.parent_canvas)
+
+    def set_position(self, position: NUMERIC_T) -> None:
+        """Move the left edge of the rectangle to the provided x-coordinate, keeping its width."""
+        left, right = self.bounds
+        # Move both edges before redrawing so the canvas is only redrawn once
+        self.edges[0]._move_line(position)
+        self.edges[1]._move_line(position + (right - left))
+        self._respan_face()
 
     @property
     def bounds(self) -> tuple[NUMERIC_T, NUMERIC_T]:
@@ -0,0 +1,142 @@
+import typing as t
+from collections import abc
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from numpy import typing as npt
+
+from matplotlib_window.base import DragRect, FlexibleRect, NUMERIC_T
+
+DATA_SOURCE_T: t.TypeAlias = Path | tuple[npt.ArrayLike, npt.ArrayLike]
+
+DEFAULT_FIGSIZE = (6.4, 4.8)
+DEFAULT_DPI = 100
+
+
+class ExportRecord(t.NamedTuple):
+    """
+    Window selection to be rendered.
+
+    `source` is either an `(x_data, y_data)` pair or the path to a `.npy` file containing a
+    `(2, n)` array of x & y data, which is memory-mapped by the rendering worker rather than being
+    copied to it. The rendered snapshot is saved as `<name>.<fmt>`.
+    """
+
+    name: str
+    source: DATA_SOURCE_T
+    bounds: tuple[NUMERIC_T, NUMERIC_T]
+
+
+class _RenderConfig(t.NamedTuple):
+    out_dir: Path
+    fmt: str
+    flexible: bool
+    plot_kwargs: dict[str, t.Any]
+    window_kwargs: dict[str, t.Any]
+
+
+# Each worker process renders onto its own figure, reused across records
+_worker_figure: Figure | None = None
+
+
+def _init_worker(figsize: tuple[float, float], dpi: float) -> None:
+    global _worker_figure
+    _worker_figure = Figure(figsize=figsize, dpi=dpi)
+    FigureCanvasAgg(_worker_figure)  # Attaches itself to the figure
+
+
+def _load_source(source: DATA_SOURCE_T) -> tuple[npt.ArrayLike, npt.ArrayLike]:
+    if isinstance(source, Path):
+        data = np.load(source, mmap_mode="r")
+        if data.ndim != 2 or data.shape[0] != 2:
+            raise ValueError(f"Data source must contain a (2, n) array. Received: {data.shape}")
+
+        return data[0], data[1]
+
+    return source
+
+
+def _render(record: ExportRecord, config: _RenderConfig) -> Path:
+    """Render the provided record onto the worker's figure & save it to disk."""
+    if _worker_figure is None:
+        raise RuntimeError("Rendering worker has not been initialized")
+
+    _worker_figure.clear()
+    ax = _worker_figure.add_subplot()
+    ax.set_title(record.name)
+
+    x_data, y_data = _load_source(record.source)
+    ax.plot(x_data, y_data, **config.plot_kwargs)
+
+    left, right = record.bounds
+    if config.flexible:
+        FlexibleRect(ax=ax, position=left, width=(right - left), **config.window_kwargs)
+    else:
+        DragRect(ax=ax, position=left, width=(right - left), **config.window_kwargs)
+
+    out_path = config.out_dir / f"{record.name}.{config.fmt}"
+    _worker_figure.savefig(out_path, format=config.fmt)
+
+    return out_path
+
+
+def _render_batch(records: list[ExportRecord], config: _RenderConfig) -> list[Path]:
+    return [_render(record, config) for record in records]
+
+
+def export_windows(
+    records: abc.Iterable[ExportRecord],
+    out_dir: Path,
+    fmt: str = "png",
+    flexible: bool = False,
+    max_workers: int | None = None,
+    batch_size: int = 16,
+    figsize: tuple[float, float] = DEFAULT_FIGSIZE,
+    dpi: float = DEFAULT_DPI,
+    plot_kwargs: dict[str, t.Any] | None = None,
+    window_kwargs: dict[str, t.Any] | None = None,
+) -> list[Path]:
+    """
+    Render a snapshot of each window selection to disk using a pool of headless worker processes.
+
+    Each snapshot contains the plotted data along with a `DragRect`, or a `FlexibleRect` if
+    `flexible` is `True`, at the selection's bounds, so the window keeps the same styling as during
+    labeling. Rendering uses the Agg backend directly, regardless of the active pyplot backend.
+
+    Each worker process creates a single figure that is cleared & reused for every record it
+    renders, and records are dispatched to the workers in batches of `batch_size` to amortize
+    inter-process communication. If `max_workers` is `None`, one worker is used per CPU core.
+
+    `plot_kwargs` and `window_kwargs` may be optionally specified to control the appearance of the
+    plotted data & the window, and are passed straight through to the plotting call & the window's
+    constructor, respectively.
+
+    Paths to the saved snapshots are returned in the same order as the provided records.
+    """
+    if batch_size <= 0:
+        raise ValueError(f"Batch size must be greater than 0. Received: {batch_size}")
+
+    records = list(records)
+    names = [record.name for record in records]
+    if len(set(names)) != len(names):
+        raise ValueError("Record names must be unique to avoid overwriting exported snapshots")
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    config = _RenderConfig(
+        out_dir=out_dir,
+        fmt=fmt,
+        flexible=flexible,
+        plot_kwargs=(plot_kwargs or {}),
+        window_kwargs=(window_kwargs or {}),
+    )
+
+    batches = [records[i : i + batch_size] for i in range(0, len(records), batch_size)]
+    with ProcessPoolExecutor(
+        max_workers=max_workers, initializer=_init_worker, initargs=(figsize, dpi)
+    ) as pool:
+        rendered = pool.map(_render_batch, batches, [config] * len(batches))
+
+        return [path for batch in rendered for path in batch]
@@ -0,0 +1,202 @@
+import typing as t
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import numpy as np
+from matplotlib.axes import Axes
+from matplotlib.lines import Line2D
+from numpy import typing as npt
+
+LEVEL_FACTOR = 8  # Bucket size ratio between successive decimation levels
+
+
+class _DecimationLevel(t.NamedTuple):
+    x: np.ndarray
+    y: np.ndarray
+    bucket_size: int
+
+
+class _FullResolution(t.NamedTuple):
+    levels: list[_DecimationLevel]
+
+
+def decimate_minmax(
+    x_data: np.ndarray, y_data: np.ndarray, bucket_size: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Decimate the provided data series to the min & max y-values of each bucket of samples.
+
+    The data is split into consecutive buckets of `bucket_size` samples, with the last bucket
+    containing any remaining samples. Each bucket is reduced to its minimum & maximum samples, kept
+    in their original order, so the decimated series preserves the visual envelope of the data when
+    rendered at a resolution of roughly one bucket per pixel. Buckets containing NaN values reduce
+    to a NaN sample, which is rendered as a gap in the line.
+    """
+    n_full = (y_data.size // bucket_size) * bucket_size
+    buckets = y_data[:n_full].reshape(-1, bucket_size)
+    i_min = buckets.argmin(axis=1) if buckets.size else np.empty(0, dtype=np.intp)
+    i_max = buckets.argmax(axis=1) if buckets.size else np.empty(0, dtype=np.intp)
+
+    starts = np.arange(0, n_full, bucket_size)
+    idx = np.column_stack((starts + np.minimum(i_min, i_max), starts + np.maximum(i_min, i_max)))
+    idx = idx.ravel()
+
+    if n_full < y_data.size:
+        tail = y_data[n_full:]
+        tail_idx = np.sort([n_full + tail.argmin(), n_full + tail.argmax()])
+        idx = np.concatenate((idx, tail_idx))
+
+    return x_data[idx], y_data[idx]
+
+
+def _build_full_resolution(
+    x_data: np.ndarray, y_data: np.ndarray, min_points: int
+) -> _FullResolution:
+    """Build the x-sorted decimation levels of the provided data series."""
+    if np.any(x_data[1:] < x_data[:-1]):
+        order = np.argsort(x_data, kind="stable")
+        x_data, y_data = x_data[order], y_data[order]
+
+    levels = [_DecimationLevel(x_data, y_data, 1)]
+    bucket_size = LEVEL_FACTOR
+    while (2 * x_data.size / bucket_size) >= min_points:
+        # The extrema of a group of buckets are the extrema of their min/max samples, so each
+        # level can be decimated from the previous one rather than from the raw data
+        prev = levels[-1]
+        step = LEVEL_FACTOR if prev.bucket_size == 1 else 2 * LEVEL_FACTOR
+        levels.append(_DecimationLevel(*decimate_minmax(prev.x, prev.y, step), bucket_size))
+        bucket_size *= LEVEL_FACTOR
+
+    return _FullResolution(levels=levels)
+
+
+class ProgressiveTrace:
+    """
+    Line plot of a large data series that is painted coarsely first & refined in the background.
+
+    A strided preview of roughly `preview_points` samples, which always includes the first & last
+    samples, is plotted immediately. Meanwhile, a background thread sorts the data along x, if
+    necessary, & builds a pyramid of min/max decimation levels. Once ready, these are swapped in on
+    the main thread & the plotted line is updated to the coarsest decimation level that still
+    provides at least one bucket per pixel of the current view, down to the raw data when zoomed in.
+
+    `snap_line` is a hidden `Line2D` spanning the exact data extents, intended for use as a
+    draggable object's `snap_to`. The extents are calculated on instantiation, so snapping is exact
+    even before the full resolution data has been swapped in.
+
+    If the canvas supports timers, the swap is triggered automatically by polling every
+    `poll_interval` milliseconds; otherwise it can be triggered manually using `swap_in`.
+
+    All kwargs not explicitly named by `__init__` are passed through to the plotting call.
+    """
+
+    def __init__(
+        self,
+        ax: Axes,
+        x_data: npt.ArrayLike,
+        y_data: npt.ArrayLike,
+        preview_points: int = 10_000,
+        poll_interval: int = 50,
+        **kwargs: t.Any,
+    ) -> None:
+        x = np.asarray(x_data, dtype=float)
+        y = np.asarray(y_data, dtype=float)
+        if x.shape != y.shape:
+            raise ValueError(f"x & y data must be the same length. Received: {x.size}, {y.size}")
+        if x.size == 0:
+            raise ValueError("Cannot plot an empty data series")
+
+        self.parent_axes = ax
+        if ax.figure is not None:
+            self.parent_canvas = ax.figure.canvas
+        else:
+            raise ValueError("I don't know how we got here, but there's no figure.")
+
+        stride = max(1, x.size // preview_points)
+        preview_idx = np.append(np.arange(0, x.size - 1, stride), x.size - 1)
+        preview_x, preview_y = x[preview_idx], y[preview_idx]
+
+        (self.line,) = ax.plot(preview_x, preview_y, **kwargs)
+
+        # A single O(n) pass, so the exact extents are calculated up front rather than in the
+        # background; the strided preview may miss extrema, e.g. for data not sorted along x
+        x_extent = np.array((np.nanmin(x), np.nanmax(x)))
+        y_extent = np.array((np.nanmin(y), np.nanmax(y)))
+        self.snap_line = Line2D(xdata=x_extent, ydata=y_extent)
+
+        # Include the exact extents in the data limits so the view doesn't jump on swap in;
+        # autoscaling is a no-op if the user has already set the axes limits
+        ax.update_datalim(np.column_stack((x_extent, y_extent)))
+        ax.autoscale_view()
+
+        self._full: _FullResolution | None = None
+        # NumPy releases the GIL for the bulk of the work, so the UI remains responsive
+        pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ProgressiveTrace")
+        self._future: Future[_FullResolution] = pool.submit(
+            _build_full_resolution, x, y, preview_points
+        )
+        pool.shutdown(wait=False)  # Lets the submitted work finish without blocking
+
+        self._timer = self.parent_canvas.new_timer(interval=poll_interval)
+        self._timer.add_callback(self._poll)
+        self._timer.start()
+
+    @property
+    def ready(self) -> bool:
+        """Check whether the full resolution data has been prepared."""
+        return self._future.done()
+
+    @property
+    def refined(self) -> bool:
+        """Check whether the full resolution data has been swapped in."""
+        return self._full is not None
+
+    def wait(self, timeout: float | None = None) -> None:
+        """Block until the full resolution data has been prepared."""
+        self._future.result(timeout=timeout)
+
+    def _poll(self) -> None:
+        if self.swap_in():
+            self._timer.stop()
+
+    def swap_in(self) -> bool:
+        """
+        Swap in the full resolution data, if it has been prepared.
+
+        Returns `True` if the full resolution data is in use, otherwise `False` is returned.
+
+        NOTE: This must be called from the main thread.
+        """
+        if self._full is not None:
+            return True
+        if not self.ready:
+            return False
+
+        self._full = self._future.result()
+
+        ax = self.parent_axes
+        ax.callbacks.connect("xlim_changed", self._update_view)
+        self._update_view(ax)
+
+        return True
+
+    def _update_view(self, ax: Axes) -> None:
+        """Display the coarsest decimation level with at least one bucket per pixel of the view."""
+        if self._full is None:
+            return
+
+        left, right = ax.get_xlim()
+        n_pixels = max(1, int(ax.bbox.width))
+
+        raw = self._full.levels[0].x
+        n_visible = np.searchsorted(raw, right, side="right") - np.searchsorted(raw, left)
+        level = self._full.levels[0]
+        for candidate in self._full.levels[1:]:
+            if (n_visible / candidate.bucket_size) < n_pixels:
+                break
+            level = candidate
+
+        # Include a sample beyond each edge of the view so the line extends to the axes edges
+        start = max(0, int(np.searchsorted(level.x, left)) - 1)
+        stop = int(np.searchsorted(level.x, right, side="right")) + 1
+        self.line.set_data(level.x[start:stop], level.y[start:stop])
+        self.parent_canvas.draw_idle()
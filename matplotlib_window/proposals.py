@@ -0,0 +1,260 @@
+import typing as t
+from enum import StrEnum
+
+import numpy as np
+from matplotlib.backend_bases import Event, KeyEvent
+from numpy import typing as npt
+
+from matplotlib_window.base import DragRect, FlexibleRect, NUMERIC_T
+
+CHUNK_SIZE = 1 << 20  # Approximate number of samples reduced at a time, bounds temporary memory
+
+
+class ProposalStrategy(StrEnum):  # noqa: D101
+    ENERGY = "energy"
+    VARIANCE = "variance"
+    EXCEEDANCE = "exceedance"
+
+
+class WindowProposal(t.NamedTuple):  # noqa: D101
+    position: float
+    score: float
+
+
+class _BlockStats(t.NamedTuple):
+    n_samples: np.ndarray
+    total: np.ndarray
+    sum_sq: np.ndarray
+    n_exceed: np.ndarray
+    n_invalid: np.ndarray
+
+
+def _block_stats(
+    y_data: np.ndarray, block_size: int, shift: float, threshold: float
+) -> _BlockStats:
+    """
+    Reduce consecutive blocks of `block_size` samples to their moments & exceedance counts.
+
+    Each block is reduced to its number of samples, sum, sum of squares, number of samples
+    exceeding `threshold`, and number of non-finite samples. Non-finite samples are excluded from
+    the sums so they can't propagate into the cumulative sums of neighbouring blocks. Sums are
+    calculated on the data offset by `shift`, which keeps the
+    variance calculation numerically stable for data with a large offset. The data is processed in
+    chunks of whole blocks so temporary memory is bounded regardless of the length of the data.
+    """
+    n_blocks = -(-y_data.size // block_size)
+    n_samples = np.full(n_blocks, block_size, dtype=np.int64)
+    n_samples[-1] = y_data.size - (n_blocks - 1) * block_size
+    total = np.empty(n_blocks)
+    sum_sq = np.empty(n_blocks)
+    n_exceed = np.empty(n_blocks, dtype=np.int64)
+    n_invalid = np.zeros(n_blocks, dtype=np.int64)
+
+    blocks_per_chunk = max(1, CHUNK_SIZE // block_size)
+    for first in range(0, n_blocks, blocks_per_chunk):
+        last = min(first + blocks_per_chunk, n_blocks)
+        chunk = y_data[first * block_size : last * block_size]
+        n_full = chunk.size // block_size
+
+        shifted = chunk - shift
+        invalid = ~np.isfinite(shifted)
+        has_invalid = bool(invalid.any())
+        if has_invalid:
+            shifted[invalid] = 0
+
+        full = shifted[: n_full * block_size].reshape(n_full, block_size)
+        stop = first + n_full
+        total[first:stop] = full.sum(axis=1)
+        sum_sq[first:stop] = np.einsum("ij,ij->i", full, full)
+        n_exceed[first:stop] = np.count_nonzero(
+            chunk[: n_full * block_size].reshape(n_full, block_size) > threshold, axis=1
+        )
+        if has_invalid:
+            n_invalid[first:stop] = np.count_nonzero(
+                invalid[: n_full * block_size].reshape(n_full, block_size), axis=1
+            )
+
+        if n_full * block_size < chunk.size:
+            # Only the final block can be partial
+            tail = shifted[n_full * block_size :]
+            total[-1] = tail.sum()
+            sum_sq[-1] = tail @ tail
+            n_exceed[-1] = np.count_nonzero(chunk[n_full * block_size :] > threshold)
+            if has_invalid:
+                n_invalid[-1] = np.count_nonzero(invalid[n_full * block_size :])
+
+    return _BlockStats(
+        n_samples=n_samples, total=total, sum_sq=sum_sq, n_exceed=n_exceed, n_invalid=n_invalid
+    )
+
+
+def _window_scores(
+    stats: _BlockStats,
+    start: np.ndarray,
+    stop: np.ndarray,
+    strategy: ProposalStrategy,
+    shift: float,
+) -> np.ndarray:
+    """
+    Score the windows spanning blocks `[start, stop)` using cumulative sums of block stats.
+
+    Windows containing any non-finite samples are scored as `-inf`.
+    """
+
+    def window_sum(block_values: np.ndarray) -> np.ndarray:
+        cumulative = np.concatenate(((0,), np.cumsum(block_values)))
+        return cumulative[stop] - cumulative[start]  # type: ignore[no-any-return]
+
+    if strategy == ProposalStrategy.EXCEEDANCE:
+        scores = window_sum(stats.n_exceed).astype(float)
+    else:
+        n = window_sum(stats.n_samples)
+        total = window_sum(stats.total)
+        sum_sq = window_sum(stats.sum_sq)
+        if strategy == ProposalStrategy.ENERGY:
+            # Undo the shift: sum((y - s)^2) + 2s * sum(y - s) + n * s^2 = sum(y^2)
+            scores = sum_sq + 2 * shift * total + n * shift**2
+        elif strategy == ProposalStrategy.VARIANCE:
+            # Variance is shift-invariant
+            scores = (sum_sq - total**2 / n) / n
+        else:
+            raise ValueError(f"Unsupported proposal strategy provided: '{strategy}'")
+
+    scores[window_sum(stats.n_invalid) > 0] = -np.inf
+    return scores
+
+
+def propose_windows(
+    x_data: npt.ArrayLike,
+    y_data: npt.ArrayLike,
+    window_width: NUMERIC_T,
+    strategy: ProposalStrategy = ProposalStrategy.ENERGY,
+    n_proposals: int = 5,
+    threshold: NUMERIC_T = 0,
+    resolution: int = 65_536,
+) -> list[WindowProposal]:
+    """
+    Rank the best non-overlapping windows of the provided width according to the given strategy.
+
+    Supported strategies are:
+        * `"energy"` - Sum of squared y-values within the window
+        * `"variance"` - Variance of the y-values within the window
+        * `"exceedance"` - Number of samples within the window whose y-value exceeds `threshold`
+
+    Candidate windows are scored in O(n) using cumulative sums of per-block moments rather than
+    sliding over the raw data. The data is reduced to blocks of consecutive samples, with at most
+    `resolution` blocks, & candidate windows start at block boundaries and span whole blocks; if the
+    data contains no more than `resolution` samples, every sample is a candidate window start & the
+    scores are exact. Candidates must lie entirely within the extent of the data, and windows
+    containing non-finite y-values are not proposed.
+
+    Up to `n_proposals` proposals are returned in descending order of score, each located at least a
+    full window width away from all higher ranked proposals.
+
+    NOTE: Data is assumed to be sorted along the x-axis; unsorted data is sorted prior to scoring.
+    """
+    x = np.asarray(x_data, dtype=float)
+    y = np.asarray(y_data, dtype=float)
+    strategy = ProposalStrategy(strategy)
+    if x.shape != y.shape or x.ndim != 1:
+        raise ValueError(f"x & y data must be the same length. Received: {x.size}, {y.size}")
+    if window_width <= 0:
+        raise ValueError(f"Width value must be greater than 0. Received: {window_width}")
+    if n_proposals <= 0:
+        raise ValueError(f"Number of proposals must be greater than 0. Received: {n_proposals}")
+    if resolution <= 0:
+        raise ValueError(f"Resolution must be greater than 0. Received: {resolution}")
+    if x.size == 0:
+        raise ValueError("Cannot propose windows for an empty data series")
+
+    if np.any(x[1:] < x[:-1]):
+        order = np.argsort(x, kind="stable")
+        x, y = x[order], y[order]
+
+    block_size = -(-x.size // resolution)
+    block_starts = np.arange(0, x.size, block_size)
+    block_left = x[block_starts]
+    block_right = x[np.append(block_starts[1:], x.size) - 1]
+
+    # Only consider windows that end within the extent of the data
+    n_candidates = int(np.searchsorted(block_left, x[-1] - window_width, side="right"))
+    if n_candidates == 0:
+        raise ValueError(
+            f"Window width must not exceed the extent of the data. Received: {window_width}"
+        )
+
+    candidate_left = block_left[:n_candidates]
+    start = np.arange(n_candidates)
+    stop = np.searchsorted(block_right, candidate_left + window_width, side="right")
+    stop = np.maximum(stop, start + 1)  # Blocks wider than the window still contribute
+
+    shift = 0.0
+    if strategy == ProposalStrategy.VARIANCE:
+        # Offset by a representative value so large offsets don't swamp the variance
+        finite_starts = y[block_starts][np.isfinite(y[block_starts])]
+        shift = float(finite_starts.mean()) if finite_starts.size else 0.0
+
+    stats = _block_stats(y, block_size, shift, float(threshold))
+    scores = _window_scores(stats, start, stop, strategy, shift)
+    scores[~np.isfinite(scores)] = -np.inf
+
+    proposals = []
+    for _ in range(n_proposals):
+        best = int(np.argmax(scores))
+        if scores[best] == -np.inf:
+            break
+
+        proposals.append(
+            WindowProposal(position=float(candidate_left[best]), score=float(scores[best]))
+        )
+
+        # Suppress any remaining candidates that would overlap the accepted window
+        lo = int(np.searchsorted(candidate_left, candidate_left[best] - window_width, side="right"))
+        hi = int(np.searchsorted(candidate_left, candidate_left[best] + window_width, side="left"))
+        scores[lo:hi] = -np.inf
+
+    return proposals
+
+
+class ProposalCycler:
+    """
+    Cycle a window through a ranked list of proposed positions using the keyboard.
+
+    Pressing `next_key` moves the window to the next ranked proposal & pressing `prev_key` moves it
+    to the previous one, wrapping around at either end of the list. The window is assumed to be
+    located at the top-ranked proposal, e.g. by creating it at `proposals[0].position`.
+    """
+
+    def __init__(
+        self,
+        window: DragRect | FlexibleRect,
+        proposals: t.Sequence[WindowProposal],
+        next_key: str = "n",
+        prev_key: str = "N",
+    ) -> None:
+        if not proposals:
+            raise ValueError("Cannot cycle through an empty list of proposals")
+
+        self.window = window
+        self.proposals = list(proposals)
+        self.next_key = next_key
+        self.prev_key = prev_key
+        self.current = 0
+
+        self.key_press = self.window.parent_canvas.mpl_connect("key_press_event", self.on_key)
+
+    def on_key(self, event: Event) -> t.Any:
+        """Key press callback, move the window to the next or previous proposal."""
+        if not isinstance(event, KeyEvent):
+            # Type narrowing, matplotlib dispatches a KeyEvent here so shouldn't ever trip this
+            return
+
+        if event.key == self.next_key:
+            step = 1
+        elif event.key == self.prev_key:
+            step = -1
+        else:
+            return
+
+        self.current = (self.current + step) % len(self.proposals)
+        self.window.set_position(self.proposals[self.current].position)
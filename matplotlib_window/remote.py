@@ -0,0 +1,310 @@
+import math
+import time
+import typing as t
+import weakref
+from collections import abc
+
+from matplotlib.artist import Artist
+from matplotlib.backend_bases import DrawEvent, Event, FigureCanvasBase, RendererBase
+from matplotlib.transforms import Bbox, BboxBase
+
+from matplotlib_window.base import COMMON_OBJ_ID, set_redraw_strategy
+
+DAMAGE_PADDING = 2  # Pixels added around each damaged region to cover antialiased edges
+
+
+def draggable_artists(canvas: FigureCanvasBase) -> list[Artist]:
+    """Return the draggable objects' artists on the provided canvas, see `COMMON_OBJ_ID`."""
+    return [
+        child
+        for ax in canvas.figure.axes
+        for child in ax.get_children()
+        if child.get_url() == COMMON_OBJ_ID
+    ]
+
+
+def _has_restorable_buffer(canvas: FigureCanvasBase) -> bool:
+    """
+    Check whether the canvas renders into a buffer that regions can be copied from & restored to.
+
+    This is distinct from `supports_blit`, which WebAgg-based canvases report as `False` because
+    they diff each full frame against the previous one rather than blitting regions; restoring a
+    cached background & redrawing only the moving artists still avoids a full re-render.
+    """
+    return hasattr(canvas, "copy_from_bbox") and hasattr(canvas, "restore_region")
+
+
+def _damage_bbox(extents: abc.Iterable[Bbox], bounds: BboxBase) -> Bbox | None:
+    """Return the padded union of the provided display extents, clipped to `bounds`."""
+    boxes = [
+        extent
+        for extent in extents
+        if (extent.width > 0 or extent.height > 0) and all(map(math.isfinite, extent.bounds))
+    ]
+    if not boxes:
+        return None
+
+    return Bbox.intersection(Bbox.union(boxes).padded(DAMAGE_PADDING), bounds)
+
+
+def damaged_regions(
+    old: abc.Iterable[Bbox], new: abc.Iterable[Bbox], bounds: BboxBase
+) -> list[Bbox]:
+    """
+    Return the regions of the canvas that must be repainted to move artists between the extents.
+
+    The damaged region is the union of the padded `old` & `new` display extents, clipped to
+    `bounds`. If the old & new regions don't overlap, e.g. when a window jumps to a distant
+    position, they are returned separately rather than repainting everything in between.
+    """
+    regions = [box for box in (_damage_bbox(old, bounds), _damage_bbox(new, bounds)) if box]
+    if len(regions) == 2 and regions[0].overlaps(regions[1]):
+        return [Bbox.union(regions)]
+
+    return regions
+
+
+class LowBandwidthRedraw:
+    """
+    Redraw strategy for remote canvases, e.g. WebAgg or ipympl, whose frames are sent to a client.
+
+    By default, draggable objects redraw the full canvas on every motion event, which renders &
+    sends a new frame for each event & quickly saturates a slow link. Once instantiated, redraws
+    requested by draggable objects on `canvas` are instead coalesced & pushed no more than once per
+    frame interval, and only the region damaged by the move is re-rendered.
+
+    `artists` are the artists expected to move, and default to all draggable objects on the canvas;
+    any other artists that change alongside them, e.g. a `WindowHighlight`, should also be
+    included. These artists are marked as animated so they are excluded from full redraws, & the
+    rest of the figure is cached as a background after each full redraw. If the canvas renders into
+    a restorable buffer, e.g. any Agg-based canvas, pushing a frame restores the cached background,
+    draws only the moving artists, & blits only the regions spanned by their old & new display
+    extents; see `damaged_regions`. WebAgg-based canvases then send only the pixels that changed
+    since the previous frame. Otherwise, or if the cached background is stale (e.g. after a zoom or
+    resize), a full redraw is requested using `draw_idle`.
+
+    The frame interval tracks a smoothed estimate of the network round-trip time, clamped between
+    `min_interval` & `max_interval` seconds. For canvases whose clients acknowledge each frame (e.g.
+    WebAgg & ipympl), samples are taken automatically from the client's acknowledgements; otherwise
+    samples may be provided using `ack`, & frames are pushed every `min_interval` seconds until the
+    first sample is taken. If the canvas supports timers, a throttled redraw is pushed automatically
+    once the frame interval has elapsed; otherwise it can be pushed manually using `flush`.
+
+    The strategy is retained by the canvas' redraw registry, see `set_redraw_strategy`, and holds
+    only weak references to the canvas & its artists, so it is discarded along with the canvas.
+
+    NOTE: Animated artists are not rendered by `savefig`; call `close` to restore full redraws prior
+    to saving the figure.
+    """
+
+    def __init__(
+        self,
+        canvas: FigureCanvasBase,
+        artists: abc.Sequence[Artist] | None = None,
+        min_interval: float = 0.03,
+        max_interval: float = 0.5,
+        smoothing: float = 0.25,
+    ) -> None:
+        if not (0 <= min_interval <= max_interval):
+            raise ValueError(
+                "Frame interval bounds must satisfy 0 <= min_interval <= max_interval. "
+                f"Received: {min_interval}, {max_interval}"
+            )
+        if not (0 < smoothing <= 1):
+            raise ValueError(f"Smoothing factor must be in (0, 1]. Received: {smoothing}")
+
+        # The registry holds the strategy strongly, so any strong reference back to the canvas,
+        # including via an artist's figure, would keep the canvas alive indefinitely
+        self._canvas = weakref.ref(canvas)
+        artists = list(artists) if artists is not None else draggable_artists(canvas)
+        if not artists:
+            raise ValueError("At least one artist must be provided to redraw")
+        self._artists = [weakref.ref(artist) for artist in artists]
+
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.smoothing = smoothing
+
+        self.rtt: float | None = None
+        self.n_frames = 0  # Number of frames pushed to the canvas, for diagnostic purposes
+        self._pending = False
+        self._last_push = -math.inf
+        self._sent_at: float | None = None
+
+        self._background: t.Any = None
+        self._view_state: tuple[tuple[float, ...], ...] | None = None
+        self._extents: list[Bbox] = []
+
+        self._was_animated = [artist.get_animated() for artist in artists]
+        for artist in artists:
+            artist.set_animated(True)
+
+        self._timer = canvas.new_timer()
+        self._timer.single_shot = True
+        self._timer.add_callback(self.flush)
+        self._timer_armed = False
+
+        # The canvas retains only weak references to its callbacks, so retain these
+        self.draw_event = canvas.mpl_connect("draw_event", self.on_draw)
+        # WebAgg & ipympl clients send an "ack" message for each frame they receive
+        handle_ack = getattr(canvas, "handle_ack", None)
+        self._handle_ack: weakref.WeakMethod | None = None
+        if handle_ack is not None:
+            self._handle_ack = weakref.WeakMethod(handle_ack)
+            canvas.handle_ack = self._on_client_ack  # type: ignore[attr-defined]
+
+        set_redraw_strategy(canvas, self)
+        canvas.draw_idle()
+
+    @property
+    def canvas(self) -> FigureCanvasBase:
+        """Return the canvas being redrawn, raising a `ReferenceError` if it no longer exists."""
+        canvas = self._canvas()
+        if canvas is None:
+            raise ReferenceError("The canvas has been garbage collected")
+
+        return canvas
+
+    @property
+    def artists(self) -> list[Artist]:
+        """Return the animated artists redrawn on each frame."""
+        return [artist for ref in self._artists if (artist := ref()) is not None]
+
+    @property
+    def interval(self) -> float:
+        """Return the minimum time, in seconds, between frames pushed to the canvas."""
+        rtt = self.min_interval if self.rtt is None else self.rtt
+        return min(max(rtt, self.min_interval), self.max_interval)
+
+    def _current_view_state(self) -> tuple[tuple[float, ...], ...]:
+        """Return the figure size & the view limits of each axes, which the background relies on."""
+        figure = self.canvas.figure
+        return (tuple(figure.bbox.bounds), *(tuple(ax.viewLim.bounds) for ax in figure.axes))
+
+    def _draw_artists(self, renderer: RendererBase | None = None) -> list[Bbox]:
+        """
+        Draw the animated artists & return their current display extents.
+
+        If no `renderer` is provided, the artists are drawn using the canvas' renderer.
+        """
+        extents = []
+        for artist in self.artists:
+            if renderer is None:
+                self.canvas.figure.draw_artist(artist)
+            else:
+                artist.draw(renderer)
+
+            extents.append(artist.get_window_extent())
+
+        return extents
+
+    def on_draw(self, event: Event) -> t.Any:
+        """
+        Draw event callback.
+
+        Once the canvas has been fully redrawn, without the animated artists, cache it as the
+        background & draw the animated artists on top.
+        """
+        if not isinstance(event, DrawEvent):
+            # Type narrowing, matplotlib dispatches a DrawEvent here so shouldn't ever trip this
+            return
+
+        # Draws while saving may be onto a different canvas or renderer
+        if event.canvas is not self.canvas or self.canvas.is_saving():
+            return
+
+        if _has_restorable_buffer(self.canvas):
+            self._background = self.canvas.copy_from_bbox(  # type: ignore[attr-defined]
+                self.canvas.figure.bbox
+            )
+            self._view_state = self._current_view_state()
+
+        self._extents = self._draw_artists(event.renderer)
+
+    def request(self) -> None:
+        """
+        Request a redraw of the animated artists.
+
+        The redraw is pushed immediately if at least one frame interval has elapsed since the last
+        push, otherwise it is deferred until the interval has elapsed. Multiple requests within the
+        same interval are coalesced into a single frame.
+        """
+        self._pending = True
+        wait = self._last_push + self.interval - time.monotonic()
+        if wait <= 0:
+            # Also covers a deferred redraw whose timer never fired, e.g. with no running event loop
+            self.flush()
+        elif not self._timer_armed:
+            self._timer.interval = max(1, math.ceil(wait * 1000))
+            self._timer.start()
+            self._timer_armed = True
+
+    def flush(self) -> None:
+        """Push any pending redraw to the canvas, regardless of the frame interval."""
+        self._timer.stop()
+        self._timer_armed = False
+        if not self._pending or self._canvas() is None:
+            return
+
+        self._pending = False
+        self._last_push = time.monotonic()
+        if self._sent_at is None:
+            # Measure the round trip from the oldest unacknowledged frame
+            self._sent_at = self._last_push
+
+        self._push()
+        self.n_frames += 1
+
+    def _push(self) -> None:
+        if self._background is None or self._view_state != self._current_view_state():
+            # The background is recached by the resulting draw event
+            self._background = None
+            self.canvas.draw_idle()
+            return
+
+        self.canvas.restore_region(self._background)  # type: ignore[attr-defined]
+        extents = self._draw_artists()
+        if self.canvas.supports_blit:
+            for region in damaged_regions(self._extents, extents, self.canvas.figure.bbox):
+                self.canvas.blit(region)
+        else:
+            # Frame-diffing canvases push the full frame on each blit, so only blit once
+            self.canvas.blit()
+
+        self._extents = extents
+
+    def ack(self) -> None:
+        """Record the client's receipt of a pushed frame, updating the round-trip time estimate."""
+        if self._sent_at is None:
+            return
+
+        sample = time.monotonic() - self._sent_at
+        self._sent_at = None
+        if self.rtt is None:
+            self.rtt = sample
+        else:
+            self.rtt += self.smoothing * (sample - self.rtt)
+
+    def _on_client_ack(self, event: t.Any) -> t.Any:
+        self.ack()
+        handle_ack = self._handle_ack() if self._handle_ack is not None else None
+        if handle_ack is not None:
+            return handle_ack(event)
+
+    def close(self) -> None:
+        """Stop deferring redraws & restore full redraws of the canvas."""
+        canvas = self.canvas
+        self._timer.stop()
+        self._timer_armed = False
+        canvas.mpl_disconnect(self.draw_event)
+        if self._handle_ack is not None:
+            canvas.handle_ack = self._handle_ack()  # type: ignore[attr-defined]
+
+        for ref, was_animated in zip(self._artists, self._was_animated, strict=True):
+            artist = ref()
+            if artist is not None:
+                artist.set_animated(was_animated)
+
+        set_redraw_strategy(canvas, None)
+        self._background = None
+        canvas.draw_idle()
@@ -0,0 +1,173 @@
+import time
+import typing as t
+from pathlib import Path
+
+import numpy as np
+from matplotlib.backend_bases import Event, FigureCanvasBase, MouseButton, MouseEvent
+
+from matplotlib_window.base import NUMERIC_T
+
+MOUSE_EVENT_T: t.TypeAlias = t.Literal[
+    "button_press_event", "motion_notify_event", "button_release_event"
+]
+
+RECORDED_EVENTS: tuple[MOUSE_EVENT_T, ...] = (
+    "button_press_event",
+    "motion_notify_event",
+    "button_release_event",
+)
+EVENT_DTYPE = np.dtype(
+    [
+        ("kind", "u1"),  # Index into RECORDED_EVENTS
+        ("time", "f8"),  # Seconds since the first recorded event
+        ("x", "f8"),  # Pixel coordinates
+        ("y", "f8"),
+        ("button", "u1"),  # 0 if no button
+    ]
+)
+
+
+class InteractionRecorder:
+    """
+    Record the stream of mouse events dispatched to a figure canvas.
+
+    Press, motion, and release events are captured in pixel coordinates, along with a timestamp
+    relative to the first recorded event, until `stop` is called. Because the events are stored in
+    pixel coordinates, they should be replayed onto a figure of the same size, DPI, and axes layout
+    as the one they were recorded from.
+    """
+
+    def __init__(self, canvas: FigureCanvasBase) -> None:
+        self.canvas = canvas
+        self._events: list[tuple[int, float, float, float, int]] = []
+        self._t0: float | None = None
+
+        self._cids = [self.canvas.mpl_connect(name, self._record) for name in RECORDED_EVENTS]
+
+    def _record(self, event: Event) -> None:
+        if not isinstance(event, MouseEvent):
+            # Type narrowing, matplotlib dispatches a MouseEvent here so shouldn't ever trip this
+            return
+
+        now = time.perf_counter()
+        if self._t0 is None:
+            self._t0 = now
+
+        button = 0 if event.button is None else int(event.button)
+        kind = RECORDED_EVENTS.index(event.name)
+        self._events.append((kind, now - self._t0, event.x, event.y, button))
+
+    def stop(self) -> None:
+        """Disconnect the recorder from the canvas."""
+        for cid in self._cids:
+            self.canvas.mpl_disconnect(cid)
+
+        self._cids = []
+
+    @property
+    def events(self) -> np.ndarray:
+        """Return the recorded events as a record array; see `EVENT_DTYPE` for its layout."""
+        return np.array(self._events, dtype=EVENT_DTYPE)
+
+    def save(self, filepath: Path, bounds: tuple[NUMERIC_T, ...] | None = None) -> None:
+        """
+        Save the recorded events to a compressed `.npz` file.
+
+        `bounds` may be optionally specified as the final bounds of the draggable object being
+        recorded, which can then be checked against the replayed bounds.
+        """
+        np.savez_compressed(
+            filepath,
+            events=self.events,
+            canvas_size=np.array(self.canvas.get_width_height()),
+            bounds=np.array(bounds if bounds is not None else [], dtype=float),
+        )
+
+
+class ReplayReport(t.NamedTuple):
+    """
+    Summary of an interaction replay.
+
+    `frame_times` contains the time, in seconds, taken to dispatch each motion event to the canvas,
+    including any redraws triggered by the draggable objects handling the event.
+    """
+
+    frame_times: np.ndarray
+    bounds: tuple[NUMERIC_T, ...] | None
+    expected_bounds: tuple[NUMERIC_T, ...] | None
+
+    @property
+    def bounds_match(self) -> bool | None:
+        """Check the replayed bounds against the recorded bounds, if both are available."""
+        if self.bounds is None or self.expected_bounds is None:
+            return None
+
+        return tuple(self.bounds) == tuple(self.expected_bounds)
+
+    def percentiles(self, q: t.Sequence[float] = (50, 90, 99)) -> dict[float, float]:
+        """Return the requested percentiles of the frame time distribution, in seconds."""
+        if self.frame_times.size == 0:
+            return {p: float("nan") for p in q}
+
+        return dict(zip(q, np.percentile(self.frame_times, q).tolist(), strict=True))
+
+
+class _HasBounds(t.Protocol):
+    @property
+    def bounds(self) -> tuple[NUMERIC_T, ...]: ...
+
+
+def replay(
+    filepath: Path,
+    canvas: FigureCanvasBase,
+    draggable: _HasBounds | None = None,
+    speed: float | None = None,
+) -> ReplayReport:
+    """
+    Replay a recorded interaction onto the provided canvas.
+
+    Recorded events are dispatched to the canvas' callbacks, driving any draggable objects attached
+    to the canvas the same way as the original interaction; this works headlessly (e.g. using the
+    Agg backend). The canvas must be the same size as the one the interaction was recorded from.
+
+    If `speed` is `None`, events are dispatched as fast as possible. Otherwise, events are
+    dispatched at their recorded times, scaled by `speed` (e.g. `2.0` replays at double speed).
+
+    If `draggable` is provided, its final bounds are included in the report for comparison against
+    the recorded bounds.
+    """
+    if speed is not None and speed <= 0:
+        raise ValueError(f"Replay speed must be greater than 0. Received: {speed}")
+
+    with np.load(filepath) as recording:
+        events = recording["events"]
+        canvas_size = tuple(recording["canvas_size"].tolist())
+        recorded_bounds = recording["bounds"]
+
+    if canvas_size != canvas.get_width_height():
+        raise ValueError(
+            f"Canvas size {canvas.get_width_height()} does not match recorded size {canvas_size}"
+        )
+
+    motion_kind = RECORDED_EVENTS.index("motion_notify_event")
+    frame_times = []
+    t0 = time.perf_counter()
+    for kind, event_time, x, y, button in events.tolist():
+        if speed is not None:
+            delay = (t0 + event_time / speed) - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+
+        name = RECORDED_EVENTS[kind]
+        event = MouseEvent(name, canvas, x, y, button=(MouseButton(button) if button else None))
+
+        tic = time.perf_counter()
+        canvas.callbacks.process(name, event)
+        if kind == motion_kind:
+            frame_times.append(time.perf_counter() - tic)
+
+    return ReplayReport(
+        frame_times=np.array(frame_times),
+        bounds=(tuple(draggable.bounds) if draggable is not None else None),
+        expected_bounds=(tuple(recorded_bounds.tolist()) if recorded_bounds.size else None),
+    )
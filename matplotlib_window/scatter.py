@@ -0,0 +1,283 @@
+import math
+import typing as t
+from collections import abc
+
+import numpy as np
+from matplotlib.axes import Axes
+from matplotlib.backend_bases import Event, MouseEvent
+from matplotlib.patches import Rectangle
+from numpy import typing as npt
+
+from matplotlib_window.base import COORD_T, NUMERIC_T, _DraggableObject
+
+
+class BoxBounds(t.NamedTuple):  # noqa: D101
+    left: float
+    right: float
+    bottom: float
+    top: float
+
+
+class PointIndex:
+    """
+    Bucketed spatial index for counting & selecting 2D points within an axis-aligned box.
+
+    Points are sorted by x once on instantiation & split into buckets of `bucket_size` points, each
+    of which is then sorted by y. Buckets that lie entirely within the x-range of a query box can
+    then be resolved using a binary search along y, so only the (at most two) buckets straddling the
+    box's left & right edges need to be checked point by point. If `bucket_size` is not specified,
+    it is scaled with the square root of the number of points.
+
+    Points with non-finite coordinates are excluded from the index.
+    """
+
+    def __init__(
+        self, x_data: npt.ArrayLike, y_data: npt.ArrayLike, bucket_size: int | None = None
+    ) -> None:
+        x = np.asarray(x_data, dtype=float).ravel()
+        y = np.asarray(y_data, dtype=float).ravel()
+        if x.shape != y.shape:
+            raise ValueError(f"x & y data must be the same length. Received: {x.size}, {y.size}")
+
+        (orig_idx,) = np.nonzero(np.isfinite(x) & np.isfinite(y))
+        if orig_idx.size == 0:
+            raise ValueError("Cannot index an empty set of points")
+
+        if bucket_size is None:
+            bucket_size = max(64, 8 * math.isqrt(orig_idx.size))
+        elif bucket_size <= 0:
+            raise ValueError(f"Bucket size must be greater than 0. Received: {bucket_size}")
+
+        x_order = orig_idx[np.argsort(x[orig_idx])]
+        sorted_x = x[x_order]
+
+        # Sort by y within each bucket, buckets remain in ascending x order
+        # Full buckets can be sorted together as rows of a 2D array, leaving only the remainder
+        n_full = (x_order.size // bucket_size) * bucket_size
+        full_buckets = x_order[:n_full].reshape(-1, bucket_size)
+        full_order = np.argsort(y[full_buckets], axis=1)
+        remainder = x_order[n_full:]
+        self._indices = np.concatenate(
+            (
+                np.take_along_axis(full_buckets, full_order, axis=1).ravel(),
+                remainder[np.argsort(y[remainder])],
+            )
+        )
+        self._x = x[self._indices]
+        self._y = y[self._indices]
+
+        self._bucket_starts = np.arange(0, x_order.size + bucket_size, bucket_size)
+        self._bucket_starts[-1] = x_order.size
+        self._bucket_xmin = sorted_x[self._bucket_starts[:-1]]
+        self._bucket_xmax = sorted_x[self._bucket_starts[1:] - 1]
+
+        self.bucket_size = bucket_size
+
+    def __len__(self) -> int:
+        return self._indices.size
+
+    def _query(self, bounds: BoxBounds) -> tuple[list[slice], list[np.ndarray]]:
+        """
+        Locate the indexed points within the provided bounds.
+
+        In-bounds points are returned as a list of contiguous slices of the index arrays from fully
+        covered buckets & a list of index array positions from partially covered buckets.
+        """
+        left, right, bottom, top = bounds
+
+        # Buckets overlapping the x-range of the box
+        first = int(np.searchsorted(self._bucket_xmax, left, side="left"))
+        last = int(np.searchsorted(self._bucket_xmin, right, side="right"))
+
+        spans = []
+        partials = []
+        for bucket in range(first, last):
+            start, stop = self._bucket_starts[bucket], self._bucket_starts[bucket + 1]
+            if left <= self._bucket_xmin[bucket] and self._bucket_xmax[bucket] <= right:
+                # Bucket is covered along x, so only need to search along y
+                y_bucket = self._y[start:stop]
+                lo = start + int(np.searchsorted(y_bucket, bottom, side="left"))
+                hi = start + int(np.searchsorted(y_bucket, top, side="right"))
+                spans.append(slice(lo, hi))
+            else:
+                x_bucket = self._x[start:stop]
+                y_bucket = self._y[start:stop]
+                in_x = (x_bucket >= left) & (x_bucket <= right)
+                in_y = (y_bucket >= bottom) & (y_bucket <= top)
+                partials.append(start + np.flatnonzero(in_x & in_y))
+
+        return spans, partials
+
+    def count(self, bounds: BoxBounds) -> int:
+        """Count the number of indexed points within the provided bounds, inclusive."""
+        spans, partials = self._query(bounds)
+        return sum(int(s.stop - s.start) for s in spans) + sum(int(p.size) for p in partials)
+
+    def select(self, bounds: BoxBounds) -> npt.NDArray[np.intp]:
+        """Return the sorted indices, into the original data, of the points within the bounds."""
+        spans, partials = self._query(bounds)
+        chunks = [self._indices[s] for s in spans] + [self._indices[p] for p in partials]
+        if not chunks:
+            return np.empty(0, dtype=np.intp)
+
+        return np.sort(np.concatenate(chunks))
+
+
+class DragBox(_DraggableObject):
+    """
+    Draggable & resizable `Rectangle` instance for windowing 2D point data.
+
+    `position` specifies the xy-coordinate of the lower left corner of the box.
+
+    Clicking within `grab_tolerance` pixels of an edge of the box resizes along that edge, or along
+    both edges if clicking near a corner; clicking elsewhere within the box moves it.
+
+    `index` may be optionally specified as a `PointIndex` of the plotted points, allowing the points
+    within the box to be queried using `count` and `selected`.
+
+    `redraw_callback` may be optionally specified as a callable which gets called whenever the
+    location of the box has been changed. This callable is expected to take no arguments and has no
+    return.
+
+    All kwargs not explicitly named by `__init__` are passed through to the `Rectangle` constructor,
+    allowing the user to specify custom line formatting in a form expected by `Rectangle`.
+    """
+
+    __slots__ = ("index", "grab_tolerance", "grab", "oldbounds")
+
+    myobj: Rectangle
+
+    def __init__(
+        self,
+        ax: Axes,
+        position: COORD_T,
+        width: NUMERIC_T,
+        height: NUMERIC_T,
+        index: PointIndex | None = None,
+        grab_tolerance: NUMERIC_T = 5,
+        redraw_callback: abc.Callable[[], None] | None = None,
+        edgecolor: str | None = "limegreen",
+        facecolor: str = "limegreen",
+        alpha: NUMERIC_T = 0.4,
+        **kwargs: t.Any,
+    ) -> None:
+        if width <= 0:
+            raise ValueError(f"Width value must be greater than 0. Received: {width}")
+        if height <= 0:
+            raise ValueError(f"Height value must be greater than 0. Received: {height}")
+
+        self.index = index
+        self.grab_tolerance = grab_tolerance
+        self.grab = (False, False, False, False)  # Left, right, bottom, top
+        self.snap_to = None
+        self.snap_targets = None
+        self.redraw_callback = redraw_callback
+
+        obj = Rectangle(
+            xy=position,
+            width=width,
+            height=height,
+            edgecolor=edgecolor,
+            facecolor=facecolor,
+            alpha=alpha,
+            **kwargs,
+        )
+
+        self.register_plot_object(obj, ax)
+        self.oldbounds = self.bounds  # Used for drag deltas so the object doesn't jump to cursor
+
+    def on_click(self, event: Event) -> t.Any:
+        """
+        Mouse click callback.
+
+        In addition to the common click handling, determine which edges, if any, of the box were
+        grabbed by the click.
+        """
+        super().on_click(event)
+        if not self.clicked or not isinstance(event, MouseEvent):
+            return
+
+        extent = self.myobj.get_window_extent()
+        tol = self.grab_tolerance
+        self.grab = (
+            abs(event.x - extent.x0) <= tol,
+            abs(event.x - extent.x1) <= tol,
+            abs(event.y - extent.y0) <= tol,
+            abs(event.y - extent.y1) <= tol,
+        )
+
+    def on_motion(self, event: Event) -> t.Any:
+        """
+        On motion callback.
+
+        Move or resize the box to follow the position of the mouse at the time the event is fired,
+        depending on the location of the initial click. Resizing is constrained so an edge cannot be
+        dragged past its opposite edge.
+        """
+        if not isinstance(event, MouseEvent):
+            # Type narrowing, matplotlib dispatches a MouseEvent here so shouldn't ever trip this
+            return
+        if not self.clicked:
+            return
+        if event.inaxes != self.parent_axes:
+            return
+        if (event.xdata is None) or (event.ydata is None):
+            return
+
+        dx = event.xdata - self.click_x
+        dy = event.ydata - self.click_y
+        left, right, bottom, top = self.oldbounds
+        grab_l, grab_r, grab_b, grab_t = self.grab
+
+        if not any(self.grab):
+            left, right, bottom, top = (left + dx, right + dx, bottom + dy, top + dy)
+        else:
+            # Resize, preventing the box from collapsing
+            if grab_l:
+                left = min(left + dx, right - np.spacing(right))
+            elif grab_r:
+                right = max(right + dx, left + np.spacing(left))
+
+            if grab_b:
+                bottom = min(bottom + dy, top - np.spacing(top))
+            elif grab_t:
+                top = max(top + dy, bottom + np.spacing(bottom))
+
+        self.myobj.set_bounds(left, bottom, (right - left), (top - bottom))
+        self._redraw()
+
+    def on_release(self, event: Event) -> t.Any:
+        """
+        Mouse button release callback.
+
+        When the mouse button is released, cache the new box bounds & disconnect the callbacks
+        connected by `self.on_click`.
+        """
+        if not isinstance(event, MouseEvent):
+            # Type narrowing, matplotlib dispatches a MouseEvent here so shouldn't ever trip this
+            return
+
+        self.oldbounds = self.bounds
+        self.disconnect()
+
+    @property
+    def bounds(self) -> BoxBounds:
+        """Return the locations of the left, right, bottom, & top edges."""
+        x, y = self.myobj.get_xy()
+        return BoxBounds(x, x + self.myobj.get_width(), y, y + self.myobj.get_height())
+
+    @property
+    def count(self) -> int:
+        """Return the number of indexed points within the box."""
+        if self.index is None:
+            raise ValueError("No point index was provided")
+
+        return self.index.count(self.bounds)
+
+    @property
+    def selected(self) -> npt.NDArray[np.intp]:
+        """Return the sorted indices, into the original data, of the indexed points in the box."""
+        if self.index is None:
+            raise ValueError("No point index was provided")
+
+        return self.index.select(self.bounds)
@@ -0,0 +1,185 @@
+import datetime as dt
+import typing as t
+from pathlib import Path
+
+import numpy as np
+from matplotlib.axes import Axes
+from numpy import typing as npt
+from numpy.lib import format as npformat
+
+from matplotlib_window.base import DragRect, FlexibleRect, NUMERIC_T
+
+MAX_ID_LEN = 64
+SELECTION_DTYPE = np.dtype(
+    [
+        ("dataset_id", f"U{MAX_ID_LEN}"),
+        ("left", "f8"),
+        ("right", "f8"),
+        ("start_idx", "i8"),
+        ("stop_idx", "i8"),
+        ("timestamp", "datetime64[us]"),
+    ]
+)
+
+
+def _header(n_records: int) -> dict[str, t.Any]:
+    return {
+        "descr": npformat.dtype_to_descr(SELECTION_DTYPE),
+        "fortran_order": False,
+        "shape": (n_records,),
+    }
+
+
+def sample_span(x_data: npt.ArrayLike, bounds: tuple[NUMERIC_T, NUMERIC_T]) -> tuple[int, int]:
+    """
+    Calculate the `(start, stop)` slice indices of the samples located within the provided bounds.
+
+    The x data is assumed to be sorted in ascending order.
+    """
+    x = np.asarray(x_data)
+    left, right = bounds
+
+    start = int(np.searchsorted(x, left, side="left"))
+    stop = int(np.searchsorted(x, right, side="right"))
+
+    return start, stop
+
+
+class SelectionLog:
+    """
+    Append-only log of window selections, stored on disk as a `.npy` record array.
+
+    Each record contains the dataset id, the window bounds, the `(start, stop)` slice indices of the
+    in-window samples, and a UTC timestamp; see `SELECTION_DTYPE` for the record layout. Dataset ids
+    are limited to `MAX_ID_LEN` characters.
+
+    Records are fixed-width, so appending a selection writes only the new record & updates the
+    record count in the file header in place, regardless of the number of records already logged.
+    The log may be read back in bulk as a memory-mapped array using `read`, or using `np.load`
+    directly.
+    """
+
+    def __init__(self, filepath: Path) -> None:
+        self.filepath = filepath
+
+        if not self.filepath.exists():
+            with self.filepath.open("wb") as f:
+                npformat.write_array_header_1_0(f, _header(0))
+        else:
+            # Check compatibility up front so we don't append to an incompatible file
+            self._read_header()
+
+    def __len__(self) -> int:
+        n_records, _ = self._read_header()
+        return n_records
+
+    def _read_header(self) -> tuple[int, int]:
+        """Return the number of logged records & the byte offset of the first record."""
+        with self.filepath.open("rb") as f:
+            version = npformat.read_magic(f)
+            if version != (1, 0):
+                raise ValueError(f"Unsupported selection log version: {version}")
+
+            shape, fortran_order, dtype = npformat.read_array_header_1_0(f)
+            if dtype != SELECTION_DTYPE or fortran_order or len(shape) != 1:
+                raise ValueError(f"File is not a valid selection log: '{self.filepath}'")
+
+            return shape[0], f.tell()
+
+    def append(
+        self,
+        dataset_id: str,
+        bounds: tuple[NUMERIC_T, NUMERIC_T],
+        x_data: npt.ArrayLike | None = None,
+        timestamp: dt.datetime | None = None,
+    ) -> None:
+        """
+        Append the provided window selection to the log.
+
+        If `x_data` is provided, the slice indices of the in-window samples are calculated from it;
+        `x_data` is assumed to be sorted in ascending order. Otherwise, the indices are recorded as
+        `-1`.
+
+        If `timestamp` is not provided, the current UTC time is used. Timezone-aware timestamps are
+        converted to UTC.
+        """
+        if len(dataset_id) > MAX_ID_LEN:
+            raise ValueError(
+                f"Dataset id must be at most {MAX_ID_LEN} characters. Received: '{dataset_id}'"
+            )
+
+        if timestamp is None:
+            timestamp = dt.datetime.now(dt.UTC)
+        if timestamp.tzinfo is not None:
+            timestamp = timestamp.astimezone(dt.UTC).replace(tzinfo=None)
+
+        if x_data is not None:
+            start, stop = sample_span(x_data, bounds)
+        else:
+            start = stop = -1
+
+        left, right = bounds
+        record = np.array(
+            [(dataset_id, left, right, start, stop, np.datetime64(timestamp, "us"))],
+            dtype=SELECTION_DTYPE,
+        )
+
+        n_records, data_offset = self._read_header()
+        with self.filepath.open("r+b") as f:
+            f.seek(data_offset + n_records * SELECTION_DTYPE.itemsize)
+            f.write(record.tobytes())
+            f.truncate()
+
+            # The header is padded to allow the record count to grow without changing its length
+            f.seek(0)
+            npformat.write_array_header_1_0(f, _header(n_records + 1))
+
+    def read(self) -> np.ndarray:
+        """Return a read-only, memory-mapped view of the logged records."""
+        if len(self) == 0:
+            return np.empty(0, dtype=SELECTION_DTYPE)
+
+        return np.load(self.filepath, mmap_mode="r")  # type: ignore[no-any-return]
+
+    def latest(self, dataset_id: str) -> np.void | None:
+        """Return the most recently logged record for the provided dataset id, if any."""
+        records = self.read()
+        matches = np.flatnonzero(records["dataset_id"] == dataset_id)
+        if matches.size == 0:
+            return None
+
+        return records[matches[-1]]  # type: ignore[no-any-return]
+
+    def completed(self) -> set[str]:
+        """Return the set of dataset ids with at least one logged selection."""
+        return set(np.unique(self.read()["dataset_id"]).tolist())
+
+
+@t.overload
+def restore_window(
+    ax: Axes, record: np.void, flexible: t.Literal[False] = ..., **kwargs: t.Any
+) -> DragRect: ...
+
+
+@t.overload
+def restore_window(
+    ax: Axes, record: np.void, flexible: t.Literal[True], **kwargs: t.Any
+) -> FlexibleRect: ...
+
+
+def restore_window(
+    ax: Axes, record: np.void, flexible: bool = False, **kwargs: t.Any
+) -> DragRect | FlexibleRect:
+    """
+    Build a window on the provided axes spanning the bounds of a logged selection record.
+
+    If `flexible` is `True`, a `FlexibleRect` is created, otherwise a `DragRect` is created.
+
+    All kwargs not explicitly named are passed through to the window's constructor.
+    """
+    left, right = float(record["left"]), float(record["right"])
+
+    if flexible:
+        return FlexibleRect(ax=ax, position=left, width=(right - left), **kwargs)
+    else:
+        return DragRect(ax=ax, position=left, width=(right - left), **kwargs)
@@ -2,8 +2,27 @@ import typing as t
 from collections import abc
 
 import matplotlib.pyplot as plt
+import numpy as np
+from numpy import typing as npt
 
-from matplotlib_window.base import DragRect, FlexibleRect, NUMERIC_T
+from matplotlib_window.base import (
+    COORD_T,
+    DragRect,
+    ExtentMode,
+    FlexibleRect,
+    NUMERIC_T,
+    SnapExtent,
+    SnapTargets,
+)
+from matplotlib_window.progressive import ProgressiveTrace
+from matplotlib_window.proposals import (
+    ProposalCycler,
+    ProposalStrategy,
+    WindowProposal,
+    propose_windows,
+)
+from matplotlib_window.remote import LowBandwidthRedraw, draggable_artists
+from matplotlib_window.scatter import DragBox, PointIndex
 
 DEFAULT_AXES_KWARGS: dict[str, t.Any] = {
     "title": "Close window to return selected window bounds",
@@ -11,6 +30,27 @@ DEFAULT_AXES_KWARGS: dict[str, t.Any] = {
 
 DEFAULT_PLOT_KWARGS: dict[str, t.Any] = {}
 
+DEFAULT_HIGHLIGHT_KWARGS: dict[str, t.Any] = {}
+
+DEFAULT_PROPOSAL_KWARGS: dict[str, t.Any] = {}
+
+# Plotting markers using plot rather than scatter is significantly faster for large datasets
+DEFAULT_SCATTER_PLOT_KWARGS: dict[str, t.Any] = {
+    "linestyle": "none",
+    "marker": ".",
+    "markersize": 2,
+}
+
+
+def _enable_low_bandwidth(window: DragRect | FlexibleRect) -> None:
+    """Register a `LowBandwidthRedraw` strategy for the window's draggable & highlight artists."""
+    artists = draggable_artists(window.parent_canvas)
+    if window.highlight is not None:
+        artists.append(window.highlight.artist)
+
+    # The canvas retains the registered strategy, so no reference needs to be kept here
+    LowBandwidthRedraw(window.parent_canvas, artists=artists)
+
 
 def fixed_window(
     x_data: abc.Sequence[NUMERIC_T],
@@ -18,8 +58,17 @@ def fixed_window(
     position: NUMERIC_T,
     window_width: NUMERIC_T,
     snap_to_data: bool = True,
+    snap_targets: SnapTargets | None = None,
+    overlays: abc.Sequence[tuple[abc.Sequence[NUMERIC_T], abc.Sequence[NUMERIC_T]]] = (),
+    extent_mode: ExtentMode = ExtentMode.UNION,
+    highlight: bool = False,
+    progressive: bool = False,
+    low_bandwidth: bool = False,
+    proposal: ProposalStrategy | None = None,
     axes_kwargs: dict[str, t.Any] = DEFAULT_AXES_KWARGS,
     plot_kwargs: dict[str, t.Any] = DEFAULT_PLOT_KWARGS,
+    highlight_kwargs: dict[str, t.Any] = DEFAULT_HIGHLIGHT_KWARGS,
+    proposal_kwargs: dict[str, t.Any] = DEFAULT_PROPOSAL_KWARGS,
 ) -> tuple[NUMERIC_T, NUMERIC_T]:
     """
     Plot the provided data & build a draggable fixed-width window to select bounds of interest.
@@ -31,20 +80,76 @@ def fixed_window(
     If `snap_to_data` is `True`, the window is prevented from being dragged beyond the bounds of the
     plotted data.
 
+    `overlays` may be optionally specified as a sequence of additional `(x_data, y_data)` series to
+    plot on the same axes. If `snap_to_data` is `True`, the window is limited to either the union or
+    the intersection of the extents of all plotted series, as specified by `extent_mode`.
+
+    `snap_targets` may be optionally specified as a `SnapTargets` instance to snap the edges of the
+    window to features of interest (e.g. peaks or threshold crossings) when dragged within tolerance
+    of them.
+
+    If `highlight` is `True`, the segment of the plotted data within the window is drawn in a
+    highlight style.
+
+    If `progressive` is `True`, a coarse preview of the data is plotted immediately & refined once
+    the full resolution data has been prepared in the background; see `ProgressiveTrace` for more
+    information. Highlighting is not supported in progressive mode.
+
+    If `low_bandwidth` is `True`, redraws while dragging are coalesced, throttled to the network
+    round-trip time, & limited to the region of the canvas damaged by the move, which is intended
+    for remote canvases such as WebAgg or ipympl; see `LowBandwidthRedraw` for more information.
+
+    `proposal` may be optionally specified as a `ProposalStrategy` used to rank candidate windows of
+    the provided width, e.g. by energy or variance. The window is initially placed at the top-ranked
+    proposal rather than at `position`, and pressing `n` or `N` cycles forward or backward through
+    the ranked alternatives. `proposal_kwargs` are passed straight through to `propose_windows`.
+
     `axes_kwargs` and `plot_kwargs` may be optionally specified to control the appearance of the
     resulting `Axes` and `Line2D` objects, respectively, and are passed straight through to their
     respective objects. Consult their respective documentation for available parameters.
+
+    `highlight_kwargs` may be optionally specified to control the appearance of the highlighted
+    segment, and are passed straight through to its `Line2D` object.
     """
+    if progressive and highlight:
+        raise ValueError("Highlighting is not supported in progressive mode")
+
+    proposals: list[WindowProposal] = []
+    if proposal is not None:
+        # Place the window at the top-ranked proposal, ignoring the provided position
+        proposals = propose_windows(x_data, y_data, window_width, proposal, **proposal_kwargs)
+        if proposals:
+            position = proposals[0].position
+
     _, ax = plt.subplots()
     ax.set(**axes_kwargs)
-    ls = ax.plot(x_data, y_data, **plot_kwargs)
+    if progressive:
+        trace = ProgressiveTrace(ax, x_data, y_data, **plot_kwargs)
+        ls, snap_line = trace.line, trace.snap_line
+    else:
+        ls = snap_line = ax.plot(x_data, y_data, **plot_kwargs)[0]
 
+    overlay_lines = [ax.plot(x, y)[0] for x, y in overlays]
     if snap_to_data:
-        snap_to = ls[0]
+        snap_to = SnapExtent(snap_line, *overlay_lines, mode=extent_mode)
     else:
         snap_to = None
 
-    dr = DragRect(ax=ax, position=position, width=window_width, snap_to=snap_to)
+    dr = DragRect(
+        ax=ax,
+        position=position,
+        width=window_width,
+        snap_to=snap_to,
+        snap_targets=snap_targets,
+        highlight=ls if highlight else None,
+        highlight_kwargs=highlight_kwargs,
+    )
+    if proposals:
+        # The canvas retains only weak references to callbacks, so keep this alive until closed
+        _cycler = ProposalCycler(dr, proposals)  # noqa: F841
+    if low_bandwidth:
+        _enable_low_bandwidth(dr)
+
     plt.show()
 
     return dr.bounds
@@ -56,9 +161,18 @@ def flexible_window(
     position: NUMERIC_T,
     window_width: NUMERIC_T,
     snap_to_data: bool = True,
+    snap_targets: SnapTargets | None = None,
+    overlays: abc.Sequence[tuple[abc.Sequence[NUMERIC_T], abc.Sequence[NUMERIC_T]]] = (),
+    extent_mode: ExtentMode = ExtentMode.UNION,
     allow_face_drag: bool = False,
+    highlight: bool = False,
+    progressive: bool = False,
+    low_bandwidth: bool = False,
+    proposal: ProposalStrategy | None = None,
     axes_kwargs: dict[str, t.Any] = DEFAULT_AXES_KWARGS,
     plot_kwargs: dict[str, t.Any] = DEFAULT_PLOT_KWARGS,
+    highlight_kwargs: dict[str, t.Any] = DEFAULT_HIGHLIGHT_KWARGS,
+    proposal_kwargs: dict[str, t.Any] = DEFAULT_PROPOSAL_KWARGS,
 ) -> tuple[NUMERIC_T, NUMERIC_T]:
     """
     Plot the provided data & build a flexible-width window to select bounds of interest.
@@ -70,19 +184,61 @@ def flexible_window(
     If `snap_to_data` is `True`, the window is prevented from being dragged beyond the bounds of the
     plotted data.
 
+    `overlays` may be optionally specified as a sequence of additional `(x_data, y_data)` series to
+    plot on the same axes. If `snap_to_data` is `True`, the window is limited to either the union or
+    the intersection of the extents of all plotted series, as specified by `extent_mode`.
+
+    `snap_targets` may be optionally specified as a `SnapTargets` instance to snap the edges of the
+    window to features of interest (e.g. peaks or threshold crossings) when dragged within tolerance
+    of them.
+
     If `allow_face_drag` is `True`, the entire window may be dragged using its face. NOTE: This is
     currently not implemented.
 
+    If `highlight` is `True`, the segment of the plotted data within the window is drawn in a
+    highlight style.
+
+    If `progressive` is `True`, a coarse preview of the data is plotted immediately & refined once
+    the full resolution data has been prepared in the background; see `ProgressiveTrace` for more
+    information. Highlighting is not supported in progressive mode.
+
+    If `low_bandwidth` is `True`, redraws while dragging are coalesced, throttled to the network
+    round-trip time, & limited to the region of the canvas damaged by the move, which is intended
+    for remote canvases such as WebAgg or ipympl; see `LowBandwidthRedraw` for more information.
+
+    `proposal` may be optionally specified as a `ProposalStrategy` used to rank candidate windows of
+    the provided width, e.g. by energy or variance. The window is initially placed at the top-ranked
+    proposal rather than at `position`, and pressing `n` or `N` cycles forward or backward through
+    the ranked alternatives. `proposal_kwargs` are passed straight through to `propose_windows`.
+
     `axes_kwargs` and `plot_kwargs` may be optionally specified to control the appearance of the
     resulting `Axes` and `Line2D` objects, respectively, and are passed straight through to their
     respective objects. Consult their respective documentation for available parameters.
+
+    `highlight_kwargs` may be optionally specified to control the appearance of the highlighted
+    segment, and are passed straight through to its `Line2D` object.
     """
+    if progressive and highlight:
+        raise ValueError("Highlighting is not supported in progressive mode")
+
+    proposals: list[WindowProposal] = []
+    if proposal is not None:
+        # Place the window at the top-ranked proposal, ignoring the provided position
+        proposals = propose_windows(x_data, y_data, window_width, proposal, **proposal_kwargs)
+        if proposals:
+            position = proposals[0].position
+
     _, ax = plt.subplots()
     ax.set(**axes_kwargs)
-    ls = ax.plot(x_data, y_data, **plot_kwargs)
+    if progressive:
+        trace = ProgressiveTrace(ax, x_data, y_data, **plot_kwargs)
+        ls, snap_line = trace.line, trace.snap_line
+    else:
+        ls = snap_line = ax.plot(x_data, y_data, **plot_kwargs)[0]
 
+    overlay_lines = [ax.plot(x, y)[0] for x, y in overlays]
     if snap_to_data:
-        snap_to = ls[0]
+        snap_to = SnapExtent(snap_line, *overlay_lines, mode=extent_mode)
     else:
         snap_to = None
 
@@ -91,8 +247,50 @@ def flexible_window(
         position=position,
         width=window_width,
         snap_to=snap_to,
+        snap_targets=snap_targets,
+        highlight=ls if highlight else None,
+        highlight_kwargs=highlight_kwargs,
         allow_face_drag=allow_face_drag,
     )
+    if proposals:
+        # The canvas retains only weak references to callbacks, so keep this alive until closed
+        _cycler = ProposalCycler(dr, proposals)  # noqa: F841
+    if low_bandwidth:
+        _enable_low_bandwidth(dr)
+
     plt.show()
 
     return dr.bounds
+
+
+def box_window(
+    x_data: npt.ArrayLike,
+    y_data: npt.ArrayLike,
+    position: COORD_T,
+    width: NUMERIC_T,
+    height: NUMERIC_T,
+    axes_kwargs: dict[str, t.Any] = DEFAULT_AXES_KWARGS,
+    plot_kwargs: dict[str, t.Any] = DEFAULT_SCATTER_PLOT_KWARGS,
+) -> npt.NDArray[np.intp]:
+    """
+    Plot the provided point data & build a draggable, resizable 2D box to select points of interest.
+
+    The sorted indices of the points located within the box are returned once the figure window is
+    closed.
+
+    `position` specifies the xy-coordinate of the lower left corner of the box.
+
+    `axes_kwargs` and `plot_kwargs` may be optionally specified to control the appearance of the
+    resulting `Axes` and `Line2D` objects, respectively, and are passed straight through to their
+    respective objects. Consult their respective documentation for available parameters.
+    """
+    index = PointIndex(x_data, y_data)
+
+    _, ax = plt.subplots()
+    ax.set(**axes_kwargs)
+    ax.plot(x_data, y_data, **plot_kwargs)
+
+    db = DragBox(ax=ax, position=position, width=width, height=height, index=index)
+    plt.show()
+
+    return db.selected
@@ -1,4 +1,5 @@
-from matplotlib.backend_bases import FigureCanvasBase
+from matplotlib.axes import Axes
+from matplotlib.backend_bases import FigureCanvasBase, MouseButton, MouseEvent
 
 
 def has_callback_to(
@@ -16,3 +17,19 @@ def has_callback_to(
             return True
 
     return False
+
+
+def fire_mouse_event(
+    ax: Axes, name: str, xdata: float, ydata: float, button: MouseButton | None = MouseButton.LEFT
+) -> None:
+    """Dispatch a synthetic `MouseEvent` at the provided data coordinates to the parent canvas."""
+    canvas = ax.figure.canvas
+    x, y = ax.transData.transform((xdata, ydata))
+    canvas.callbacks.process(name, MouseEvent(name, canvas, x, y, button=button))
+
+
+def drag(ax: Axes, start: tuple[float, float], end: tuple[float, float]) -> None:
+    """Simulate a click & drag between the provided data coordinates."""
+    fire_mouse_event(ax, "button_press_event", *start)
+    fire_mouse_event(ax, "motion_notify_event", *end)
+    fire_mouse_event(ax, "button_release_event", *end)
@@ -1,8 +1,17 @@
-import pytest
+import weakref
 
-from matplotlib_window.base import DragLine, DragRect, FlexibleRect, Orientation
+import pytest
+from matplotlib.backend_bases import MouseButton, MouseEvent, ResizeEvent
+
+from matplotlib_window.base import (
+    DragLine,
+    DragRect,
+    FlexibleRect,
+    Orientation,
+    build_drag_anchor,
+)
 from tests.conftest import PLOTOBJ_T
-from tests.helpers import has_callback_to
+from tests.helpers import drag, has_callback_to
 
 
 def test_dragline_invalid_orientation_raises(plotobj: PLOTOBJ_T) -> None:
@@ -68,3 +77,99 @@ def test_flexrect_disables_click(plotobj: PLOTOBJ_T) -> None:
 
     parent_canvas = dr.face.parent_canvas
     assert not has_callback_to(parent_canvas, "DragRect")
+
+
+def test_draggables_slotted(plotobj: PLOTOBJ_T) -> None:
+    _, ax = plotobj
+    draggables = (
+        DragLine(ax=ax, position=0),
+        DragRect(ax=ax, position=0, width=1),
+        FlexibleRect(ax=ax, position=0, width=1),
+    )
+
+    for obj in draggables:
+        assert not hasattr(obj, "__dict__")
+        assert weakref.ref(obj)() is obj
+
+
+def test_dragrect_pixel_drag(plotobj: PLOTOBJ_T) -> None:
+    fig, ax = plotobj
+    ax.set_xlim((0, 100))
+    dr = DragRect(ax=ax, position=10, width=5)
+
+    # Fire at whole pixels, as a GUI would; drags are accurate to within a pixel
+    x0, y0 = ax.transData.transform((12, 0.5))
+    x1, _ = ax.transData.transform((32, 0.5))
+    for name, x in (("button_press_event", x0), ("motion_notify_event", x1)):
+        fig.canvas.callbacks.process(
+            name, MouseEvent(name, fig.canvas, round(x), round(y0), MouseButton.LEFT)
+        )
+
+    assert dr.drag_anchor is not None
+    assert dr.bounds == pytest.approx((30, 35), abs=100 / ax.bbox.width)
+
+
+def test_dragrect_pixel_drag_log_axes(plotobj: PLOTOBJ_T) -> None:
+    _, ax = plotobj
+    ax.set_xscale("log")
+    ax.set_xlim((1, 1000))
+    dr = DragRect(ax=ax, position=10, width=10)
+
+    # Dragging by a decade in screen space moves the left edge by a decade in data space
+    drag(ax, (15, 0.5), (150, 0.5))
+    assert dr.bounds[0] == pytest.approx(100, rel=0.02)
+    assert dr.myobj.get_width() == 10
+
+
+def test_dragrect_inverted_axis_snapto(plotobj: PLOTOBJ_T) -> None:
+    _, ax = plotobj
+    (ls,) = ax.plot([0, 100], [0, 1])
+    ax.set_xlim((100, -50))
+    dr = DragRect(ax=ax, position=10, width=10, snap_to=ls)
+
+    # Cursor moves right on screen but left in data space, so the left edge is clamped
+    drag(ax, (15, 0.5), (-30, 0.5))
+    assert dr.bounds == (0, 10)
+
+    drag(ax, (5, 0.5), (98, 0.5))
+    assert dr.bounds == (90, 100)
+
+
+def test_dragrect_anchor_reset_on_limit_change(plotobj: PLOTOBJ_T) -> None:
+    fig, ax = plotobj
+    ax.set_xlim((0, 100))
+    dr = DragRect(ax=ax, position=10, width=5)
+
+    x0, y0 = ax.transData.transform((12, 0.5))
+    fig.canvas.callbacks.process(
+        "button_press_event", MouseEvent("button_press_event", fig.canvas, x0, y0, MouseButton.LEFT)
+    )
+    assert dr.drag_anchor is not None
+
+    ax.set_xlim((0, 200))
+    assert dr.drag_anchor is None
+
+    # Drag is re-anchored at the current location on the next motion event, so no jump
+    fig.canvas.callbacks.process(
+        "motion_notify_event", MouseEvent("motion_notify_event", fig.canvas, x0, y0)
+    )
+    assert dr.drag_anchor is not None
+    assert dr.bounds == pytest.approx((10, 15))
+
+
+def test_dragrect_anchor_reset_on_resize(plotobj: PLOTOBJ_T) -> None:
+    fig, ax = plotobj
+    dr = DragRect(ax=ax, position=0.1, width=0.2)
+    dr.drag_anchor = build_drag_anchor(ax, 0, 0.1)
+
+    fig.canvas.callbacks.process("resize_event", ResizeEvent("resize_event", fig.canvas))
+    assert dr.drag_anchor is None
+
+
+def test_dragrect_ylim_change_respans(plotobj: PLOTOBJ_T) -> None:
+    _, ax = plotobj
+    dr = DragRect(ax=ax, position=0.1, width=0.2)
+
+    ax.set_ylim((-5, 10))
+    assert dr.myobj.get_y() == -5
+    assert dr.myobj.get_height() == 15
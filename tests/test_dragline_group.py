@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+from matplotlib.lines import Line2D
+
+from matplotlib_window.base import DragLineGroup, Orientation, SnapTargets
+from tests.conftest import PLOTOBJ_T
+from tests.helpers import drag, has_callback_to
+
+POSITIONS = np.arange(1, 100, 2, dtype=float)
+
+
+def test_group_empty_raises(plotobj: PLOTOBJ_T) -> None:
+    _, ax = plotobj
+    with pytest.raises(ValueError, match="empty"):
+        DragLineGroup(ax=ax, positions=[])
+
+
+def test_group_invalid_orientation_raises(plotobj: PLOTOBJ_T) -> None:
+    _, ax = plotobj
+    with pytest.raises(ValueError, match="orientation"):
+        DragLineGroup(ax=ax, positions=[1], orientation="beans")  # type: ignore[arg-type]
+
+
+def test_group_single_artist(plotobj: PLOTOBJ_T) -> None:
+    _, ax = plotobj
+    group = DragLineGroup(ax=ax, positions=POSITIONS)
+
+    assert len(group.myobj.get_paths()) == POSITIONS.size
+    assert has_callback_to(group.parent_canvas, "DragLineGroup")
+    np.testing.assert_array_equal(group.locations, POSITIONS)
+
+
+def test_group_positions_copied(plotobj: PLOTOBJ_T) -> None:
+    _, ax = plotobj
+    positions = POSITIONS.copy()
+    group = DragLineGroup(ax=ax, positions=positions)
+    group.locations[0] = -1
+    positions[1] = -1
+
+    np.testing.assert_array_equal(group.locations, POSITIONS)
+
+
+@pytest.mark.parametrize("orientation", (Orientation.VERTICAL, Orientation.HORIZONTAL))
+def test_group_drag_nearest_line(orientation: Orientation, plotobj: PLOTOBJ_T) -> None:
+    _, ax = plotobj
+    ax.set(xlim=(0, 100), ylim=(0, 100))
+    group = DragLineGroup(ax=ax, positions=POSITIONS, orientation=orientation)
+
+    if orientation == Orientation.VERTICAL:
+        drag(ax, (37.2, 50), (60.5, 50))
+    else:
+        drag(ax, (50, 37.2), (50, 60.5))
+
+    truth = POSITIONS.copy()
+    truth[18] = 60.5
+    np.testing.assert_allclose(group.locations, truth)
+
+    # Rendered segments should follow the position array
+    axis = 0 if orientation == Orientation.VERTICAL else 1
+    rendered = np.array([seg[0, axis] for seg in group.myobj.get_segments()])
+    np.testing.assert_allclose(rendered, truth)
+
+
+def test_group_limit_change_respans(plotobj: PLOTOBJ_T) -> None:
+    _, ax = plotobj
+    group = DragLineGroup(ax=ax, positions=[0.5])
+    ax.set_ylim((-5, 5))
+
+    np.testing.assert_array_equal(group.myobj.get_segments()[0][:, 1], (-5, 5))
+
+
+def test_group_snapto_out_of_bounds_raises(plotobj: PLOTOBJ_T) -> None:
+    _, ax = plotobj
+    line = Line2D(xdata=np.array([0, 1, 2]), ydata=np.array([0, 1, 2]))
+    with pytest.raises(ValueError, match="bounds"):
+        DragLineGroup(ax=ax, positions=[1, 3], snap_to=line)
+
+
+def test_group_drag_clamped_and_snapped(plotobj: PLOTOBJ_T) -> None:
+    _, ax = plotobj
+    ax.set(xlim=(0, 100), ylim=(0, 100))
+    line = Line2D(xdata=np.array([0, 50]), ydata=np.array([0, 1]))
+    group = DragLineGroup(ax=ax, positions=[10, 20], snap_to=line, snap_targets=SnapTargets([30]))
+
+    drag(ax, (10, 50), (30.5, 50))
+    drag(ax, (20, 50), (80, 50))
+    np.testing.assert_allclose(group.locations, (30, 50))
@@ -0,0 +1,87 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+from matplotlib.patches import Rectangle
+
+from matplotlib_window import export
+from matplotlib_window.base import COMMON_OBJ_ID
+from matplotlib_window.export import ExportRecord, export_windows
+
+X_DATA = np.linspace(0, 10, 100)
+Y_DATA = np.sin(X_DATA)
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def _records(n: int) -> list[ExportRecord]:
+    return [ExportRecord(f"sel_{i}", (X_DATA, Y_DATA), (i, i + 2)) for i in range(n)]
+
+
+def test_export_png(tmp_path: Path) -> None:
+    records = _records(5)
+    paths = export_windows(records, tmp_path, max_workers=2, batch_size=2)
+
+    assert paths == [tmp_path / f"{r.name}.png" for r in records]
+    for path in paths:
+        assert path.read_bytes().startswith(PNG_SIGNATURE)
+
+
+def test_export_svg_flexible(tmp_path: Path) -> None:
+    (path,) = export_windows(_records(1), tmp_path, fmt="svg", flexible=True, max_workers=1)
+
+    assert path.suffix == ".svg"
+    assert "<svg" in path.read_text()
+
+
+def test_export_npy_source(tmp_path: Path) -> None:
+    source = tmp_path / "trace.npy"
+    np.save(source, np.vstack((X_DATA, Y_DATA)))
+
+    (path,) = export_windows([ExportRecord("from_file", source, (1, 2))], tmp_path, max_workers=1)
+    assert path.read_bytes().startswith(PNG_SIGNATURE)
+
+
+def test_export_creates_out_dir(tmp_path: Path) -> None:
+    out_dir = tmp_path / "nested" / "snapshots"
+    export_windows(_records(1), out_dir, max_workers=1)
+
+    assert (out_dir / "sel_0.png").exists()
+
+
+def test_export_duplicate_names_raises(tmp_path: Path) -> None:
+    records = [ExportRecord("dup", (X_DATA, Y_DATA), (1, 2))] * 2
+    with pytest.raises(ValueError, match="unique"):
+        export_windows(records, tmp_path)
+
+
+def test_export_invalid_batch_size_raises(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="Batch size"):
+        export_windows(_records(1), tmp_path, batch_size=0)
+
+
+def test_render_bad_npy_shape_raises(tmp_path: Path) -> None:
+    source = tmp_path / "trace.npy"
+    np.save(source, X_DATA)
+
+    config = export._RenderConfig(tmp_path, "png", False, {}, {})
+    export._init_worker(export.DEFAULT_FIGSIZE, export.DEFAULT_DPI)
+    with pytest.raises(ValueError, match=r"\(2, n\)"):
+        export._render(ExportRecord("bad", source, (1, 2)), config)
+
+
+def test_render_reuses_figure(tmp_path: Path) -> None:
+    config = export._RenderConfig(tmp_path, "png", False, {}, {"facecolor": "red"})
+    export._init_worker(export.DEFAULT_FIGSIZE, export.DEFAULT_DPI)
+    fig = export._worker_figure
+    assert fig is not None
+
+    export._render_batch(_records(3), config)
+    assert export._worker_figure is fig
+
+    # Previous renders are cleared, leaving only the latest window
+    (ax,) = fig.axes
+    windows = [c for c in ax.get_children() if c.get_url() == COMMON_OBJ_ID]
+    assert len(windows) == 1
+    assert isinstance(windows[0], Rectangle)
+    assert windows[0].get_x() == 2
+    assert windows[0].get_facecolor()[:3] == (1, 0, 0)
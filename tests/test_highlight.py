@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+from matplotlib.lines import Line2D
+
+from matplotlib_window.base import DragRect, FlexibleRect, WindowHighlight
+from tests.conftest import PLOTOBJ_T
+from tests.helpers import drag
+
+
+def test_highlight_empty_raises(plotobj: PLOTOBJ_T) -> None:
+    _, ax = plotobj
+    with pytest.raises(ValueError, match="empty"):
+        WindowHighlight(ax, Line2D(xdata=np.array([]), ydata=np.array([])))
+
+
+def test_highlight_update_slices(plotobj: PLOTOBJ_T) -> None:
+    _, ax = plotobj
+    (ls,) = ax.plot(np.arange(10), np.arange(10) * 2)
+    hl = WindowHighlight(ax, ls)
+
+    assert hl.update((2.5, 5))
+    assert hl.span == (3, 6)
+    np.testing.assert_array_equal(hl.artist.get_xdata(), [3, 4, 5])
+    np.testing.assert_array_equal(hl.artist.get_ydata(), [6, 8, 10])
+
+
+def test_highlight_unchanged_span_noop(plotobj: PLOTOBJ_T) -> None:
+    _, ax = plotobj
+    (ls,) = ax.plot(np.arange(10), np.arange(10))
+    hl = WindowHighlight(ax, ls)
+
+    assert hl.update((2.5, 5))
+    assert not hl.update((2.6, 5.5))
+
+
+def test_highlight_unsorted_source(plotobj: PLOTOBJ_T) -> None:
+    _, ax = plotobj
+    (ls,) = ax.plot([3, 0, 2, 1], [30, 0, 20, 10])
+    hl = WindowHighlight(ax, ls)
+
+    hl.update((1, 2))
+    np.testing.assert_array_equal(hl.artist.get_xdata(), [1, 2])
+    np.testing.assert_array_equal(hl.artist.get_ydata(), [10, 20])
+
+
+def test_highlight_style_passthrough(plotobj: PLOTOBJ_T) -> None:
+    _, ax = plotobj
+    (ls,) = ax.plot(np.arange(10), np.arange(10))
+    hl = WindowHighlight(ax, ls, color="red", linestyle="--")
+
+    assert hl.artist.get_color() == "red"
+    assert hl.artist.get_linestyle() == "--"
+
+
+def test_dragrect_highlight_follows_drag(plotobj: PLOTOBJ_T) -> None:
+    _, ax = plotobj
+    (ls,) = ax.plot(np.arange(11), np.arange(11))
+    dr = DragRect(ax=ax, position=1, width=2, highlight=ls)
+
+    assert dr.highlight is not None
+    np.testing.assert_array_equal(dr.highlight.artist.get_xdata(), [1, 2, 3])
+
+    # Drags resolve to whole pixels, so keep the dragged edges clear of the samples
+    drag(ax, (2, 5), (6.5, 5))
+    np.testing.assert_array_equal(dr.highlight.artist.get_xdata(), [6, 7])
+
+
+def test_flexrect_highlight_follows_edges(plotobj: PLOTOBJ_T) -> None:
+    _, ax = plotobj
+    (ls,) = ax.plot(np.arange(11), np.arange(11))
+    fr = FlexibleRect(ax=ax, position=1, width=2, highlight=ls)
+
+    assert fr.highlight is not None
+    np.testing.assert_array_equal(fr.highlight.artist.get_xdata(), [1, 2, 3])
+
+    drag(ax, (3, 5), (5, 5))
+    np.testing.assert_array_equal(fr.highlight.artist.get_xdata(), [1, 2, 3, 4, 5])
+
+
+def test_no_highlight_by_default(plotobj: PLOTOBJ_T) -> None:
+    _, ax = plotobj
+    assert DragRect(ax=ax, position=1, width=2).highlight is None
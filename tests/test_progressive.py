@@ -0,0 +1,118 @@
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+from matplotlib_window.base import DragRect
+from matplotlib_window.progressive import ProgressiveTrace, decimate_minmax
+from matplotlib_window.window import fixed_window
+from tests.conftest import PLOTOBJ_T
+from tests.helpers import drag
+
+RNG = np.random.default_rng(42)
+N_SAMPLES = 100_003
+X_DATA = np.arange(N_SAMPLES, dtype=float)
+Y_DATA = RNG.normal(size=N_SAMPLES)
+
+
+def test_decimate_minmax_envelope() -> None:
+    x = np.arange(10, dtype=float)
+    y = np.array([0, 5, -1, 2, 3, 3, -4, 1, 7, 6], dtype=float)
+    dec_x, dec_y = decimate_minmax(x, y, bucket_size=4)
+
+    np.testing.assert_array_equal(dec_x, [1, 2, 4, 6, 8, 9])
+    np.testing.assert_array_equal(dec_y, [5, -1, 3, -4, 7, 6])
+
+
+def test_decimate_minmax_preserves_extrema() -> None:
+    _, dec_y = decimate_minmax(X_DATA, Y_DATA, bucket_size=64)
+    assert dec_y.min() == Y_DATA.min()
+    assert dec_y.max() == Y_DATA.max()
+
+
+def test_trace_mismatched_length_raises(plotobj: PLOTOBJ_T) -> None:
+    _, ax = plotobj
+    with pytest.raises(ValueError, match="same length"):
+        ProgressiveTrace(ax, [1, 2], [1])
+
+
+def test_trace_empty_raises(plotobj: PLOTOBJ_T) -> None:
+    _, ax = plotobj
+    with pytest.raises(ValueError, match="empty"):
+        ProgressiveTrace(ax, [], [])
+
+
+def test_trace_preview(plotobj: PLOTOBJ_T) -> None:
+    _, ax = plotobj
+    trace = ProgressiveTrace(ax, X_DATA, Y_DATA, preview_points=1_000)
+
+    preview_x = np.asarray(trace.line.get_xdata())
+    assert preview_x.size <= 1_002
+    assert preview_x[0] == X_DATA[0]
+    assert preview_x[-1] == X_DATA[-1]
+
+    trace.wait()
+
+
+def test_trace_swap_in(plotobj: PLOTOBJ_T) -> None:
+    _, ax = plotobj
+    trace = ProgressiveTrace(ax, X_DATA, Y_DATA, preview_points=1_000)
+    trace.wait()
+
+    assert trace.ready
+    assert trace.swap_in()
+    assert trace.refined
+    assert trace.swap_in()  # Subsequent calls are a no-op
+
+    # Full view should be decimated, but contain the extrema of the data
+    full_y = np.asarray(trace.line.get_ydata())
+    assert full_y.size < N_SAMPLES
+    assert full_y.min() == Y_DATA.min()
+    assert full_y.max() == Y_DATA.max()
+
+    # Zooming in should show raw samples
+    ax.set_xlim((100, 200))
+    np.testing.assert_array_equal(trace.line.get_xdata(), X_DATA[99:202])
+
+
+def test_trace_snap_line_unsorted(plotobj: PLOTOBJ_T) -> None:
+    _, ax = plotobj
+    order = RNG.permutation(N_SAMPLES)
+    trace = ProgressiveTrace(ax, X_DATA[order], Y_DATA[order], preview_points=1_000)
+
+    # Snap extent is exact prior to swap in, even though the strided preview misses the extrema
+    np.testing.assert_array_equal(trace.snap_line.get_xdata(), (X_DATA.min(), X_DATA.max()))
+    np.testing.assert_array_equal(trace.snap_line.get_ydata(), (Y_DATA.min(), Y_DATA.max()))
+    DragRect(ax=ax, position=0, width=1_000, snap_to=trace.snap_line)
+
+    trace.wait()
+    trace.swap_in()
+    np.testing.assert_array_equal(trace.snap_line.get_xdata(), (X_DATA.min(), X_DATA.max()))
+
+
+def test_trace_snap_line_drives_dragrect(plotobj: PLOTOBJ_T) -> None:
+    _, ax = plotobj
+    trace = ProgressiveTrace(ax, X_DATA, Y_DATA, preview_points=1_000)
+    dr = DragRect(ax=ax, position=10_000, width=20_000, snap_to=trace.snap_line)
+    assert dr.snap_to is not None
+    np.testing.assert_array_equal(dr.snap_to.x_extent, (X_DATA[0], X_DATA[-1]))
+
+    drag(ax, (20_000, 0), (-3_000, 0))
+    assert dr.bounds == (X_DATA[0], X_DATA[0] + 20_000)
+
+    trace.wait()
+    trace.swap_in()
+    np.testing.assert_array_equal(dr.snap_to.x_extent, (X_DATA[0], X_DATA[-1]))
+
+    drag(ax, (10_000, 0), (104_000, 0))
+    assert dr.bounds == (X_DATA[-1] - 20_000, X_DATA[-1])
+
+
+def test_progressive_highlight_raises() -> None:
+    open_figures = plt.get_fignums()
+    with pytest.raises(ValueError, match="progressive"):
+        fixed_window(
+            [0, 1, 2], [0, 1, 2], position=0, window_width=1, highlight=True, progressive=True
+        )
+
+    # Arguments are validated prior to creating the figure
+    assert plt.get_fignums() == open_figures
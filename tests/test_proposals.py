@@ -0,0 +1,204 @@
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+from matplotlib.backend_bases import KeyEvent
+
+from matplotlib_window.base import DragRect, FlexibleRect
+from matplotlib_window.proposals import (
+    ProposalCycler,
+    ProposalStrategy,
+    WindowProposal,
+    propose_windows,
+)
+from matplotlib_window.window import fixed_window
+from tests.conftest import PLOTOBJ_T
+
+RNG = np.random.default_rng(42)
+X_DATA = np.arange(200, dtype=float)
+Y_DATA = RNG.normal(size=200)
+WIDTH = 10
+
+
+def _brute_force_scores(strategy: ProposalStrategy, threshold: float = 0) -> np.ndarray:
+    """Score every sample-aligned window by masking the full data series."""
+    scores = []
+    for left in X_DATA[X_DATA <= (X_DATA[-1] - WIDTH)]:
+        segment = Y_DATA[(X_DATA >= left) & (X_DATA <= left + WIDTH)]
+        if strategy == ProposalStrategy.ENERGY:
+            scores.append(np.sum(segment**2))
+        elif strategy == ProposalStrategy.VARIANCE:
+            scores.append(np.var(segment))
+        else:
+            scores.append(np.count_nonzero(segment > threshold))
+
+    return np.array(scores)
+
+
+@pytest.mark.parametrize("strategy", list(ProposalStrategy))
+def test_top_proposal_matches_brute_force(strategy: ProposalStrategy) -> None:
+    scores = _brute_force_scores(strategy, threshold=0.5)
+    proposals = propose_windows(X_DATA, Y_DATA, WIDTH, strategy, threshold=0.5)
+
+    assert proposals[0].position == X_DATA[np.argmax(scores)]
+    assert proposals[0].score == pytest.approx(scores.max())
+
+
+def test_variance_large_offset() -> None:
+    offset_proposals = propose_windows(X_DATA, Y_DATA + 1e9, WIDTH, ProposalStrategy.VARIANCE)
+    proposals = propose_windows(X_DATA, Y_DATA, WIDTH, ProposalStrategy.VARIANCE)
+
+    assert offset_proposals[0].position == proposals[0].position
+    assert offset_proposals[0].score == pytest.approx(proposals[0].score)
+
+
+def test_proposals_ranked_non_overlapping() -> None:
+    proposals = propose_windows(X_DATA, Y_DATA, WIDTH, n_proposals=8)
+    assert len(proposals) == 8
+
+    scores = [p.score for p in proposals]
+    assert scores == sorted(scores, reverse=True)
+
+    positions = np.array([p.position for p in proposals])
+    gaps = np.abs(positions[:, None] - positions[None, :])
+    assert np.all(gaps[~np.eye(len(positions), dtype=bool)] >= WIDTH)
+
+
+def test_proposals_within_data() -> None:
+    proposals = propose_windows(X_DATA, Y_DATA, WIDTH, n_proposals=20)
+    for p in proposals:
+        assert X_DATA[0] <= p.position
+        assert (p.position + WIDTH) <= X_DATA[-1]
+
+
+def test_proposal_finds_burst() -> None:
+    y = np.zeros(100_000)
+    y[61_000:61_500] = 5
+    x = np.linspace(0, 100, y.size)
+
+    proposals = propose_windows(x, y, window_width=0.5, resolution=1_000)
+    assert proposals[0].position == pytest.approx(61, abs=0.1)
+
+
+def test_blocked_proposals() -> None:
+    # 200 samples at a resolution of 30 gives blocks of 7 samples, with a partial final block
+    proposals = propose_windows(X_DATA, np.ones_like(X_DATA), WIDTH, resolution=30)
+
+    assert all(p.position % 7 == 0 for p in proposals)
+
+    # Only whole blocks within the window contribute; the window at 189 also spans the partial final
+    # block [196, 199], so it is the top ranked
+    assert proposals[0] == (189, 11)
+    assert all(p.score == 7 for p in proposals[1:])
+
+
+def test_proposal_unsorted_data() -> None:
+    order = RNG.permutation(X_DATA.size)
+    unsorted = propose_windows(X_DATA[order], Y_DATA[order], WIDTH)
+    assert unsorted == propose_windows(X_DATA, Y_DATA, WIDTH)
+
+
+@pytest.mark.parametrize("strategy", tuple(ProposalStrategy))
+def test_proposal_excludes_nan_windows(strategy: ProposalStrategy) -> None:
+    y = np.zeros(1_000)
+    y[10] = np.nan
+    y[100:150] = np.nan
+    y[800:820] = 5
+
+    # Non-finite samples only exclude the windows containing them, not every window after them
+    proposals = propose_windows(np.arange(1_000), y, 20, strategy, n_proposals=10, resolution=100)
+    assert proposals
+    assert 780 < proposals[0].position < 820  # The top proposal overlaps the burst
+    assert all(not (-20 < p.position - 10 <= 0) for p in proposals)
+    assert all(not (80 < p.position < 150) for p in proposals)
+
+
+def test_proposal_strategy_from_str() -> None:
+    proposals = propose_windows(X_DATA, Y_DATA, WIDTH, "variance")  # type: ignore[arg-type]
+    assert proposals == propose_windows(X_DATA, Y_DATA, WIDTH, ProposalStrategy.VARIANCE)
+
+
+PROPOSAL_RAISES_CASES = (
+    ({"window_width": 0}, "Width"),
+    ({"window_width": 500}, "extent"),
+    ({"n_proposals": 0}, "proposals"),
+    ({"resolution": 0}, "Resolution"),
+    ({"strategy": "loudness"}, "loudness"),
+)
+
+
+@pytest.mark.parametrize(("kwargs", "match"), PROPOSAL_RAISES_CASES)
+def test_proposal_invalid_raises(kwargs: dict, match: str) -> None:
+    call_kwargs = {"x_data": X_DATA, "y_data": Y_DATA, "window_width": WIDTH, **kwargs}
+    with pytest.raises(ValueError, match=match):
+        propose_windows(**call_kwargs)
+
+
+def test_proposal_mismatched_data_raises() -> None:
+    with pytest.raises(ValueError, match="same length"):
+        propose_windows(X_DATA, Y_DATA[:-1], WIDTH)
+
+
+def _press(cycler: ProposalCycler, key: str) -> None:
+    canvas = cycler.window.parent_canvas
+    canvas.callbacks.process("key_press_event", KeyEvent("key_press_event", canvas, key))
+
+
+PROPOSALS = [WindowProposal(50, 3), WindowProposal(20, 2), WindowProposal(80, 1)]
+
+
+def test_cycler_dragrect(plotobj: PLOTOBJ_T) -> None:
+    _, ax = plotobj
+    ax.plot(X_DATA, Y_DATA)
+    dr = DragRect(ax=ax, position=PROPOSALS[0].position, width=WIDTH)
+
+    cycler = ProposalCycler(dr, PROPOSALS)
+    assert dr.bounds == (50, 60)
+
+    _press(cycler, "n")
+    assert dr.bounds == (20, 30)
+    _press(cycler, "x")
+    assert dr.bounds == (20, 30)
+    _press(cycler, "n")
+    _press(cycler, "n")
+    assert dr.bounds == (50, 60)
+    _press(cycler, "N")
+    assert dr.bounds == (80, 90)
+
+
+def test_cycler_flexiblerect(plotobj: PLOTOBJ_T, monkeypatch: pytest.MonkeyPatch) -> None:
+    fig, ax = plotobj
+    ax.plot(X_DATA, Y_DATA)
+    fr = FlexibleRect(ax=ax, position=PROPOSALS[0].position, width=WIDTH)
+    cycler = ProposalCycler(fr, PROPOSALS)
+
+    draws = []
+    monkeypatch.setattr(fig.canvas, "draw", lambda: draws.append(1))
+    _press(cycler, "n")
+    assert fr.bounds == (20, 30)
+    assert fr.face.bounds == (20, 30)
+    assert len(draws) == 1  # Both edges are moved before redrawing
+
+
+def test_helper_starts_at_top_proposal(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(plt, "show", lambda: None)
+
+    # Position is ignored when proposing, so it doesn't need to lie within the data
+    bounds = fixed_window(
+        X_DATA.tolist(),
+        Y_DATA.tolist(),
+        position=-1_000,
+        window_width=WIDTH,
+        proposal=ProposalStrategy.ENERGY,
+    )
+    plt.close()
+
+    top = propose_windows(X_DATA, Y_DATA, WIDTH)[0]
+    assert bounds == (top.position, top.position + WIDTH)
+
+
+def test_cycler_empty_raises(plotobj: PLOTOBJ_T) -> None:
+    _, ax = plotobj
+    dr = DragRect(ax=ax, position=0, width=WIDTH)
+
+    with pytest.raises(ValueError, match="empty"):
+        ProposalCycler(dr, [])
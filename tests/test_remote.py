@@ -0,0 +1,344 @@
+import gc
+import types
+import typing as t
+import weakref
+
+import numpy as np
+import pytest
+from matplotlib.axes import Axes
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.backends.backend_webagg_core import FigureCanvasWebAggCore, FigureManagerWebAgg
+from matplotlib.figure import Figure
+from matplotlib.transforms import Bbox
+
+from matplotlib_window import remote
+from matplotlib_window.base import DragRect, FlexibleRect, _redraw_strategies
+from matplotlib_window.remote import LowBandwidthRedraw, damaged_regions, draggable_artists
+from matplotlib_window.window import _enable_low_bandwidth
+from tests.helpers import drag, fire_mouse_event
+
+
+class ByteCountingCanvas(FigureCanvasAgg):
+    """Stand-in for a remote canvas, tallying the RGBA bytes of each full frame & blit sent."""
+
+    def __init__(self, figure: Figure) -> None:
+        super().__init__(figure)
+        self.n_full = 0
+        self.blits: list[Bbox] = []
+        self.bytes_sent = 0
+
+    def draw(self) -> None:
+        """Render the full figure, counting it as a full frame sent."""
+        super().draw()  # type: ignore[no-untyped-call]
+        width, height = self.get_width_height(physical=True)
+        self.n_full += 1
+        self.bytes_sent += 4 * width * height
+
+    def blit(self, bbox: t.Any = None) -> None:
+        """Count the blitted region as sent, without repainting."""
+        self.blits.append(bbox)
+        self.bytes_sent += 4 * int(bbox.width * bbox.height)
+
+
+class FakeClock:
+    """Manually advanced stand-in for `time.monotonic`."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        """Return the current fake time, in seconds."""
+        return self.now
+
+
+@pytest.fixture
+def counting_ax() -> tuple[ByteCountingCanvas, Axes]:
+    fig = Figure()
+    canvas = ByteCountingCanvas(fig)
+    ax = fig.add_subplot()
+    ax.plot([0, 100], [-1, 1])
+
+    return canvas, ax
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    fake = FakeClock()
+    monkeypatch.setattr(remote, "time", types.SimpleNamespace(monotonic=fake.monotonic))
+
+    return fake
+
+
+def test_draggable_artists(counting_ax: tuple[ByteCountingCanvas, Axes]) -> None:
+    canvas, ax = counting_ax
+    fr = FlexibleRect(ax=ax, position=10, width=10)
+
+    found = draggable_artists(canvas)
+    assert len(found) == 3
+    assert fr.face.myobj in found
+
+
+def test_no_artists_raises(counting_ax: tuple[ByteCountingCanvas, Axes]) -> None:
+    canvas, _ = counting_ax
+    with pytest.raises(ValueError, match="At least one"):
+        LowBandwidthRedraw(canvas)
+
+
+INVALID_PARAM_CASES = (
+    ({"min_interval": -1}, "interval"),
+    ({"min_interval": 1, "max_interval": 0.5}, "interval"),
+    ({"smoothing": 0}, "Smoothing"),
+    ({"smoothing": 1.5}, "Smoothing"),
+)
+
+
+@pytest.mark.parametrize(("kwargs", "match"), INVALID_PARAM_CASES)
+def test_invalid_params_raise(
+    counting_ax: tuple[ByteCountingCanvas, Axes], kwargs: dict, match: str
+) -> None:
+    canvas, ax = counting_ax
+    DragRect(ax=ax, position=10, width=10)
+
+    with pytest.raises(ValueError, match=match):
+        LowBandwidthRedraw(canvas, **kwargs)
+
+
+def test_default_full_redraws(counting_ax: tuple[ByteCountingCanvas, Axes]) -> None:
+    canvas, ax = counting_ax
+    dr = DragRect(ax=ax, position=10, width=10)
+    canvas.draw()
+
+    drag(ax, (15, 0), (20, 0))
+    assert dr.bounds[0] == pytest.approx(15, abs=0.5)
+    assert canvas.n_full == 3  # Initial draw, then one each for motion & release
+    assert not canvas.blits
+
+
+def test_blit_damaged_region(counting_ax: tuple[ByteCountingCanvas, Axes]) -> None:
+    canvas, ax = counting_ax
+    dr = DragRect(ax=ax, position=10, width=10)
+    LowBandwidthRedraw(canvas, min_interval=0)
+    assert canvas.n_full == 1  # Initial draw caches the background
+    assert dr.myobj.get_animated()
+
+    old_extent = dr.myobj.get_window_extent()
+    canvas.bytes_sent = 0
+    fire_mouse_event(ax, "button_press_event", 15, 0)
+    fire_mouse_event(ax, "motion_notify_event", 20, 0)
+    new_extent = dr.myobj.get_window_extent()
+
+    assert canvas.n_full == 1
+    (damage,) = canvas.blits
+    assert damage.contains(old_extent.x0, old_extent.y0)
+    assert damage.contains(new_extent.x1, new_extent.y1)
+
+    width, height = canvas.get_width_height(physical=True)
+    assert canvas.bytes_sent < 4 * width * height / 4
+
+
+def test_disjoint_damaged_regions(counting_ax: tuple[ByteCountingCanvas, Axes]) -> None:
+    canvas, ax = counting_ax
+    dr = DragRect(ax=ax, position=10, width=10)
+    LowBandwidthRedraw(canvas, min_interval=0)
+
+    dr.set_position(80)
+    assert canvas.n_full == 1
+    assert len(canvas.blits) == 2
+
+
+DAMAGE_CASES: tuple[tuple[list[Bbox], list[Bbox], list[tuple[float, ...]]], ...] = (
+    ([Bbox.from_bounds(10, 0, 10, 10)], [Bbox.from_bounds(15, 0, 10, 10)], [(8, 0, 19, 12)]),
+    (
+        [Bbox.from_bounds(10, 0, 10, 10)],
+        [Bbox.from_bounds(50, 0, 10, 10)],
+        [(8, 0, 14, 12), (48, 0, 14, 12)],
+    ),
+    ([Bbox.from_bounds(0, 0, 0, 0)], [Bbox.from_bounds(50, 0, 10, 10)], [(48, 0, 14, 12)]),
+    ([], [], []),
+)
+
+
+@pytest.mark.parametrize(("old", "new", "truth_bounds"), DAMAGE_CASES)
+def test_damaged_regions(
+    old: list[Bbox], new: list[Bbox], truth_bounds: list[tuple[float, ...]]
+) -> None:
+    # Padded regions are clipped to the canvas bounds
+    regions = damaged_regions(old, new, Bbox.from_bounds(0, 0, 100, 100))
+    assert [r.bounds for r in regions] == truth_bounds
+
+
+def test_requests_coalesced(counting_ax: tuple[ByteCountingCanvas, Axes], clock: FakeClock) -> None:
+    canvas, ax = counting_ax
+    dr = DragRect(ax=ax, position=10, width=10)
+    lb = LowBandwidthRedraw(canvas, min_interval=0.1)
+
+    for position in (20, 30, 40):
+        dr.set_position(position)
+
+    # The first request is pushed immediately & the remainder are deferred to a single frame
+    assert lb.n_frames == 1
+    assert len(canvas.blits) == 1
+
+    clock.now = 0.1
+    lb.flush()
+    assert lb.n_frames == 2
+    lb.flush()
+    assert lb.n_frames == 2
+
+    # Once the interval has elapsed, requests are pushed immediately
+    clock.now = 0.25
+    dr.set_position(50)
+    assert lb.n_frames == 3
+
+
+def test_rtt_estimate(counting_ax: tuple[ByteCountingCanvas, Axes], clock: FakeClock) -> None:
+    canvas, ax = counting_ax
+    dr = DragRect(ax=ax, position=10, width=10)
+    lb = LowBandwidthRedraw(canvas, min_interval=0.05, max_interval=0.4, smoothing=0.5)
+    assert lb.interval == 0.05
+
+    lb.ack()  # Acknowledgements without a pushed frame are ignored
+    assert lb.rtt is None
+
+    dr.set_position(20)
+    clock.now = 0.2
+    lb.ack()
+    assert lb.rtt == pytest.approx(0.2)
+    assert lb.interval == pytest.approx(0.2)
+
+    dr.set_position(30)
+    clock.now = 1.2
+    lb.ack()
+    assert lb.rtt == pytest.approx(0.6)
+    assert lb.interval == 0.4
+
+
+def test_stale_background_full_redraw(counting_ax: tuple[ByteCountingCanvas, Axes]) -> None:
+    canvas, ax = counting_ax
+    dr = DragRect(ax=ax, position=10, width=10)
+    LowBandwidthRedraw(canvas, min_interval=0)
+
+    ax.set_xlim((-10, 110))
+    dr.set_position(20)
+    assert canvas.n_full == 2
+    assert not canvas.blits
+
+    dr.set_position(30)
+    assert canvas.n_full == 2
+    assert len(canvas.blits) == 1
+
+
+def test_close_restores_full_redraws(counting_ax: tuple[ByteCountingCanvas, Axes]) -> None:
+    canvas, ax = counting_ax
+    dr = DragRect(ax=ax, position=10, width=10)
+    lb = LowBandwidthRedraw(canvas, min_interval=0)
+
+    lb.close()
+    assert not dr.myobj.get_animated()
+    assert canvas not in _redraw_strategies
+
+    n_full = canvas.n_full
+    dr.set_position(20)
+    assert canvas.n_full == n_full + 1
+    assert not canvas.blits
+
+
+CANVAS_CASES = (FigureCanvasAgg, FigureCanvasWebAggCore)
+
+
+@pytest.mark.parametrize("canvas_cls", CANVAS_CASES)
+def test_canvas_collected(canvas_cls: type[FigureCanvasAgg]) -> None:
+    gc.collect()  # Collect any canvases left over from prior tests
+    n_registered = len(_redraw_strategies)
+    fig = Figure()
+    canvas = canvas_cls(fig)
+    ax = fig.add_subplot()
+    ax.plot([0, 100], [-1, 1])
+    dr = DragRect(ax=ax, position=10, width=10)
+    LowBandwidthRedraw(canvas, min_interval=0)
+    assert len(_redraw_strategies) == n_registered + 1
+
+    # The registered strategy must not keep its canvas alive
+    canvas_ref = weakref.ref(canvas)
+    del fig, canvas, ax, dr
+    gc.collect()
+
+    assert canvas_ref() is None
+    assert len(_redraw_strategies) == n_registered
+
+
+class FakeWebSocket:
+    """Stand-in browser client that acknowledges each frame & services draw requests."""
+
+    def __init__(self, canvas: FigureCanvasWebAggCore) -> None:
+        self.canvas = canvas
+        self.n_frames = 0
+        self.n_full_redraws = 0
+        self.bytes_received = 0
+
+    def send_json(self, content: dict[str, t.Any]) -> None:
+        """Service the canvas' requests for a full redraw, as sent by `draw_idle`."""
+        if content["type"] == "draw":
+            self.n_full_redraws += 1
+            self.canvas.handle_event({"type": "draw"})  # type: ignore[no-untyped-call]
+
+    def send_binary(self, blob: bytes) -> None:
+        """Receive & acknowledge a frame."""
+        self.n_frames += 1
+        self.bytes_received += len(blob)
+        self.canvas.handle_event({"type": "ack"})  # type: ignore[no-untyped-call]
+
+
+def _webagg_drag(low_bandwidth: bool) -> tuple[FakeWebSocket, LowBandwidthRedraw | None]:
+    fig = Figure()
+    canvas = FigureCanvasWebAggCore(fig)  # type: ignore[no-untyped-call]
+    manager = FigureManagerWebAgg(canvas, 1)  # type: ignore[no-untyped-call]
+    ax = fig.add_subplot()
+    x_data = np.linspace(0, 100, 1_000)
+    ax.plot(x_data, np.sin(x_data))
+    dr = DragRect(ax=ax, position=10, width=10)
+
+    client = FakeWebSocket(canvas)
+    manager.add_web_socket(client)  # type: ignore[no-untyped-call]
+    lb = LowBandwidthRedraw(canvas, min_interval=1, max_interval=1) if low_bandwidth else None
+    client.n_frames = client.n_full_redraws = client.bytes_received = 0
+
+    fire_mouse_event(ax, "button_press_event", 15, 0)
+    for query in range(16, 60):
+        fire_mouse_event(ax, "motion_notify_event", query, 0)
+    fire_mouse_event(ax, "button_release_event", 59, 0)
+    if lb is not None:
+        lb.flush()
+
+    assert dr.bounds == pytest.approx((54, 64), abs=0.5)
+
+    return client, lb
+
+
+def test_webagg_fewer_bytes() -> None:
+    default_client, _ = _webagg_drag(low_bandwidth=False)
+    client, lb = _webagg_drag(low_bandwidth=True)
+
+    assert default_client.n_frames == 45
+    assert client.n_frames == 2  # First motion event & the trailing flush
+    assert client.n_full_redraws == 0  # Only the window is re-rendered over the cached background
+    assert client.bytes_received < default_client.bytes_received / 10
+
+    # Round-trip time is sampled from the client's acknowledgements
+    assert lb is not None
+    assert lb.rtt is not None
+
+
+def test_enable_low_bandwidth_highlight(counting_ax: tuple[ByteCountingCanvas, Axes]) -> None:
+    canvas, ax = counting_ax
+    (ls,) = ax.lines
+    dr = DragRect(ax=ax, position=10, width=10, highlight=ls)
+
+    _enable_low_bandwidth(dr)
+    lb = _redraw_strategies[canvas]
+    assert isinstance(lb, LowBandwidthRedraw)
+
+    # Highlighted segment moves alongside the window, so it must be redrawn with it
+    assert dr.highlight is not None
+    assert lb.artists == [dr.myobj, dr.highlight.artist]
+    assert dr.highlight.artist.get_animated()
@@ -0,0 +1,104 @@
+from pathlib import Path
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+from matplotlib.axes import Axes
+from matplotlib.backend_bases import FigureCanvasBase, MouseButton, MouseEvent
+
+from matplotlib_window.base import DragRect
+from matplotlib_window.replay import EVENT_DTYPE, InteractionRecorder, RECORDED_EVENTS, replay
+from tests.conftest import PLOTOBJ_T
+from tests.helpers import drag
+
+
+def _fire_pixel_event(canvas: FigureCanvasBase, name: str, x: int, y: int) -> None:
+    # GUI backends dispatch integer pixel locations, so use those for exact reproduction
+    canvas.callbacks.process(name, MouseEvent(name, canvas, x, y, button=MouseButton.LEFT))
+
+
+def _record_drag(ax: Axes, filepath: Path) -> tuple[float, float]:
+    dr = DragRect(ax=ax, position=1, width=2)
+    canvas = ax.figure.canvas
+    recorder = InteractionRecorder(canvas)
+
+    x, y = ax.transData.transform((2, 5)).astype(int)
+    _fire_pixel_event(canvas, "button_press_event", x, y)
+    _fire_pixel_event(canvas, "motion_notify_event", x + 40, y)
+    _fire_pixel_event(canvas, "motion_notify_event", x + 80, y + 3)
+    _fire_pixel_event(canvas, "button_release_event", x + 80, y + 3)
+
+    recorder.stop()
+    recorder.save(filepath, bounds=dr.bounds)
+    return dr.bounds
+
+
+def test_recorder_captures_events(plotobj: PLOTOBJ_T) -> None:
+    fig, ax = plotobj
+    ax.set(xlim=(0, 10), ylim=(0, 10))
+    recorder = InteractionRecorder(fig.canvas)
+    drag(ax, (1, 1), (2, 2))
+
+    events = recorder.events
+    assert events.dtype == EVENT_DTYPE
+    assert [RECORDED_EVENTS[k] for k in events["kind"]] == list(RECORDED_EVENTS)
+    assert np.all(np.diff(events["time"]) >= 0)
+
+
+def test_recorder_stop(plotobj: PLOTOBJ_T) -> None:
+    fig, ax = plotobj
+    recorder = InteractionRecorder(fig.canvas)
+    recorder.stop()
+    drag(ax, (0.1, 0.1), (0.2, 0.2))
+
+    assert recorder.events.size == 0
+
+
+@pytest.mark.parametrize("speed", (None, 100.0))
+def test_replay_reproduces_bounds(tmp_path: Path, speed: float | None) -> None:
+    filepath = tmp_path / "trace.npz"
+    fig, ax = plt.subplots()
+    ax.set(xlim=(0, 10), ylim=(0, 10))
+    recorded_bounds = _record_drag(ax, filepath)
+    plt.close(fig)
+
+    fig, ax = plt.subplots()
+    ax.set(xlim=(0, 10), ylim=(0, 10))
+    dr = DragRect(ax=ax, position=1, width=2)
+    report = replay(filepath, fig.canvas, draggable=dr, speed=speed)
+    plt.close(fig)
+
+    assert report.bounds == recorded_bounds
+    assert report.bounds_match
+    assert report.frame_times.size == 2
+    assert set(report.percentiles((50, 99))) == {50, 99}
+
+
+def test_replay_size_mismatch_raises(tmp_path: Path) -> None:
+    filepath = tmp_path / "trace.npz"
+    fig, ax = plt.subplots()
+    _record_drag(ax, filepath)
+    plt.close(fig)
+
+    fig, _ = plt.subplots(figsize=(2, 2))
+    with pytest.raises(ValueError, match="does not match"):
+        replay(filepath, fig.canvas)
+    plt.close(fig)
+
+
+def test_replay_invalid_speed_raises(tmp_path: Path, plotobj: PLOTOBJ_T) -> None:
+    fig, _ = plotobj
+    with pytest.raises(ValueError, match="greater than 0"):
+        replay(tmp_path / "trace.npz", fig.canvas, speed=0)
+
+
+def test_replay_without_bounds(tmp_path: Path, plotobj: PLOTOBJ_T) -> None:
+    fig, ax = plotobj
+    filepath = tmp_path / "trace.npz"
+    recorder = InteractionRecorder(fig.canvas)
+    drag(ax, (0.1, 0.1), (0.2, 0.2))
+    recorder.save(filepath)
+
+    report = replay(filepath, fig.canvas)
+    assert report.bounds_match is None
+    assert report.expected_bounds is None
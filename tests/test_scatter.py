@@ -0,0 +1,115 @@
+import numpy as np
+import pytest
+
+from matplotlib_window.scatter import BoxBounds, DragBox, PointIndex
+from tests.conftest import PLOTOBJ_T
+from tests.helpers import drag
+
+RNG = np.random.default_rng(42)
+X_DATA = RNG.normal(size=5_000)
+Y_DATA = RNG.normal(size=5_000)
+
+
+def _brute_force(x: np.ndarray, y: np.ndarray, bounds: BoxBounds) -> np.ndarray:
+    left, right, bottom, top = bounds
+    return np.flatnonzero((x >= left) & (x <= right) & (y >= bottom) & (y <= top))
+
+
+QUERY_TEST_CASES = (
+    BoxBounds(-0.5, 0.5, -0.5, 0.5),
+    BoxBounds(-10, 10, -10, 10),  # All points
+    BoxBounds(5, 10, 5, 10),  # No points
+    BoxBounds(-1, 2, 0, 0.1),
+    BoxBounds(X_DATA[10], X_DATA[20], Y_DATA[30], Y_DATA[30] + 1),  # Inclusive edges
+)
+
+
+@pytest.mark.parametrize("bucket_size", (None, 1, 100, 10_000))
+@pytest.mark.parametrize("bounds", QUERY_TEST_CASES)
+def test_point_index_matches_mask(bucket_size: int | None, bounds: BoxBounds) -> None:
+    index = PointIndex(X_DATA, Y_DATA, bucket_size=bucket_size)
+    truth = _brute_force(X_DATA, Y_DATA, bounds)
+
+    np.testing.assert_array_equal(index.select(bounds), truth)
+    assert index.count(bounds) == truth.size
+
+
+def test_point_index_skips_nonfinite() -> None:
+    x = np.array([0, np.nan, 1, 2])
+    y = np.array([0, 1, np.inf, 2])
+    index = PointIndex(x, y)
+
+    assert len(index) == 2
+    np.testing.assert_array_equal(index.select(BoxBounds(-1, 3, -1, 3)), [0, 3])
+
+
+def test_point_index_mismatched_length_raises() -> None:
+    with pytest.raises(ValueError, match="same length"):
+        PointIndex([1, 2], [1])
+
+
+def test_point_index_empty_raises() -> None:
+    with pytest.raises(ValueError, match="empty"):
+        PointIndex([np.nan], [1])
+
+
+def test_point_index_invalid_bucket_size_raises() -> None:
+    with pytest.raises(ValueError, match="greater than"):
+        PointIndex([1], [1], bucket_size=0)
+
+
+@pytest.mark.parametrize(("width", "height"), ((0, 1), (1, 0)))
+def test_dragbox_invalid_size_raises(width: float, height: float, plotobj: PLOTOBJ_T) -> None:
+    _, ax = plotobj
+    with pytest.raises(ValueError, match="greater than"):
+        DragBox(ax=ax, position=(0, 0), width=width, height=height)
+
+
+def test_dragbox_no_index_raises(plotobj: PLOTOBJ_T) -> None:
+    _, ax = plotobj
+    db = DragBox(ax=ax, position=(0, 0), width=1, height=1)
+
+    with pytest.raises(ValueError, match="index"):
+        _ = db.count
+
+    with pytest.raises(ValueError, match="index"):
+        _ = db.selected
+
+
+def test_dragbox_move(plotobj: PLOTOBJ_T) -> None:
+    _, ax = plotobj
+    ax.set(xlim=(0, 10), ylim=(0, 10))
+    db = DragBox(ax=ax, position=(2, 2), width=2, height=2)
+
+    drag(ax, (3, 3), (5, 6))
+    assert db.bounds == pytest.approx((4, 6, 5, 7))
+
+
+def test_dragbox_resize_corner(plotobj: PLOTOBJ_T) -> None:
+    _, ax = plotobj
+    ax.set(xlim=(0, 10), ylim=(0, 10))
+    db = DragBox(ax=ax, position=(2, 2), width=2, height=2)
+
+    drag(ax, (4, 4), (6, 5))
+    assert db.bounds == pytest.approx((2, 6, 2, 5))
+
+
+def test_dragbox_resize_no_collapse(plotobj: PLOTOBJ_T) -> None:
+    _, ax = plotobj
+    ax.set(xlim=(0, 10), ylim=(0, 10))
+    db = DragBox(ax=ax, position=(2, 2), width=2, height=2)
+
+    drag(ax, (2, 3), (8, 3))
+    left, right, _, _ = db.bounds
+    assert left < right
+
+
+def test_dragbox_selection(plotobj: PLOTOBJ_T) -> None:
+    _, ax = plotobj
+    ax.set(xlim=(-5, 5), ylim=(-5, 5))
+    db = DragBox(ax=ax, position=(-1, -1), width=1, height=1, index=PointIndex(X_DATA, Y_DATA))
+
+    drag(ax, (-0.5, -0.5), (0.5, 0.5))
+    truth = _brute_force(X_DATA, Y_DATA, db.bounds)
+    np.testing.assert_array_equal(db.selected, truth)
+    assert db.count == truth.size
@@ -0,0 +1,98 @@
+import datetime as dt
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from matplotlib_window.base import DragRect, FlexibleRect
+from matplotlib_window.session import SELECTION_DTYPE, SelectionLog, restore_window, sample_span
+from tests.conftest import PLOTOBJ_T
+
+
+def test_sample_span() -> None:
+    assert sample_span(np.arange(10), (2.5, 5)) == (3, 6)
+
+
+def test_new_log_empty(tmp_path: Path) -> None:
+    log = SelectionLog(tmp_path / "log.npy")
+    assert len(log) == 0
+    assert log.read().dtype == SELECTION_DTYPE
+    assert log.read().size == 0
+    assert log.latest("beans") is None
+
+
+def test_append_roundtrip(tmp_path: Path) -> None:
+    log_path = tmp_path / "log.npy"
+    log = SelectionLog(log_path)
+    ts = dt.datetime(2024, 1, 1, 12, tzinfo=dt.UTC)
+
+    log.append("rec_a", (2.5, 5), x_data=np.arange(10), timestamp=ts)
+    log.append("rec_b", (1, 2))
+
+    records = log.read()
+    assert len(log) == 2
+    assert records[0]["dataset_id"] == "rec_a"
+    assert (records[0]["left"], records[0]["right"]) == (2.5, 5)
+    assert (records[0]["start_idx"], records[0]["stop_idx"]) == (3, 6)
+    assert records[0]["timestamp"] == np.datetime64("2024-01-01T12:00:00", "us")
+    assert (records[1]["start_idx"], records[1]["stop_idx"]) == (-1, -1)
+
+    # Should also be readable as a plain npy file
+    np.testing.assert_array_equal(np.load(log_path), records)
+
+
+def test_reopen_appends(tmp_path: Path) -> None:
+    log_path = tmp_path / "log.npy"
+    SelectionLog(log_path).append("rec_a", (0, 1))
+    SelectionLog(log_path).append("rec_b", (0, 1))
+
+    assert SelectionLog(log_path).completed() == {"rec_a", "rec_b"}
+
+
+def test_latest_record(tmp_path: Path) -> None:
+    log = SelectionLog(tmp_path / "log.npy")
+    log.append("rec_a", (0, 1))
+    log.append("rec_b", (0, 1))
+    log.append("rec_a", (2, 3))
+
+    latest = log.latest("rec_a")
+    assert latest is not None
+    assert (latest["left"], latest["right"]) == (2, 3)
+
+
+def test_long_dataset_id_raises(tmp_path: Path) -> None:
+    log = SelectionLog(tmp_path / "log.npy")
+    with pytest.raises(ValueError, match="at most"):
+        log.append("a" * 65, (0, 1))
+
+
+def test_incompatible_file_raises(tmp_path: Path) -> None:
+    log_path = tmp_path / "log.npy"
+    np.save(log_path, np.arange(3))
+
+    with pytest.raises(ValueError, match="not a valid"):
+        SelectionLog(log_path)
+
+
+def test_restore_dragrect(tmp_path: Path, plotobj: PLOTOBJ_T) -> None:
+    _, ax = plotobj
+    log = SelectionLog(tmp_path / "log.npy")
+    log.append("rec_a", (2, 5))
+
+    record = log.latest("rec_a")
+    assert record is not None
+    dr = restore_window(ax, record)
+    assert isinstance(dr, DragRect)
+    assert dr.bounds == (2, 5)
+
+
+def test_restore_flexrect(tmp_path: Path, plotobj: PLOTOBJ_T) -> None:
+    _, ax = plotobj
+    log = SelectionLog(tmp_path / "log.npy")
+    log.append("rec_a", (2, 5))
+
+    record = log.latest("rec_a")
+    assert record is not None
+    fr = restore_window(ax, record, flexible=True)
+    assert isinstance(fr, FlexibleRect)
+    assert fr.bounds == (2, 5)
@@ -0,0 +1,262 @@
+import typing as t
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+from matplotlib.lines import Line2D
+
+from matplotlib_window.base import (
+    DragLine,
+    DragRect,
+    ExtentMode,
+    FlexibleRect,
+    Orientation,
+    SnapExtent,
+    as_snap_extent,
+)
+from matplotlib_window.window import fixed_window, flexible_window
+from tests.conftest import PLOTOBJ_T
+from tests.helpers import drag
+
+LINE_A = Line2D(xdata=np.array([0, 5, 10]), ydata=np.array([-1, 0, 1]))
+SERIES_B = (np.array([4, 20, 8]), np.array([-5, 2, np.nan]))
+
+
+def test_empty_members_raises() -> None:
+    with pytest.raises(ValueError, match="At least one"):
+        SnapExtent()
+
+
+def test_invalid_mode_raises() -> None:
+    with pytest.raises(ValueError, match="not a valid"):
+        SnapExtent(LINE_A, mode="outer")  # type: ignore[arg-type]
+
+
+EXTENT_CASES = (
+    (ExtentMode.UNION, (0, 20), (-5, 2)),
+    (ExtentMode.INTERSECTION, (4, 10), (-1, 1)),
+)
+
+
+@pytest.mark.parametrize(("mode", "truth_x", "truth_y"), EXTENT_CASES)
+def test_combined_extent(
+    mode: ExtentMode, truth_x: tuple[float, float], truth_y: tuple[float, float]
+) -> None:
+    extent = SnapExtent(LINE_A, SERIES_B, mode=mode)
+
+    np.testing.assert_array_equal(extent.x_extent, truth_x)
+    np.testing.assert_array_equal(extent.y_extent, truth_y)
+
+
+def test_disjoint_intersection_raises() -> None:
+    extent = SnapExtent(LINE_A, ([20, 30], [0, 1]), mode=ExtentMode.INTERSECTION)
+    with pytest.raises(ValueError, match="Intersection"):
+        _ = extent.x_extent
+
+
+def test_extent_refreshed_on_set_data() -> None:
+    line = Line2D(xdata=[0, 1], ydata=[0, 1])
+    extent = SnapExtent(line, ([-1, 0.5], [0, 0]))
+    np.testing.assert_array_equal(extent.x_extent, (-1, 1))
+
+    line.set_data([2, 3], [0, 1])
+    np.testing.assert_array_equal(extent.x_extent, (-1, 3))
+
+
+def test_extent_cached_until_data_changes(monkeypatch: pytest.MonkeyPatch) -> None:
+    line = Line2D(xdata=[0, 1], ydata=[0, 1])
+    extent = SnapExtent(line)
+    _ = extent.x_extent
+    _ = extent.y_extent
+
+    calls = []
+    monkeypatch.setattr("matplotlib_window.base._numeric_extent", lambda v: calls.append(v))
+    _ = extent.x_extent
+    _ = extent.y_extent
+    assert not calls
+
+
+def test_empty_member_raises() -> None:
+    extent = SnapExtent(LINE_A, ([], []))
+    with pytest.raises(ValueError, match="empty"):
+        _ = extent.x_extent
+
+
+def test_timedelta_extent() -> None:
+    x_data = np.array([1, 3, 2], dtype="timedelta64[s]")
+    extent = SnapExtent((x_data, [0, 1, 2]))
+    np.testing.assert_array_equal(extent.x_extent, (1, 3))
+
+
+NEAREST_SAMPLE_CASES = (
+    (-3, 0),
+    (3.9, 4),
+    (6.4, 5),
+    (9.2, 10),
+    (100, 20),
+)
+
+
+@pytest.mark.parametrize(("query", "truth_sample"), NEAREST_SAMPLE_CASES)
+def test_nearest_sample(query: float, truth_sample: float) -> None:
+    extent = SnapExtent(LINE_A, SERIES_B)
+    assert extent.nearest_sample(query) == truth_sample
+
+
+def test_nearest_sample_refreshed_on_set_data() -> None:
+    line = Line2D(xdata=[0, 1], ydata=[0, 1])
+    extent = SnapExtent(line)
+    assert extent.nearest_sample(5) == 1
+
+    line.set_data([0, 6], [0, 1])
+    assert extent.nearest_sample(5) == 6
+
+
+def test_as_snap_extent() -> None:
+    assert as_snap_extent(None) is None
+
+    extent = SnapExtent(LINE_A)
+    assert as_snap_extent(extent) is extent
+
+    single = as_snap_extent(LINE_A)
+    assert single is not None
+    assert single.members == (LINE_A,)
+
+    multi = as_snap_extent([LINE_A, SERIES_B])
+    assert multi is not None
+    assert multi.members == (LINE_A, SERIES_B)
+
+
+def test_dragrect_multi_snapto(plotobj: PLOTOBJ_T) -> None:
+    _, ax = plotobj
+    (ls_a,) = ax.plot([0, 50], [0, 1])
+    (ls_b,) = ax.plot([10, 100], [0, 1])
+    dr = DragRect(ax=ax, position=20, width=10, snap_to=[ls_a, ls_b])
+
+    drag(ax, (25, 0.5), (104, 0.5))
+    assert dr.bounds == (90, 100)
+
+
+def test_dragrect_intersection_snapto(plotobj: PLOTOBJ_T) -> None:
+    _, ax = plotobj
+    (ls_a,) = ax.plot([0, 50], [0, 1])
+    (ls_b,) = ax.plot([10, 100], [0, 1])
+    extent = SnapExtent(ls_a, ls_b, mode=ExtentMode.INTERSECTION)
+    dr = DragRect(ax=ax, position=20, width=10, snap_to=extent)
+
+    drag(ax, (25, 0.5), (-4, 0.5))
+    assert dr.bounds == (10, 20)
+
+
+def test_intersection_axes_independent() -> None:
+    # Vertically offset traces overlap along x but not along y
+    extent = SnapExtent(([0, 50], [0, 1]), ([10, 100], [5, 6]), mode=ExtentMode.INTERSECTION)
+
+    np.testing.assert_array_equal(extent.x_extent, (10, 50))
+    with pytest.raises(ValueError, match="y extents"):
+        _ = extent.y_extent
+
+
+def test_dragrect_disjoint_y_intersection_snapto(plotobj: PLOTOBJ_T) -> None:
+    _, ax = plotobj
+    (ls_a,) = ax.plot([0, 50], [0, 1])
+    (ls_b,) = ax.plot([10, 100], [5, 6])
+    extent = SnapExtent(ls_a, ls_b, mode=ExtentMode.INTERSECTION)
+    dr = DragRect(ax=ax, position=20, width=10, snap_to=extent)
+
+    drag(ax, (25, 3), (-4, 3))
+    assert dr.bounds == (10, 20)
+
+
+# Fixed windows are dragged by their face & flexible windows by their left edge
+HELPER_CASES = (
+    (fixed_window, 2.5),
+    (flexible_window, 2),
+)
+
+
+@pytest.mark.parametrize(("helper", "click_x"), HELPER_CASES)
+def test_helper_disjoint_y_overlays(
+    monkeypatch: pytest.MonkeyPatch, helper: t.Callable, click_x: float
+) -> None:
+    x_data = np.linspace(0, 10, 101)
+    y_data = np.sin(x_data)
+
+    # Drag the window's left edge past the start of the overlay, which begins at x = 1
+    monkeypatch.setattr(plt, "show", lambda: drag(plt.gca(), (click_x, 0), (-0.4, 0)))
+    bounds = helper(
+        x_data.tolist(),
+        y_data.tolist(),
+        2,
+        1,
+        overlays=[(x_data[10:].tolist(), (y_data[10:] + 5).tolist())],
+        extent_mode=ExtentMode.INTERSECTION,
+    )
+    plt.close()
+
+    assert bounds[0] == pytest.approx(1)
+
+
+def test_dragrect_outside_intersection_raises(plotobj: PLOTOBJ_T) -> None:
+    _, ax = plotobj
+    extent = SnapExtent(([0, 50], [0, 1]), ([10, 100], [0, 1]), mode=ExtentMode.INTERSECTION)
+
+    with pytest.raises(ValueError, match="bounds"):
+        DragRect(ax=ax, position=5, width=10, snap_to=extent)
+
+
+def test_horizontal_dragline_multi_snapto(plotobj: PLOTOBJ_T) -> None:
+    _, ax = plotobj
+    ax.set_ylim((-10, 10))
+    dl = DragLine(ax=ax, position=0, orientation=Orientation.HORIZONTAL, snap_to=[LINE_A, SERIES_B])
+
+    drag(ax, (0.5, 0), (0.5, -8))
+    assert dl.location == -5
+
+
+def test_flexrect_edges_share_extent(plotobj: PLOTOBJ_T) -> None:
+    _, ax = plotobj
+    fr = FlexibleRect(ax=ax, position=5, width=2, snap_to=[LINE_A, SERIES_B])
+
+    left, right = fr.edges
+    assert left.snap_to is not None
+    assert left.snap_to is right.snap_to
+
+
+def test_as_snap_extent_array_pair() -> None:
+    x_data, y_data = SERIES_B
+    extent = as_snap_extent((x_data, y_data))
+    assert extent is not None
+    assert extent.members == ((x_data, y_data),)
+
+    lists = as_snap_extent(([0, 5], [1, 2]))
+    assert lists is not None
+    np.testing.assert_array_equal(lists.x_extent, (0, 5))
+
+    # Sequences of pairs remain separate members
+    multi = as_snap_extent([SERIES_B, ([0, 30], [0, 1])])
+    assert multi is not None
+    assert len(multi.members) == 2
+
+
+INVALID_MEMBER_CASES = (
+    ([1, 2, 3],),
+    ([([0, 1], [0, 1], [0, 1])],),
+    ((np.arange(3), [[0, 1], [2, 3]]),),
+)
+
+
+@pytest.mark.parametrize(("snap_to",), INVALID_MEMBER_CASES)
+def test_invalid_member_raises(snap_to: t.Any) -> None:
+    with pytest.raises(ValueError, match="pair of arrays"):
+        as_snap_extent(snap_to)
+
+
+def test_dragrect_array_pair_snapto(plotobj: PLOTOBJ_T) -> None:
+    _, ax = plotobj
+    x_data, y_data = np.array([0, 50, 100]), np.array([0, 1, 0])
+    ax.plot(x_data, y_data)
+    dr = DragRect(ax=ax, position=20, width=10, snap_to=(x_data, y_data))
+
+    drag(ax, (25, 0.5), (104, 0.5))
+    assert dr.bounds == (90, 100)
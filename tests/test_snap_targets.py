@@ -0,0 +1,128 @@
+import numpy as np
+import pytest
+from matplotlib.lines import Line2D
+
+from matplotlib_window.base import DragLine, DragRect, FlexibleRect, Orientation, SnapTargets
+from tests.conftest import PLOTOBJ_T
+from tests.helpers import drag
+
+
+def test_snap_targets_sorted_finite() -> None:
+    st = SnapTargets([3, np.nan, 1, 2, 1, np.inf])
+    np.testing.assert_array_equal(st.positions, [1, 2, 3])
+
+
+def test_snap_targets_empty_raises() -> None:
+    with pytest.raises(ValueError, match="empty"):
+        SnapTargets([np.nan])
+
+
+def test_snap_targets_negative_tolerance_raises() -> None:
+    with pytest.raises(ValueError, match="non-negative"):
+        SnapTargets([1], tolerance=-1)
+
+
+NEAREST_TEST_CASES = (
+    (-5, 0),
+    (0, 0),
+    (2.4, 0),
+    (2.6, 5),
+    (9, 10),
+    (15, 10),
+)
+
+
+@pytest.mark.parametrize(("query", "truth_nearest"), NEAREST_TEST_CASES)
+def test_snap_targets_nearest(query: float, truth_nearest: float) -> None:
+    st = SnapTargets([0, 5, 10])
+    assert st.nearest(query) == truth_nearest
+
+
+def test_snap_targets_from_peaks() -> None:
+    x = np.arange(7)
+    y = np.array([0, 2, 1, 1, 3, 3, 0])
+    st = SnapTargets.from_peaks(x, y)
+    np.testing.assert_array_equal(st.positions, [1, 4])
+
+
+def test_snap_targets_from_crossings() -> None:
+    x = np.arange(5)
+    y = np.array([-1, 1, 3, 1, -3])
+    st = SnapTargets.from_crossings(x, y)
+    np.testing.assert_allclose(st.positions, [0.5, 3.25])
+
+    st = SnapTargets.from_crossings(x, y, threshold=2)
+    np.testing.assert_allclose(st.positions, [1.5, 2.5])
+
+
+def test_find_snap_tolerance(plotobj: PLOTOBJ_T) -> None:
+    _, ax = plotobj
+    ax.set(xlim=(0, 100), ylim=(0, 100))
+    st = SnapTargets([50], tolerance=5)
+
+    px_per_unit = ax.transData.transform((1, 0))[0] - ax.transData.transform((0, 0))[0]
+    near = 50 + 4 / px_per_unit
+    far = 50 + 6 / px_per_unit
+
+    snapped = st.find_snap(ax, near)
+    assert snapped is not None
+    assert snapped.position == 50
+    assert snapped.distance == pytest.approx(4)
+
+    assert st.find_snap(ax, far) is None
+
+
+def test_find_snap_horizontal(plotobj: PLOTOBJ_T) -> None:
+    _, ax = plotobj
+    ax.set(xlim=(0, 100), ylim=(0, 100))
+    st = SnapTargets([50])
+
+    snapped = st.find_snap(ax, 50.5, orientation=Orientation.HORIZONTAL)
+    assert snapped is not None
+    assert snapped.position == 50
+
+
+def test_dragline_snaps_to_target(plotobj: PLOTOBJ_T) -> None:
+    _, ax = plotobj
+    ax.set(xlim=(0, 100), ylim=(0, 100))
+    dl = DragLine(ax=ax, position=10, snap_targets=SnapTargets([50, 80]))
+
+    drag(ax, (10, 50), (51, 50))
+    assert dl.location == 50
+
+    drag(ax, (50, 50), (65, 50))
+    assert dl.location == pytest.approx(65)
+
+
+def test_dragline_snap_clamped_to_data(plotobj: PLOTOBJ_T) -> None:
+    _, ax = plotobj
+    ax.set(xlim=(0, 100), ylim=(0, 100))
+    data = Line2D(xdata=np.array([0, 60]), ydata=np.array([0, 1]))
+    dl = DragLine(ax=ax, position=10, snap_to=data, snap_targets=SnapTargets([61]))
+
+    drag(ax, (10, 50), (60.5, 50))
+    assert dl.location == 60
+
+
+def test_dragrect_snaps_closest_edge(plotobj: PLOTOBJ_T) -> None:
+    _, ax = plotobj
+    ax.set(xlim=(0, 100), ylim=(0, 100))
+    st = SnapTargets([40.5, 51], tolerance=30)
+    dr = DragRect(ax=ax, position=10, width=10, snap_targets=st)
+
+    # Left edge lands 0.5 from a target, right edge lands 1 from a target
+    drag(ax, (15, 50), (45, 50))
+    assert dr.bounds == pytest.approx((40.5, 50.5))
+
+    # Left edge lands 3.2 from a target, right edge lands 2.7 from a target
+    drag(ax, (45, 50), (48.2, 50))
+    assert dr.bounds == pytest.approx((41, 51))
+
+
+def test_flexrect_edges_snap(plotobj: PLOTOBJ_T) -> None:
+    _, ax = plotobj
+    ax.set(xlim=(0, 100), ylim=(0, 100))
+    fr = FlexibleRect(ax=ax, position=10, width=10, snap_targets=SnapTargets([30]))
+
+    drag(ax, (20, 50), (30.5, 50))
+    assert fr.bounds == (10, 30)